@@ -0,0 +1,177 @@
+# ============================================================
+# 0. 목적/개요
+# - 저장된 HTML 페이지(fixtures/ 또는 --corpus)로 파서 성능을 오프라인 측정한다.
+# - 파서별 pages/sec, 지연시간 p50/p99(ms), 최대 메모리(KB)를 출력한다.
+# - --baseline으로 이전 결과(JSON)와 비교해 p50이 허용치 이상 느려지면 exit 1.
+#
+# 실행(01_crawling 에서):
+#   python bench/bench_parsers.py
+#   python bench/bench_parsers.py --backend html.parser --json bench_result.json
+#   python bench/bench_parsers.py --baseline bench_result.json --max-regression 0.2
+# ============================================================
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# 01_crawling을 import 경로에 추가(스크립트로 직접 실행할 때)
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import parsers.html as html_backend  # noqa: E402
+from parsers.html import make_soup, DETAIL_STRAINER  # noqa: E402
+from crawl_market_list import parse_list_page, parse_detail_soup  # noqa: E402
+from catalog_discover import parse_import_makers_only_has_stock, parse_makers, parse_maker_catalog  # noqa: E402
+from bobe_car import BobeCar  # noqa: E402
+
+FIXTURE_DIR = Path(__file__).resolve().parent / "fixtures"
+
+
+# ============================================================
+# 1. 측정 대상
+# - 이름 -> (fixture 파일명 접두어, HTML 문자열을 받아 파싱하는 함수)
+# - soup 생성 비용까지 포함해 "페이지 1장 파싱" 단위로 측정한다.
+# ============================================================
+
+PARSERS = {
+    "parse_list_page": (
+        "list_",
+        lambda html: parse_list_page(make_soup(html)),
+    ),
+    "parse_detail_page": (
+        "detail_",
+        lambda html: parse_detail_soup(make_soup(html, parse_only=DETAIL_STRAINER)),
+    ),
+    "parse_import_makers_only_has_stock": (
+        "market_import",
+        lambda html: parse_import_makers_only_has_stock(make_soup(html)),
+    ),
+    "discover_catalog.parse_makers": (
+        "market_domestic",
+        lambda html: parse_makers(make_soup(html), "K"),
+    ),
+    "discover_catalog.parse_maker_catalog": (
+        "market_maker",
+        lambda html: parse_maker_catalog(make_soup(html), "K", 0, ""),
+    ),
+    "BobeCar.get_term_by_grade": (
+        "terms_",
+        lambda html: BobeCar.parse_terms(make_soup(html)),
+    ),
+}
+
+
+def load_pages(dirs: list[Path], prefix: str) -> list[str]:
+    pages = []
+    for d in dirs:
+        for path in sorted(d.glob(f"{prefix}*.html")):
+            pages.append(path.read_text(encoding="utf-8"))
+    return pages
+
+
+def percentile(sorted_vals: list[float], q: float) -> float:
+    # 최근접 순위(nearest-rank) 방식 백분위수
+    idx = min(len(sorted_vals) - 1, max(0, round(q * len(sorted_vals)) - 1))
+    return sorted_vals[idx]
+
+
+# ============================================================
+# 2. 측정
+# - 1회 워밍업 후 iterations회 반복하며 페이지별 지연시간 기록
+# - 메모리는 tracemalloc이 측정을 느리게 하므로 별도 1회 실행으로 측정
+# ============================================================
+
+def bench_one(fn, pages: list[str], iterations: int) -> dict:
+    for html in pages:
+        fn(html)
+
+    latencies = []
+    for _ in range(iterations):
+        for html in pages:
+            t0 = time.perf_counter()
+            fn(html)
+            latencies.append(time.perf_counter() - t0)
+
+    tracemalloc.start()
+    for html in pages:
+        fn(html)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        "pages": len(latencies),
+        "pages_per_sec": len(latencies) / sum(latencies),
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "peak_kb": peak / 1024,
+    }
+
+
+def compare(results: dict, baseline: dict, max_regression: float) -> list[str]:
+    # 기준 대비 p50이 (1 + max_regression)배를 넘은 파서 목록
+    failed = []
+    for name, r in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        ratio = r["p50_ms"] / base["p50_ms"]
+        if ratio > 1 + max_regression:
+            failed.append(f"{name}: p50 {base['p50_ms']:.3f}ms -> {r['p50_ms']:.3f}ms (x{ratio:.2f})")
+    return failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="크롤러 HTML 파서 오프라인 벤치마크")
+    parser.add_argument("--corpus", type=Path, action="append", default=[], help="추가 HTML 디렉터리(파일명 접두어로 파서 구분)")
+    parser.add_argument("--iterations", type=int, default=50, help="페이지당 반복 횟수")
+    parser.add_argument("--backend", default=None, help="파서 백엔드 강제 지정(lxml / html.parser)")
+    parser.add_argument("--only", action="append", default=[], help="측정할 파서 이름(여러 번 지정 가능)")
+    parser.add_argument("--json", type=Path, default=None, help="결과를 JSON으로 저장")
+    parser.add_argument("--baseline", type=Path, default=None, help="비교할 이전 결과 JSON")
+    parser.add_argument("--max-regression", type=float, default=0.2, help="허용 p50 증가율(기본 0.2 = 20%%)")
+    args = parser.parse_args()
+
+    if args.backend:
+        html_backend.PARSER = args.backend
+
+    dirs = [FIXTURE_DIR, *args.corpus]
+    print(f"[BENCH] backend={html_backend.PARSER} iterations={args.iterations}")
+    print(f"{'parser':<40} {'pages':>6} {'pages/s':>9} {'p50(ms)':>9} {'p99(ms)':>9} {'peak(KB)':>9}")
+
+    results = {}
+    for name, (prefix, fn) in PARSERS.items():
+        if args.only and name not in args.only:
+            continue
+
+        pages = load_pages(dirs, prefix)
+        if not pages:
+            print(f"[WARN] no fixture for {name} ({prefix}*.html)")
+            continue
+
+        r = bench_one(fn, pages, args.iterations)
+        results[name] = r
+        print(
+            f"{name:<40} {r['pages']:>6} {r['pages_per_sec']:>9.1f} "
+            f"{r['p50_ms']:>9.3f} {r['p99_ms']:>9.3f} {r['peak_kb']:>9.1f}"
+        )
+
+    if args.json:
+        args.json.write_text(json.dumps({"backend": html_backend.PARSER, "results": results}, indent=2), encoding="utf-8")
+        print("[BENCH] saved:", args.json)
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))["results"]
+        failed = compare(results, baseline, args.max_regression)
+        if failed:
+            for line in failed:
+                print("[REGRESSION]", line)
+            sys.exit(1)
+        print("[BENCH] no regression against", args.baseline)
+
+
+if __name__ == "__main__":
+    main()
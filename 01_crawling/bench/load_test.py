@@ -0,0 +1,217 @@
+# ============================================================
+# 0. 목적/개요
+# - 로컬 mock 서버(bench/mock_server.py)를 띄우고 실제 크롤러를 그대로 돌려
+#   전체 처리량(pages/sec)을 측정한다(네트워크/실사이트 없이 크롤 엔진 튜닝용).
+#   1) reference : BobeCar 기준정보 파이프라인(reference_pipeline.crawl_reference)
+#   2) listings  : run_all.main(카탈로그 → 목록 → 상세, --processes N이면 샤드 하위 프로세스)
+# - mock 서버는 별도 프로세스로 실행한다(서버 스레드가 크롤러와 GIL을 다투지 않도록).
+# - 크롤러는 BOBAEDREAM_BASE / CRAWL_DATA_DIR 환경변수로 mock 서버와 임시 폴더를 쓰므로
+#   06_data와 01_crawling의 결과/캐시 파일은 건드리지 않는다.
+# - 단계별 요청 수/소요 시간/pages/sec와 서버 쪽 집계(주입한 429/503 등)를 출력한다.
+#
+# 실행(01_crawling 에서):
+#   python bench/load_test.py
+#   python bench/load_test.py --listings 40 --latency-ms 30 --error-rate 0.01
+#   python bench/load_test.py --max-rate 200 --phase listings --processes 4 --json load_result.json
+# ============================================================
+
+import argparse
+import csv
+import json
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+
+# 01_crawling을 import 경로에 추가(스크립트로 직접 실행할 때)
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+MOCK_SERVER = Path(__file__).resolve().parent / "mock_server.py"
+
+
+# ============================================================
+# 1. mock 서버 실행
+# ============================================================
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(server_args: list[str], timeout: float = 30.0) -> tuple[subprocess.Popen, str]:
+    """
+    mock 서버를 하위 프로세스로 띄우고 /__stats가 응답할 때까지 기다린다.
+
+    :return: (프로세스, 베이스 URL)
+    """
+    port = _free_port()
+    base = f"http://127.0.0.1:{port}"
+    proc = subprocess.Popen([sys.executable, str(MOCK_SERVER), "--port", str(port), *server_args])
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"mock 서버가 종료되었습니다(exit {proc.returncode})")
+        try:
+            server_stats(base)
+            return proc, base
+        except OSError:
+            time.sleep(0.1)
+
+    proc.terminate()
+    raise TimeoutError(f"mock 서버가 {timeout:.0f}초 안에 응답하지 않습니다: {base}")
+
+
+def server_stats(base: str) -> dict:
+    with urllib.request.urlopen(f"{base}/__stats", timeout=5) as r:
+        return json.load(r)
+
+
+# ============================================================
+# 2. 단계별 측정
+# - pages = 크롤러가 받은 HTTP 응답 수(METRICS http_requests_total, 하위 프로세스 실행이면 서버 집계)
+# ============================================================
+
+def _client_requests() -> int:
+    from common.metrics import METRICS
+
+    rows = METRICS.to_dict()["counters"].get("http_requests_total", [])
+    return int(sum(r["value"] for r in rows))
+
+
+def _csv_rows(path: Path) -> int:
+    if not path.exists():
+        return 0
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        return max(0, sum(1 for _ in csv.reader(f)) - 1)
+
+
+def run_phase(name: str, fn, base: str, in_process: bool = True) -> dict:
+    before_client = _client_requests()
+    before_server = server_stats(base)
+
+    t0 = time.perf_counter()
+    rows = fn()
+    elapsed = time.perf_counter() - t0
+
+    after_server = server_stats(base)
+    served = {
+        k: after_server.get(k, 0) - before_server.get(k, 0)
+        for k in after_server
+        if k != "elapsed_sec" and after_server.get(k, 0) != before_server.get(k, 0)
+    }
+    pages = _client_requests() - before_client if in_process else served.get("requests_total", 0)
+
+    return {
+        "phase": name,
+        "elapsed_sec": round(elapsed, 3),
+        "pages": pages,
+        "pages_per_sec": round(pages / elapsed, 2) if elapsed else 0.0,
+        "rows": rows,
+        "server": served,
+    }
+
+
+def main(args: argparse.Namespace) -> list[dict]:
+    workdir = Path(args.workdir or tempfile.mkdtemp(prefix="bobae_load_"))
+    workdir.mkdir(parents=True, exist_ok=True)
+
+    server_args = [
+        "--scale", str(args.scale),
+        "--latency-ms", str(args.latency_ms),
+        "--jitter-ms", str(args.jitter_ms),
+        "--error-rate", str(args.error_rate),
+        "--max-view-size", str(args.max_view_size),
+        "--pad-kb", str(args.pad_kb),
+        *(["--listings", str(args.listings)] if args.listings is not None else []),
+    ]
+    proc, base = start_server(server_args)
+
+    # config/common.paths는 import 시점에 환경변수를 읽으므로 크롤러 모듈 import 전에 지정
+    os.environ["BOBAEDREAM_BASE"] = base
+    os.environ["CRAWL_DATA_DIR"] = str(workdir / "data")
+    os.environ.setdefault("CRAWL_LOG_LEVEL", args.log_level)
+    os.chdir(workdir)
+
+    try:
+        import run_all
+        from bobe_car import BobeCar
+        from common.http import LIMITER
+        from config import OUT_CSV
+        from reference_pipeline import crawl_reference
+
+        # 요청 속도 상한을 풀어 크롤 엔진 자체의 처리량을 본다(기본은 config 값 그대로)
+        if args.rate is not None:
+            LIMITER.initial_rate = args.rate
+        if args.max_rate is not None:
+            LIMITER.max_rate = args.max_rate
+
+        results = []
+        if args.phase in ("all", "reference"):
+            results.append(run_phase(
+                "reference",
+                lambda: crawl_reference(BobeCar(), origins=tuple(args.origin))["count"],
+                base,
+            ))
+
+        if args.phase in ("all", "listings"):
+            def _listings() -> int:
+                if args.processes:
+                    run_all.run_processes(args.processes, [])
+                else:
+                    run_all.main()
+                return _csv_rows(workdir / OUT_CSV)
+
+            results.append(run_phase("listings", _listings, base, in_process=not args.processes))
+
+        return results
+
+    finally:
+        proc.terminate()
+        proc.wait()
+        if not args.keep and not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="mock 서버 대상 크롤러 부하 테스트(end-to-end pages/sec)")
+    parser.add_argument("--phase", choices=["all", "reference", "listings"], default="all")
+    parser.add_argument("--origin", action="append", choices=["K", "I"], default=None, help="기준정보 차량 구분(기본 K+I)")
+    parser.add_argument("--processes", type=int, default=None, help="listings 단계를 샤드 N개 하위 프로세스로 실행")
+    parser.add_argument("--rate", type=float, default=None, help="엔드포인트당 시작 요청 속도(기본 config.RATE_PER_SEC)")
+    parser.add_argument("--max-rate", type=float, default=None, help="엔드포인트당 최대 요청 속도(기본 config.RATE_MAX_PER_SEC)")
+    parser.add_argument("--workdir", default=None, help="결과/캐시를 남길 폴더(기본: 임시 폴더, 끝나면 삭제)")
+    parser.add_argument("--keep", action="store_true", help="임시 폴더를 지우지 않음")
+    parser.add_argument("--log-level", default="WARNING", help="크롤러 로그 레벨(기본 WARNING)")
+    parser.add_argument("--json", default=None, help="결과를 JSON 파일로 저장")
+
+    server = parser.add_argument_group("mock 서버")
+    server.add_argument("--listings", type=int, default=None, help="세부모델별 매물 수(기본: generation_volume * --scale)")
+    server.add_argument("--scale", type=float, default=1.0)
+    server.add_argument("--latency-ms", type=float, default=0.0)
+    server.add_argument("--jitter-ms", type=float, default=0.0)
+    server.add_argument("--error-rate", type=float, default=0.0)
+    server.add_argument("--max-view-size", type=int, default=50)
+    server.add_argument("--pad-kb", type=int, default=0)
+    args = parser.parse_args()
+    args.origin = args.origin or ["K", "I"]
+    json_path = Path(args.json).resolve() if args.json else None
+
+    results = main(args)
+
+    print(f"{'phase':<12}{'pages':>10}{'sec':>10}{'pages/s':>10}{'rows':>10}  server")
+    for r in results:
+        print(
+            f"{r['phase']:<12}{r['pages']:>10}{r['elapsed_sec']:>10.1f}{r['pages_per_sec']:>10.1f}{r['rows']:>10}  "
+            + " ".join(f"{k}={v}" for k, v in sorted(r["server"].items()) if k != "bytes_sent")
+        )
+
+    if json_path:
+        json_path.write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8")
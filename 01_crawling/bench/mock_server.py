@@ -0,0 +1,462 @@
+# ============================================================
+# 0. 목적/개요
+# - 보배드림 대신 로컬에서 응답하는 mock HTTP 서버(오프라인 처리량/동시성/백오프 측정용)
+# - 06_data/reference/*.csv(제조사/모델/세대/등급·트림)로 가상 카탈로그를 만들고,
+#   크롤러가 요청하는 페이지를 각 파서가 기대하는 DOM 구조로 생성한다.
+#   - /dealguide/market_price_new.php : 제조사 목록 / 제조사별 모델·세부모델 (catalog_discover)
+#   - /mycar/mycar_list.php           : 매물 목록 (run_all)
+#                                       제조사 / 모델 / 세대 / 등급 / 트림 (BobeCar)
+#   - /mycar/mycar_view.php?no=       : 매물 상세
+#   - /__stats                        : 서버 쪽 처리 건수(JSON, load_test.py가 조회)
+# - 세부모델별 매물 수, 응답 지연, 오류(429/503) 비율, 최대 view_size를 옵션으로 조절한다.
+# - 매물 내용은 no= 값으로 시드를 고정해 같은 요청에는 항상 같은 페이지를 돌려준다.
+#
+# 실행(01_crawling 에서):
+#   python bench/mock_server.py --port 8765
+#   python bench/mock_server.py --port 8765 --latency-ms 50 --error-rate 0.02 --listings 30
+#   BOBAEDREAM_BASE=http://127.0.0.1:8765 CRAWL_DATA_DIR=/tmp/mock_data python run_all.py
+# ============================================================
+
+import argparse
+import csv
+import json
+import math
+import random
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+REFERENCE_DIR = Path(__file__).resolve().parents[2] / "06_data" / "reference"
+
+# 매물 번호(no=) = 세대 코드 * LISTING_STRIDE + 세대 안 순번
+LISTING_STRIDE = 100_000
+
+FUELS = ("가솔린", "디젤", "LPG", "하이브리드", "전기")
+COLORS = ("흰색", "검정색", "쥐색", "은색", "파랑색")
+
+
+# ============================================================
+# 1. 가상 카탈로그
+# - 제조사 → 모델 → 세대(세부모델) → 등급 → 트림 구조를 CSV에서 읽는다.
+# - 세대별 매물 수 = --listings(고정) 또는 generation_volume * --scale
+#   (제조사/모델 매물 수는 하위 세대 매물 수의 합)
+# ============================================================
+
+def _int(v: str) -> int | None:
+    return int(float(v)) if v not in ("", None) else None
+
+
+def _read_csv(path: Path) -> list[dict]:
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+class MockCatalog:
+    def __init__(self, reference_dir: Path = REFERENCE_DIR, listings: int | None = None, scale: float = 1.0):
+        self.makers: dict[str, list[tuple[int, str]]] = {}
+        self.models: dict[tuple[str, int], list[tuple[int, str]]] = {}
+        self.generations: dict[tuple[str, int, int], list[tuple[int, str]]] = {}
+        # generation_code -> [(grade_code, grade_name, grade_volume, [(term_code, term_name, term_volume)])]
+        self.grades: dict[int, list[tuple]] = {}
+        # generation_code -> {"origin", "maker", "model", "title", "count"}
+        self.gen_info: dict[int, dict] = {}
+        self.counts: Counter = Counter()
+
+        maker_names = {}
+        for r in _read_csv(reference_dir / "makers.csv"):
+            key = (r["origin"], int(r["maker_code"]))
+            maker_names[key] = r["maker_name"]
+            self.makers.setdefault(r["origin"], []).append((key[1], r["maker_name"]))
+
+        for r in _read_csv(reference_dir / "models.csv"):
+            key = (r["origin"], int(r["maker_code"]))
+            self.models.setdefault(key, []).append((int(r["model_code"]), r["model_name"]))
+
+        for r in _read_csv(reference_dir / "generations.csv"):
+            origin, maker, model = r["origin"], int(r["maker_code"]), int(r["model_code"])
+            gen = int(r["generation_code"])
+            count = listings if listings is not None else math.ceil(int(r["generation_volume"]) * scale)
+            self.generations.setdefault((origin, maker, model), []).append((gen, r["generation_name"]))
+            self.gen_info[gen] = {
+                "origin": origin,
+                "maker": maker,
+                "model": model,
+                "title": f"{maker_names.get((origin, maker), '')} {r['generation_name']}",
+                "count": count,
+            }
+            # 제조사/모델 매물 수는 하위 세대의 합
+            self.counts[(origin, maker)] += count
+            self.counts[(origin, maker, model)] += count
+
+        by_grade: dict[tuple[int, int], tuple] = {}
+        for r in _read_csv(reference_dir / "terms.csv"):
+            gen, grade = int(r["generation_code"]), int(r["grade_code"])
+            if (gen, grade) not in by_grade:
+                by_grade[(gen, grade)] = (grade, r["grade_name"], _int(r["grade_volume"]) or 0, [])
+                self.grades.setdefault(gen, []).append(by_grade[(gen, grade)])
+            if r["term_code"]:
+                by_grade[(gen, grade)][3].append((_int(r["term_code"]), r["term_name"] or "-", _int(r["term_volume"]) or 0))
+
+    def total_listings(self) -> int:
+        return sum(g["count"] for g in self.gen_info.values())
+
+    def listing(self, no: int) -> dict | None:
+        """
+        매물 1건(no=)의 내용. 같은 no면 항상 같은 값.
+        """
+        gen, idx = divmod(no, LISTING_STRIDE)
+        info = self.gen_info.get(gen)
+        if info is None or idx >= info["count"]:
+            return None
+
+        rng = random.Random(no)
+        year = rng.randint(2010, 2025)
+        return {
+            "no": no,
+            "gubun": info["origin"],
+            "title": info["title"],
+            "lease": rng.random() < 0.1,
+            "price": rng.randint(300, 9000),
+            "year": year,
+            "month": rng.randint(1, 12),
+            "day": rng.randint(1, 28),
+            "km": rng.randint(1_000, 250_000),
+            "fuel": rng.choice(FUELS),
+            "color": rng.choice(COLORS),
+            "cc": rng.choice((998, 1598, 1999, 2497, 3342)),
+        }
+
+
+# ============================================================
+# 2. 페이지 생성
+# - 파서가 보는 구조만 fixtures/*.html과 같게 만들고, 나머지 DOM은 --pad-kb 만큼 채운다.
+# - BobeCar는 개수(span.t2)를 int()로 바로 읽으므로 mycar_list 기준정보 페이지는 콤마 없이 쓴다.
+# ============================================================
+
+def _page(body: str, pad: str = "") -> bytes:
+    return (
+        '<!DOCTYPE html>\n<html lang="ko">\n<head><meta charset="utf-8"><title>보배드림</title></head>\n'
+        f'<body>\n<div id="container">\n{body}\n</div>\n{pad}</body>\n</html>\n'
+    ).encode("utf-8")
+
+
+def _market_makers(cat: MockCatalog, gubun: str) -> str:
+    dds = "".join(
+        f'<dd><button type="button" onclick="car_depth_lite(\'{code}\', 1, \'{gubun}\')">'
+        f'<span class="t1">{name}</span><span class="t2">{cat.counts[(gubun, code)]:,}</span></button></dd>\n'
+        for code, name in cat.makers.get(gubun, [])
+    )
+    # 국산차는 area-maker, 수입차는 탭 목록(parse_import_makers_only_has_stock)
+    wrapper = "area-maker" if gubun == "K" else "list-comm js-tabs"
+    return f'<div class="{wrapper}"><dl class="group-list">\n{dds}</dl></div>'
+
+
+def _market_maker(cat: MockCatalog, gubun: str, maker: int) -> str:
+    models = cat.models.get((gubun, maker), [])
+    model_dds = "".join(
+        f'<dd><button type="button" onclick="modelSel({code}, \'{gubun}\')">'
+        f'<span class="t1">{name}</span><span class="t2">{cat.counts[(gubun, maker, code)]:,}</span></button></dd>\n'
+        for code, name in models
+    )
+    detail_dds = "".join(
+        f'<dd class="c_model_{model} item"><input type="checkbox" name="model_no[]" id="m{gen}" value="{gen}">'
+        f'<label for="m{gen}">{name}</label><span class="t2">{cat.gen_info[gen]["count"]:,}</span></dd>\n'
+        for model, _ in models
+        for gen, name in cat.generations.get((gubun, maker, model), [])
+    )
+    return (
+        f'<div class="area-model"><dl class="group-list">\n{model_dds}</dl></div>\n'
+        f'<div class="area-detail"><dl class="group-list">\n{detail_dds}</dl></div>'
+    )
+
+
+def _ref_makers(cat: MockCatalog, gubun: str) -> str:
+    dds = "".join(
+        f'<dd><button type="button" onclick="car_depth_lite(\'{code}\', 1, \'{gubun}\')">'
+        f'<span class="t1">{name}</span><span class="t2">{cat.counts[(gubun, code)]}</span></button></dd>\n'
+        for code, name in cat.makers.get(gubun, [])
+    )
+    return f'<div class="area-maker"><dl class="group-list">\n{dds}</dl></div>'
+
+
+def _ref_models(cat: MockCatalog, gubun: str, maker: int) -> str:
+    dds = "".join(
+        f'<dd><button type="button" onclick="modelSel({code}, \'{gubun}\')">'
+        f'<span class="t1">{name}</span><span class="t2">{cat.counts[(gubun, maker, code)]}</span></button></dd>\n'
+        for code, name in cat.models.get((gubun, maker), [])
+    )
+    return f'<div class="area-model"><dl class="group-list">\n{dds}</dl></div>'
+
+
+def _ref_generations(cat: MockCatalog, gubun: str, maker: int, model: int) -> str:
+    dds = "".join(
+        f'<dd class="c_model_{model} item"><input type="checkbox" name="model_no[]" id="m{gen}" value="{gen}">'
+        f'<label for="m{gen}">{name}</label><span class="t2">{cat.gen_info[gen]["count"]}</span></dd>\n'
+        for gen, name in cat.generations.get((gubun, maker, model), [])
+    )
+    return f'<div class="area-detail"><dl class="group-list">\n{dds}</dl></div>'
+
+
+def _ref_grades(cat: MockCatalog, gen: int, level_no: int | None) -> str:
+    # level_no[]를 지정한 등급만 트림 목록(sub-list)을 펼친다(parse_grades는 하위 dd까지 읽음)
+    dds = []
+    for code, name, volume, terms in cat.grades.get(gen, []):
+        sub = ""
+        if code == level_no:
+            sub = '<dl class="sub-list">' + "".join(
+                f'<dd class="sub"><input type="checkbox" name="level2_no[]" id="t{t}" value="{t}">'
+                f'<label for="t{t}">{t_name}</label><span class="t2">({t_volume})</span></dd>'
+                for t, t_name, t_volume in terms
+            ) + "</dl>"
+        dds.append(
+            f'<dd><input type="checkbox" name="level_no[]" id="g{code}" value="{code}">'
+            f'<label for="g{code}">{name}</label><span class="t2">{volume}</span>{sub}</dd>\n'
+        )
+    return f'<div class="area-grade"><dl class="group-list">\n{"".join(dds)}</dl></div>'
+
+
+def _list_page(cat: MockCatalog, q: dict, view_size: int) -> str:
+    gen = int(q["model_no[]"])
+    info = cat.gen_info.get(gen)
+    count = info["count"] if info else 0
+    page = max(1, int(q.get("page", 1)))
+    last = max(1, math.ceil(count / view_size))
+
+    lis = []
+    for idx in range((page - 1) * view_size, min(page * view_size, count)):
+        it = cat.listing(gen * LISTING_STRIDE + idx)
+        href = f"/mycar/mycar_view.php?no={it['no']}&amp;gubun={it['gubun']}"
+        title = it["title"] + (" 렌트승계" if it["lease"] else "")
+        lis.append(
+            f'<li class="product-item">\n'
+            f'  <div class="mode-cell thumb"><a href="{href}"><img src="/img/{it["no"]}.jpg" alt=""></a></div>\n'
+            f'  <div class="mode-cell title"><p class="tit"><a href="{href}">{title}</a></p></div>\n'
+            f'  <div class="mode-cell year"><span class="text">{it["year"] % 100:02d}/{it["month"]:02d}</span></div>\n'
+            f'  <div class="mode-cell km"><span class="text">{it["km"]:,}km</span></div>\n'
+            f'  <div class="mode-cell price"><b>{it["price"]:,}</b>만원</div>\n'
+            f'</li>\n'
+        )
+
+    # 페이징: 현재 페이지가 속한 10페이지 묶음 + 마지막 페이지 링크
+    base = f"/mycar/mycar_list.php?gubun={q.get('gubun', '')}&amp;model_no[]={gen}"
+    start = (page - 1) // 10 * 10 + 1
+    links = "".join(
+        f"<strong>{p}</strong>" if p == page else f'<a href="{base}&amp;page={p}">{p}</a>'
+        for p in range(start, min(start + 9, last) + 1)
+    )
+    if last > start + 9:
+        links += f'<a href="{base}&amp;page={last}" class="last">마지막</a>'
+
+    return (
+        f'<div class="list-body"><ul class="list-car">\n{"".join(lis)}</ul></div>\n'
+        f'<div class="paging"><div class="paging-inner">{links}</div></div>'
+    )
+
+
+def _detail_page(it: dict) -> str:
+    if it["lease"]:
+        price_area = (
+            '<dl><dt>렌트/리스 승계 정보</dt>'
+            f'<dd><span class="stit">인수비용</span><span class="price"><b class="cr">{it["price"]:,}</b>만원</span></dd>'
+            f'<dd><span class="stit">월렌트료</span><span class="price"><b class="cr">{it["price"] // 30}</b>만원</span></dd>'
+            f'<dd><span class="stit">잔여개월</span><span class="price"><b class="cr">{it["no"] % 36 + 1} / 48개월</b></span></dd>'
+            '</dl>'
+        )
+    else:
+        price_area = f'<p class="price"><b class="cr">{it["price"]:,}</b>만원</p>'
+
+    rows = (
+        ("연식", f'{it["year"] % 100:02d}년 {it["month"]:02d}월'),
+        ("주행거리", f'{it["km"]:,}km'),
+        ("연료", it["fuel"]),
+        ("변속기", "오토"),
+        ("색상", it["color"]),
+        ("배기량", f'{it["cc"]:,}cc'),
+    )
+    trs = "".join(f'<tr><th scope="row">{k}</th><td>{v}</td></tr>' for k, v in rows)
+    return (
+        '<div class="section-top"><div class="info-price box">\n'
+        f'<h3 class="tit">{it["title"]}</h3>\n'
+        f'<div class="price-area">{price_area}</div>\n'
+        '<dl class="info-basic"><dt>등록정보</dt>'
+        f'<dd class="txt-bar cg">최초등록 {it["year"] % 100:02d}/{it["month"]:02d}/{it["day"]:02d} | 조회 {it["no"] % 5000:,}</dd></dl>\n'
+        '</div></div>\n'
+        f'<div class="section-spec"><table class="tbl-01"><tbody>{trs}</tbody></table></div>'
+    )
+
+
+# ============================================================
+# 3. HTTP 서버
+# - 요청마다 --latency-ms(+ 0~--jitter-ms) 지연 후 응답
+# - --error-rate 확률로 429/503을 돌려준다(클라이언트 재시도/AIMD 감속 확인용)
+# - keep-alive(HTTP/1.1)로 응답해 클라이언트 연결 풀을 그대로 사용한다.
+# ============================================================
+
+class MockServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+            self,
+            addr: tuple[str, int],
+            catalog: MockCatalog,
+            latency_ms: float = 0.0,
+            jitter_ms: float = 0.0,
+            error_rate: float = 0.0,
+            max_view_size: int = 50,
+            pad_kb: int = 0,
+    ):
+        super().__init__(addr, MockHandler)
+        self.catalog = catalog
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.max_view_size = max_view_size
+        self.pad = "<!-- " + "x" * max(0, pad_kb * 1024 - 9) + " -->\n" if pad_kb else ""
+
+        self.started_at = time.time()
+        self.stats: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def count(self, key: str, n: int = 1) -> None:
+        with self._lock:
+            self.stats[key] += n
+
+    def stats_dict(self) -> dict:
+        with self._lock:
+            return {"elapsed_sec": time.time() - self.started_at, **self.stats}
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # keep-alive에서 헤더/본문이 따로 나가도 지연 ACK(약 40ms)에 걸리지 않도록 TCP_NODELAY
+    disable_nagle_algorithm = True
+    server: MockServer
+
+    def log_message(self, format, *args):
+        # 요청 1건마다 stderr에 찍히는 기본 접근 로그는 끔
+        pass
+
+    def _send(self, status: int, body: bytes, content_type: str = "text/html; charset=utf-8") -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        self.server.count("bytes_sent", len(body))
+
+    def do_GET(self):
+        srv = self.server
+        url = urlparse(self.path)
+        q = {k: v[0] for k, v in parse_qs(url.query).items()}
+
+        if url.path == "/__stats":
+            self._send(200, json.dumps(srv.stats_dict()).encode("utf-8"), "application/json")
+            return
+
+        if srv.latency_ms or srv.jitter_ms:
+            time.sleep((srv.latency_ms + random.uniform(0, srv.jitter_ms)) / 1000)
+
+        if srv.error_rate and random.random() < srv.error_rate:
+            status = random.choice((429, 503))
+            srv.count(f"injected_{status}")
+            self._send(status, b"busy")
+            return
+
+        try:
+            kind, body = self._route(url.path, q)
+        except (KeyError, ValueError):
+            kind, body = None, None
+
+        if body is None:
+            srv.count("not_found")
+            self._send(404, b"not found")
+            return
+
+        srv.count("requests_total")
+        srv.count(f"requests.{kind}")
+        self._send(200, _page(body, srv.pad))
+
+    def _route(self, path: str, q: dict) -> tuple[str | None, str | None]:
+        cat = self.server.catalog
+        gubun = q.get("gubun", "K")
+
+        if path == "/dealguide/market_price_new.php":
+            if "maker_no" in q:
+                return "market_maker", _market_maker(cat, gubun, int(q["maker_no"]))
+            return "market_makers", _market_makers(cat, gubun)
+
+        if path == "/mycar/mycar_list.php":
+            # 매물 목록(page=)과 기준정보 단계별 페이지를 파라미터로 구분
+            if "page" in q:
+                view_size = min(int(q.get("view_size", 20)), self.server.max_view_size)
+                return "list", _list_page(cat, q, view_size)
+            if q.get("dt") == "true":
+                level_no = int(q["level_no[]"]) if "level_no[]" in q else None
+                return ("terms" if level_no else "grades"), _ref_grades(cat, int(q["model_no[]"]), level_no)
+            if "group_no" in q:
+                return "generations", _ref_generations(cat, gubun, int(q["maker_no"]), int(q["group_no"]))
+            if "maker_no" in q:
+                return "models", _ref_models(cat, gubun, int(q["maker_no"]))
+            return "makers", _ref_makers(cat, gubun)
+
+        if path == "/mycar/mycar_view.php":
+            it = cat.listing(int(q["no"]))
+            return "detail", _detail_page(it) if it else None
+
+        return None, None
+
+
+def build_server(
+        host: str = "127.0.0.1",
+        port: int = 0,
+        reference_dir: Path = REFERENCE_DIR,
+        listings: int | None = None,
+        scale: float = 1.0,
+        **options,
+) -> MockServer:
+    """
+    mock 서버를 만든다(serve_forever()는 호출하는 쪽에서).
+
+    :param port: 0이면 빈 포트를 자동 선택(server.server_address[1]로 확인)
+    :param listings: 세대(세부모델)별 매물 수(None이면 generation_volume * scale)
+    :param options: latency_ms, jitter_ms, error_rate, max_view_size, pad_kb
+    """
+    catalog = MockCatalog(reference_dir, listings=listings, scale=scale)
+    return MockServer((host, port), catalog, **options)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="보배드림 mock 서버(오프라인 부하 테스트용)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--reference-dir", type=Path, default=REFERENCE_DIR, help="기준정보 CSV 폴더")
+    parser.add_argument("--listings", type=int, default=None, help="세부모델별 매물 수(기본: generation_volume * --scale)")
+    parser.add_argument("--scale", type=float, default=1.0, help="generation_volume 배율")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="응답 지연(ms)")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="추가 지연 0~N ms(균등분포)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="429/503 응답 비율(0~1)")
+    parser.add_argument("--max-view-size", type=int, default=50, help="목록 페이지 크기 상한")
+    parser.add_argument("--pad-kb", type=int, default=0, help="페이지마다 덧붙일 더미 HTML 크기(KB)")
+    args = parser.parse_args()
+
+    server = build_server(
+        args.host, args.port, args.reference_dir,
+        listings=args.listings,
+        scale=args.scale,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        max_view_size=args.max_view_size,
+        pad_kb=args.pad_kb,
+    )
+    host, port = server.server_address[:2]
+    print(f"mock bobaedream: http://{host}:{port} listings={server.catalog.total_listings()}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -2,20 +2,42 @@
 # 표준 라이브러리 / 외부 라이브러리 import
 # -------------------------------------------------
 import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import time
 from pathlib import Path
 from typing import Dict, Optional, Any, List
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup as bs
+from bs4 import BeautifulSoup
 
 
 # 프로젝트 공통 데이터 저장 경로
-from crawling.common.paths import DATA_DIR
+from common.paths import DATA_DIR
+from common.ref_store import ReferenceStore
+from common.log import get_logger
+
+# 크롤러 공유 HTTP 세션 / HTML 파서 백엔드
+from common.http import http_get
+from parsers.html import make_soup
 
 # 프로젝트 정규식
-from crawling.parsers.regex_patterns import RE_MODEL_CODE, RE_MAKER_CODE, RE_TO_INT, RE_PAGECLICK
+from parsers.regex_patterns import RE_MODEL_CODE, RE_MAKER_CODE, RE_TO_INT
+
+# 크롤링 설정
+from config import TERM_WORKERS, REF_LIST_URL
+
+
+# terms.csv 컬럼 / 중복 제거 기준
+TERM_COLUMNS = [
+    "origin", "maker_code", "model_code", "generation_code",
+    "grade_code", "grade_name", "grade_volume",
+    "term_code", "term_name", "term_volume",
+]
+TERM_DEDUP_KEYS = ["origin", "maker_code", "model_code", "generation_code", "grade_code", "term_code"]
+
+log = get_logger("bobe_car")
 
 
 class BobeCar:
@@ -26,9 +48,13 @@ class BobeCar:
 
     def __init__(self):
         # 제조사/모델 목록 페이지의 공통 베이스 URL
-        self.__BASE_URL = "https://www.bobaedream.co.kr/mycar/mycar_list.php?gubun="
+        self.__BASE_URL = f"{REF_LIST_URL}?gubun="
+
+        # 기준정보 CSV별 append 저장소 (파일명 -> ReferenceStore)
+        self._stores: dict[str, ReferenceStore] = {}
+        self._stores_lock = threading.Lock()
 
-    def fetch_soup(self, url: str) -> BeautifulSoup:
+    def fetch_soup(self, url: str, cache: bool = False) -> BeautifulSoup:
         """
         주어진 URL에 HTTP 요청을 보내 HTML을 가져온 뒤,
         BeautifulSoup 객체로 변환하여 반환합니다.
@@ -38,24 +64,24 @@ class BobeCar:
         발생 시 예외를 발생시킵니다.
 
         :param url: 요청할 페이지 URL
+        :param cache: True면 HTTP 캐시(ETag/Last-Modified + TTL)를 거칩니다.
+                      (제조사/모델/세대 목록처럼 거의 바뀌지 않는 페이지용)
         :return: BeautifulSoup 객체
         """
 
         try:
-            # 페이지 요청 (응답이 없으면 10초 후 타임아웃)
-            response = requests.get(url, timeout=10)
-
+            # 공유 세션으로 페이지 요청 (응답이 없으면 10초 후 타임아웃)
             # HTTP 상태 코드가 4xx / 5xx 인 경우 예외 발생
-            response.raise_for_status()
+            response = http_get(url, timeout=10, cache=cache)
 
             # HTML → BeautifulSoup 변환
             html = response.text
-            soup = BeautifulSoup(html, "html.parser")
+            soup = make_soup(html)
             return soup
 
         except requests.exceptions.RequestException as e:
             # 요청/네트워크/HTTP 오류 로그 출력 후 예외 재전파
-            print(f"[ERROR] Failed to fetch URL: {url} | {e}")
+            log.error("Failed to fetch URL: %s | %s", url, e)
             raise
 
     def standardize_dataframe(
@@ -100,9 +126,21 @@ class BobeCar:
 
         except Exception as e:
             # DataFrame 변환 단계에서 발생한 모든 오류 로그 출력
-            print(f"[ERROR] standardize_dataframe failed: {e}")
+            log.error("standardize_dataframe failed: %s", e)
             raise
 
+    def _get_store(self, filename: str, dedup_keys: list[str], encoding: str) -> ReferenceStore:
+        """
+        파일별 ReferenceStore를 한 번만 만들어 재사용합니다.
+        (기존 CSV는 처음 한 번만 읽어 중복 제거 인덱스를 만듦)
+        """
+        with self._stores_lock:
+            store = self._stores.get(filename)
+            if store is None:
+                store = ReferenceStore(DATA_DIR / filename, dedup_keys, encoding=encoding)
+                self._stores[filename] = store
+            return store
+
     def save_df_to_csv(
             self,
             df: pd.DataFrame,
@@ -114,8 +152,8 @@ class BobeCar:
         DataFrame을 CSV 파일로 저장합니다.
 
         - 기존 CSV 파일이 있으면:
-          기존 데이터 + 새 데이터를 병합한 뒤,
-          dedup_keys 기준으로 중복 제거 후 저장합니다.
+          dedup_keys 기준으로 아직 없는 row만 파일 끝에 덧붙입니다.
+          (기존 데이터가 우선, 파일 전체를 다시 쓰지 않음)
         - 기존 파일이 없으면 새로 생성합니다.
 
         :param df: 저장할 DataFrame
@@ -127,7 +165,7 @@ class BobeCar:
 
         # 저장할 데이터가 없는 경우
         if df is None or df.empty:
-            print("[WARN] DataFrame is empty or None. Skip saving.")
+            log.warning("DataFrame is empty or None. Skip saving.")
             return None
 
         # 파일명에 .csv 확장자가 없으면 자동 추가
@@ -138,51 +176,49 @@ class BobeCar:
         file_path = DATA_DIR / filename
 
         try:
-            # 기존 CSV 파일이 있는 경우
-            if file_path.exists():
-                # 기존 데이터 로드
-                old_df = pd.read_csv(file_path, encoding=encoding)
-
-                # 기존 데이터 + 신규 데이터 병합
-                # 🔹 신규 df 쪽 dtype 먼저 정리
-                int_cols = [
-                    "maker_code", "model_code", "generation_code",
-                    "grade_code", "grade_volume",
-                    "term_code", "term_volume"
-                ]
-
-                for c in int_cols:
-                    if c in df.columns:
-                        df[c] = pd.to_numeric(df[c], errors="coerce").astype("Int64")
-
-                # 그 다음 concat
-                merged_df = pd.concat([old_df, df], ignore_index=True)
-
-                # 중복 제거 기준 컬럼 검증
-                missing = [k for k in dedup_keys if k not in merged_df.columns]
-                if missing:
-                    raise ValueError(f"dedup_keys에 없는 컬럼이 포함됨: {missing}")
-
-                # 중복 제거
-                merged_df = merged_df.drop_duplicates(
-                    subset=dedup_keys,
-                    keep="first"
-                )
-            else:
-                # 기존 파일이 없으면 그대로 사용
-                merged_df = df
-
-            # CSV 파일 저장 (항상 덮어쓰기)
-            merged_df.to_csv(file_path, index=False, encoding=encoding)
-
-            print(f"[INFO] CSV updated: {file_path} (rows={len(merged_df)})")
+            # 🔹 신규 df 쪽 dtype 정리 (123.0 같은 float 표기 방지)
+            int_cols = [
+                "maker_code", "model_code", "generation_code",
+                "grade_code", "grade_volume",
+                "term_code", "term_volume"
+            ]
+
+            df = df.copy()
+            for c in int_cols:
+                if c in df.columns:
+                    df[c] = pd.to_numeric(df[c], errors="coerce").astype("Int64")
+
+            # 인덱스에 없는 row만 append
+            store = self._get_store(filename, dedup_keys, encoding)
+            added = store.upsert(df)
+
+            log.info("CSV updated: %s (added=%d, rows=%d)", file_path, added, len(store))
             return file_path
 
         except Exception as e:
             # CSV 저장 과정에서 발생한 오류 로그 출력
-            print(f"[ERROR] save_df_to_csv failed: {file_path} | {e}")
+            log.error("save_df_to_csv failed: %s | %s", file_path, e)
             raise
 
+    def load_reference(self, filename: str, encoding: str = "utf-8") -> pd.DataFrame:
+        """
+        저장된 기준정보 CSV를 DataFrame으로 읽습니다(필요할 때만).
+
+        :param filename: 파일명 (확장자 없으면 .csv 자동 추가)
+        :return: CSV 전체 DataFrame (파일이 없으면 빈 DataFrame)
+        """
+        if not filename.lower().endswith(".csv"):
+            filename = f"{filename}.csv"
+
+        store = self._stores.get(filename)
+        if store is not None:
+            return store.to_dataframe()
+
+        file_path = DATA_DIR / filename
+        if not file_path.exists():
+            return pd.DataFrame()
+        return pd.read_csv(file_path, encoding=encoding)
+
     def get_maker_category(self, origin: str) -> dict:
         """
         제조사 목록을 수집하고,
@@ -210,7 +246,7 @@ class BobeCar:
         try:
             # 제조사 페이지 요청 및 HTML 파싱
             origin_url = self.__BASE_URL + origin
-            soup = self.fetch_soup(origin_url)
+            soup = self.fetch_soup(origin_url, cache=True)
 
             # 제조사 영역 확인
             car_category_tag = soup.select_one("div", class_="area-maker")
@@ -271,7 +307,7 @@ class BobeCar:
             }
 
         except Exception as e:
-            print(f"[ERROR] get_maker_category failed (origin={origin}): {e}")
+            log.error("get_maker_category failed (origin=%s): %s", origin, e)
             raise
 
     def get_maker_models(self, origin: str, maker_code: int) -> dict:
@@ -302,7 +338,7 @@ class BobeCar:
         try:
             # 제조사 차량 페이지 요청 및 HTML 파싱
             maker_url = f'{self.__BASE_URL}{origin}&maker_no={maker_code}'
-            soup = self.fetch_soup(maker_url)
+            soup = self.fetch_soup(maker_url, cache=True)
 
             # 차량 모델 영역 확인
             model_category_tag = soup.select_one("div", class_="area-model")
@@ -364,7 +400,7 @@ class BobeCar:
             }
 
         except Exception as e:
-            print(f"[ERROR] get_maker_model failed (origin={origin},maker={maker_code}): {e}")
+            log.error("get_maker_model failed (origin=%s,maker=%s): %s", origin, maker_code, e)
             raise
 
     def get_model_generation(
@@ -403,7 +439,7 @@ class BobeCar:
         try:
             # 차량 세대 페이지 요청 및 HTML 파싱
             model_url = f'{self.__BASE_URL}{origin}&maker_no={maker_code}&group_no={model_code}'
-            soup = self.fetch_soup(model_url)
+            soup = self.fetch_soup(model_url, cache=True)
 
             # 차량 모델 세대 영역 확인
             generation_category_tag = soup.select_one("div.area-detail dl.group-list")
@@ -472,8 +508,8 @@ class BobeCar:
 
 
         except Exception as e:
-            print(
-                f"[ERROR] get_maker_generation failed (origin={origin},maker={maker_code},model={model_code}): {e}")
+            log.error(
+                "get_maker_generation failed (origin=%s,maker=%s,model=%s): %s", origin, maker_code, model_code, e)
             raise
 
     def get_generation_terms(
@@ -493,116 +529,25 @@ class BobeCar:
         """
 
         try:
-            grades_url = (
-                f"{self.__BASE_URL}{origin}"
-                f"&dt=true&maker_no={maker_code}"
-                f"&group_no={model_code}"
-                f"&model_no[]={generation_code}"
-            )
-            soup = self.fetch_soup(grades_url)
-
-            # 차량 모델 세대 등급 영역 확인
-            grade_category_tag = soup.select_one("div.area-grade dl.group-list")
-            if grade_category_tag is None:
-                raise ValueError("차량 모델 세대 등급 영역(area-grade)을 찾을 수 없습니다.")
-
-            # ✅ 최상위 등급 dd만 추출
-            grade_categories = grade_category_tag.select("dd", recursive=False)
-            if not grade_categories:
-                print(
-                    f"[WARN] grade dd empty: origin={origin}, maker={maker_code}, model={model_code}, generation={generation_code}")
-                empty_df = pd.DataFrame([], columns=[
-                    "origin", "maker_code", "model_code", "generation_code",
-                    "grade_code", "grade_name", "grade_volume",
-                    "term_code", "term_name", "term_volume"
-                ])
-                csv_path = self.save_df_to_csv(
-                    df=empty_df,
-                    filename="terms",
-                    dedup_keys=["origin", "maker_code", "model_code", "generation_code", "grade_code", "term_code"],
-                )
-                return {"ok": True, "df": empty_df, "csv_path": csv_path, "count": 0}
-            rows: list[dict] = []
-
-            # 차량 모델 세대 등급 정보 파싱
-            for idx, grade_category in enumerate(grade_categories, start=1):
-
-                input_tag = grade_category.select_one("input[name='level_no[]']")
-                if not input_tag or not input_tag.has_attr("value"):
-                    raise ValueError(f"[{idx}] 차량 모델 세대 등급 코드 파싱 실패")
-                grade_code = int(input_tag.get("value"))
+            grades_url, grades = self.get_generation_grades(origin, maker_code, model_code, generation_code)
 
-                name_tag = grade_category.select_one("label")
-                if name_tag is None:
-                    raise ValueError(f"[{idx}] 차량 모델 세대 등급 이름(label) 없음")
-                grade_name = name_tag.get_text(strip=True)
+            rows: list[dict] = []
+            for grade in grades:
+                # ✅ volume == 0 → 트림 확장 호출 안 함
+                term_list = []
+                if grade["grade_volume"] != 0:
+                    term_list = self.get_term_by_grade(grades_url, grade["grade_code"])
 
-                volume_tag = grade_category.select_one("span.t2")
-                if volume_tag is None:
-                    raise ValueError(f"[{idx}] 차량 모델 세대 등급 등록 대수(span.t2) 없음")
-                grade_volume = int(volume_tag.get_text(strip=True).replace(",", ""))
+                rows.extend(self.term_rows(
+                    (origin, maker_code, model_code, generation_code), grade, term_list
+                ))
 
-                # ✅ volume == 0 → 트림 확장 호출 안 함
-                if grade_volume == 0:
-                    rows.append({
-                        "origin": origin,
-                        "maker_code": maker_code,
-                        "model_code": model_code,
-                        "generation_code": generation_code,
-                        "grade_code": grade_code,
-                        "grade_name": grade_name,
-                        "grade_volume": grade_volume,
-                        "term_code": None,
-                        "term_name": None,
-                        "term_volume": None,
-                    })
-                    continue
-
-                # ✅ 등급별 트림 수집
-                term_list = self.get_term_by_grade(grades_url, grade_code)
-
-                # 트림이 없는 경우 → 등급만 저장
-                if not term_list:
-                    rows.append({
-                        "origin": origin,
-                        "maker_code": maker_code,
-                        "model_code": model_code,
-                        "generation_code": generation_code,
-                        "grade_code": grade_code,
-                        "grade_name": grade_name,
-                        "grade_volume": grade_volume,
-                        "term_code": None,
-                        "term_name": None,
-                        "term_volume": None,
-                    })
-                    continue
-
-                # 트림이 있으면 트림별 row 생성
-                for t in term_list:
-                    rows.append({
-                        "origin": origin,
-                        "maker_code": maker_code,
-                        "model_code": model_code,
-                        "generation_code": generation_code,
-                        "grade_code": grade_code,
-                        "grade_name": grade_name,
-                        "grade_volume": grade_volume,
-                        **t,
-                    })
-
-            df = pd.DataFrame(rows)
+            df = pd.DataFrame(rows, columns=TERM_COLUMNS)
 
             csv_path = self.save_df_to_csv(
                 df=df,
                 filename="terms",
-                dedup_keys=[
-                    "origin",
-                    "maker_code",
-                    "model_code",
-                    "generation_code",
-                    "grade_code",
-                    "term_code",
-                ],
+                dedup_keys=TERM_DEDUP_KEYS,
             )
 
             return {
@@ -613,63 +558,245 @@ class BobeCar:
             }
 
         except Exception as e:
-            print(
-                f"[ERROR] get_generation_terms failed "
-                f"(origin={origin}, maker={maker_code}, model={model_code}, generation={generation_code}): {e}"
+            log.error(
+                "get_generation_terms failed (origin=%s, maker=%s, model=%s, generation=%s): %s",
+                origin, maker_code, model_code, generation_code, e,
             )
             raise
 
-    def get_term_by_grade(self, base_url: str, level_no: int) -> list[dict]:
+    def get_generation_terms_bulk(
+            self,
+            targets: list[tuple[str, int, int, int]],
+            workers: int = TERM_WORKERS,
+    ) -> dict:
         """
-        특정 등급(level_no)의 트림(level2_no) 목록을 수집합니다.
-        - level_no 파라미터를 붙여 재요청 후, level2_no[]를 파싱합니다.
+        여러 세대의 등급/트림 정보를 한 번에 수집하고, terms.csv에 한 번만 저장합니다.
+
+        - 1단계: 모든 세대의 등급 페이지를 공유 스레드 풀로 동시에 요청
+        - 2단계: 모든 (세대, 등급) 트림 요청을 같은 풀에 한꺼번에 제출
+        - 요청 속도는 공유 HTTP 세션의 토큰 버킷이 제한합니다.
+        - 결과 row 순서는 targets 순서 → 등급 순서로 항상 같습니다.
+        - 세대(등급 페이지) 또는 (세대, 등급) 트림 요청 하나가 실패하면 해당 하위 트리만 빠지고,
+          나머지 결과는 그대로 저장합니다(reference_pipeline과 같은 동작).
+
+        :param targets: [(origin, maker_code, model_code, generation_code), ...]
+        :param workers: 동시에 진행할 요청 수
+        :return: get_generation_terms와 같은 형태의 결과 dict
+                 + "failed": {"grades": 실패한 세대 수, "terms": 실패한 (세대, 등급) 수}
+                 ("ok"는 실패가 하나도 없을 때만 True)
         """
+
         try:
-            term_url = f"{base_url}&level_no[]={level_no}"
-            soup = self.fetch_soup(term_url)
+            failed = {"grades": 0, "terms": 0}
+
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                # 1) 세대별 등급 목록
+                grade_futures = [pool.submit(self.get_generation_grades, *t) for t in targets]
+                grade_pages: list[tuple[tuple, str, list[dict]]] = []
+                for target, fut in zip(targets, grade_futures):
+                    try:
+                        grades_url, grades = fut.result()
+                    except Exception as e:
+                        log.error("grades failed, skip generation: %s | %s", target, e)
+                        failed["grades"] += 1
+                        continue
+                    grade_pages.append((target, grades_url, grades))
+
+                # 2) 판매 대수가 있는 등급만 트림 요청 제출
+                term_futures = {}
+                for target, grades_url, grades in grade_pages:
+                    for grade in grades:
+                        if grade["grade_volume"] != 0:
+                            key = (target, grade["grade_code"])
+                            term_futures[key] = pool.submit(self.get_term_by_grade, grades_url, grade["grade_code"])
+
+                # 3) 제출 순서와 무관하게 targets → 등급 순서로 row 조립
+                rows: list[dict] = []
+                for target, _, grades in grade_pages:
+                    for grade in grades:
+                        fut = term_futures.get((target, grade["grade_code"]))
+                        if fut is None:
+                            term_list = []
+                        else:
+                            try:
+                                term_list = fut.result()
+                            except Exception as e:
+                                log.error("terms failed, skip grade: %s grade=%s | %s", target, grade["grade_code"], e)
+                                failed["terms"] += 1
+                                continue
+                        rows.extend(self.term_rows(target, grade, term_list))
+
+            df = pd.DataFrame(rows, columns=TERM_COLUMNS)
 
-            group = soup.select_one("div.area-grade dl.group-list")
-            if group is None:
-                return []
+            csv_path = self.save_df_to_csv(
+                df=df,
+                filename="terms",
+                dedup_keys=TERM_DEDUP_KEYS,
+            )
 
-            term_inputs = group.select("input[name='level2_no[]']")
-            if not term_inputs:
-                return []
+            return {
+                "ok": failed["grades"] == 0 and failed["terms"] == 0,
+                "df": df,
+                "csv_path": csv_path,
+                "count": len(df),
+                "failed": failed,
+            }
 
-            terms: list[dict] = []
-            seen_term_codes: set[int] = set()
+        except Exception as e:
+            log.error("get_generation_terms_bulk failed (targets=%d): %s", len(targets), e)
+            raise
 
-            for inp in term_inputs:
-                if not inp.has_attr("value"):
-                    continue
+    def get_generation_grades(
+            self,
+            origin: str,
+            maker_code: int,
+            model_code: int,
+            generation_code: int
+    ) -> tuple[str, list[dict]]:
+        """
+        세대 페이지에서 등급 목록을 수집합니다.
+
+        :return: (트림 요청에 쓸 등급 페이지 URL, [{"grade_code", "grade_name", "grade_volume"}, ...])
+        """
+        grades_url = (
+            f"{self.__BASE_URL}{origin}"
+            f"&dt=true&maker_no={maker_code}"
+            f"&group_no={model_code}"
+            f"&model_no[]={generation_code}"
+        )
+        soup = self.fetch_soup(grades_url)
+
+        grades = self.parse_grades(soup)
+        if not grades:
+            log.warning(
+                "grade dd empty: origin=%s, maker=%s, model=%s, generation=%s", origin, maker_code, model_code, generation_code)
+        return grades_url, grades
+
+    @staticmethod
+    def parse_grades(soup: BeautifulSoup) -> list[dict]:
+        """
+        세대 페이지 soup에서 등급(level_no[]) 목록을 파싱합니다.
+        - 네트워크 요청 없이 파싱만 수행합니다.
+        """
+        # 차량 모델 세대 등급 영역 확인
+        grade_category_tag = soup.select_one("div.area-grade dl.group-list")
+        if grade_category_tag is None:
+            raise ValueError("차량 모델 세대 등급 영역(area-grade)을 찾을 수 없습니다.")
 
-                term_code = int(inp["value"])
-                if term_code in seen_term_codes:
-                    continue
-                seen_term_codes.add(term_code)
+        # ✅ 최상위 등급 dd만 추출
+        grade_categories = grade_category_tag.select("dd", recursive=False)
 
-                dd = inp.find_parent("dd")
-                if dd is None:
-                    continue
+        grades: list[dict] = []
 
-                label = dd.select_one("label")
-                term_name = label.get_text(strip=True) if label else None
-                if term_name in ("", "-"):
-                    term_name = None
+        # 차량 모델 세대 등급 정보 파싱
+        for idx, grade_category in enumerate(grade_categories, start=1):
 
-                cnt_tag = dd.select_one("span.t2")
-                cnt_text = (cnt_tag.get_text(strip=True) if cnt_tag else "").replace(",", "")
-                m = RE_TO_INT.search(cnt_text)
-                term_volume = int(m.group(1)) if m else 0
+            input_tag = grade_category.select_one("input[name='level_no[]']")
+            if not input_tag or not input_tag.has_attr("value"):
+                raise ValueError(f"[{idx}] 차량 모델 세대 등급 코드 파싱 실패")
+            grade_code = int(input_tag.get("value"))
 
-                terms.append({
-                    "term_code": term_code,
-                    "term_name": term_name,
-                    "term_volume": term_volume,
-                })
+            name_tag = grade_category.select_one("label")
+            if name_tag is None:
+                raise ValueError(f"[{idx}] 차량 모델 세대 등급 이름(label) 없음")
+            grade_name = name_tag.get_text(strip=True)
+
+            volume_tag = grade_category.select_one("span.t2")
+            if volume_tag is None:
+                raise ValueError(f"[{idx}] 차량 모델 세대 등급 등록 대수(span.t2) 없음")
+            grade_volume = int(volume_tag.get_text(strip=True).replace(",", ""))
 
-            return terms
+            grades.append({
+                "grade_code": grade_code,
+                "grade_name": grade_name,
+                "grade_volume": grade_volume,
+            })
+
+        return grades
+
+    @staticmethod
+    def term_rows(target: tuple[str, int, int, int], grade: dict, term_list: list[dict]) -> list[dict]:
+        """
+        등급 1개의 terms.csv row를 만듭니다.
+        - 트림이 없으면(또는 트림 요청을 안 했으면) 등급만 저장합니다.
+        - get_generation_terms / get_generation_terms_bulk / reference_pipeline에서 함께 사용합니다.
+        """
+        origin, maker_code, model_code, generation_code = target
+        base = {
+            "origin": origin,
+            "maker_code": maker_code,
+            "model_code": model_code,
+            "generation_code": generation_code,
+            **grade,
+        }
+
+        if not term_list:
+            return [{**base, "term_code": None, "term_name": None, "term_volume": None}]
+
+        # 트림이 있으면 트림별 row 생성
+        return [{**base, **t} for t in term_list]
+
+    def get_term_by_grade(self, base_url: str, level_no: int) -> list[dict]:
+        """
+        특정 등급(level_no)의 트림(level2_no) 목록을 수집합니다.
+        - level_no 파라미터를 붙여 재요청 후, level2_no[]를 파싱합니다.
+        """
+        try:
+            term_url = f"{base_url}&level_no[]={level_no}"
+            soup = self.fetch_soup(term_url)
+            return self.parse_terms(soup)
 
         except Exception as e:
-            print(f"[ERROR] get_term_by_grade failed (level_no={level_no}): {e}")
-            raise
\ No newline at end of file
+            log.error("get_term_by_grade failed (level_no=%s): %s", level_no, e)
+            raise
+
+    @staticmethod
+    def parse_terms(soup: BeautifulSoup) -> list[dict]:
+        """
+        등급 페이지 soup에서 트림(level2_no[]) 목록을 파싱합니다.
+        - 네트워크 요청 없이 파싱만 수행합니다. (벤치마크/재파싱용)
+
+        :param soup: get_term_by_grade가 요청한 등급 페이지의 BeautifulSoup 객체
+        :return: [{"term_code", "term_name", "term_volume"}, ...]
+        """
+        group = soup.select_one("div.area-grade dl.group-list")
+        if group is None:
+            return []
+
+        term_inputs = group.select("input[name='level2_no[]']")
+        if not term_inputs:
+            return []
+
+        terms: list[dict] = []
+        seen_term_codes: set[int] = set()
+
+        for inp in term_inputs:
+            if not inp.has_attr("value"):
+                continue
+
+            term_code = int(inp["value"])
+            if term_code in seen_term_codes:
+                continue
+            seen_term_codes.add(term_code)
+
+            dd = inp.find_parent("dd")
+            if dd is None:
+                continue
+
+            label = dd.select_one("label")
+            term_name = label.get_text(strip=True) if label else None
+            if term_name in ("", "-"):
+                term_name = None
+
+            cnt_tag = dd.select_one("span.t2")
+            cnt_text = (cnt_tag.get_text(strip=True) if cnt_tag else "").replace(",", "")
+            m = RE_TO_INT.search(cnt_text)
+            term_volume = int(m.group(1)) if m else 0
+
+            terms.append({
+                "term_code": term_code,
+                "term_name": term_name,
+                "term_volume": term_volume,
+            })
+
+        return terms
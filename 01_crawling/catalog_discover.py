@@ -2,15 +2,19 @@
 # 0. 목적/개요
 # - market_price_new.php 페이지에서 국산(K)/수입(I) 카탈로그를 수집한다.
 # - 결과는 제조사/모델그룹/세부모델(detail) 단위의 목록(DataFrame)이다.
+# - 제조사별 페이지는 스레드 풀로 동시에 요청하고(속도는 common.http.LIMITER가 제한),
+#   결과는 항상 gubun 순서 → 제조사 목록 순서로 합친다.
 # ============================================================
 
 import re
-import time
-import requests
 import pandas as pd
 from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
 
-from config import MARKET_URL, HEADERS, SLEEP_SEC
+from config import MARKET_URL, CATALOG_WORKERS
+from common.http import http_get
+from common.metrics import METRICS
+from parsers.html import make_soup
 
 
 # ============================================================
@@ -27,8 +31,8 @@ RE_NUM = re.compile(r"[^\d]")
 
 def fetch_html(params: dict) -> str:
     # MARKET_URL에 파라미터를 붙여 HTML을 받아온다.
-    r = requests.get(MARKET_URL, params=params, headers=HEADERS, timeout=30)
-    r.raise_for_status()
+    # 카탈로그 페이지는 거의 바뀌지 않으므로 HTTP 캐시(ETag/TTL)를 거친다.
+    r = http_get(MARKET_URL, params=params, cache=True)
     return r.text
 
 
@@ -79,79 +83,119 @@ def parse_import_makers_only_has_stock(soup: BeautifulSoup) -> list[tuple[int, s
 
 
 # ============================================================
-# 3. 카탈로그 수집(제조사 -> 모델그룹 -> 세부모델)
-# - gubun(K/I)에 따라 제조사 목록 파싱 방식이 다르다.
-# - 제조사 페이지에서 모델그룹 목록을 만들고, detail 영역에서 group_no에 매칭한다.
+# 3. 카탈로그 페이지 파싱
+# - parse_makers: gubun(K/I)에 따라 제조사 목록 파싱 방식이 다르다.
+# - parse_maker_catalog: 제조사 페이지에서 모델그룹 목록을 만들고,
+#   detail 영역에서 group_no에 매칭해 세부모델 row를 만든다.
+# - 네트워크 없이 soup만 파싱한다(벤치마크/재파싱용).
 # ============================================================
 
-def discover_catalog(gubun: str) -> pd.DataFrame:
+def parse_makers(soup: BeautifulSoup, gubun: str) -> list[tuple[int, str]]:
+    if gubun == "I":
+        return parse_import_makers_only_has_stock(soup)
+
+    makers = []
+    for btn in soup.select("div.area-maker dl.group-list button[onclick*='car_depth_lite']"):
+        m = RE_MAKER.search(btn.get("onclick", ""))
+        if not m:
+            continue
+        maker_no = int(m.group(1))
+        maker_name = btn.select_one("span.t1").get_text(strip=True)
+        makers.append((maker_no, maker_name))
+    return makers
+
+
+def parse_maker_catalog(soup_m: BeautifulSoup, gubun: str, maker_no: int, maker_name: str) -> list[dict]:
+    # 모델그룹(group_no -> group_name) 맵 구성
+    models = {}
+    for btn in soup_m.select("div.area-model dl.group-list button[onclick*='modelSel']"):
+        m = RE_MODEL.search(btn.get("onclick", ""))
+        if not m:
+            continue
+        group_no = int(m.group(1))
+        group_name = btn.select_one("span.t1").get_text(strip=True)
+        models[group_no] = group_name
+
+    catalog_rows = []
+
+    # 세부모델(detail) 추출: dd class에 group_no가 들어있어 모델그룹과 연결
+    for dd in soup_m.select("div.area-detail dl.group-list dd"):
+        cls = " ".join(dd.get("class", []))
+        cm = RE_DETAIL_CLASS.search(cls)
+        if not cm:
+            continue
+        group_no = int(cm.group(1))
+        group_name = models.get(group_no, "")
+
+        inp = dd.select_one("input[name='model_no[]']")
+        lab = dd.select_one("label")
+        cnt = dd.select_one("span.t2")
+
+        if not inp or not lab:
+            continue
+
+        detail_no = int(inp.get("value"))
+        detail_name = lab.get_text(" ", strip=True)
+        detail_count = to_int_num(cnt.get_text(strip=True)) if cnt else None
+
+        catalog_rows.append({
+            "gubun": gubun,
+            "maker_no": maker_no,
+            "maker_name": maker_name,
+            "group_no": group_no,
+            "group_name": group_name,
+            "detail_no": detail_no,
+            "detail_name": detail_name,
+            "detail_count": detail_count
+        })
+
+    return catalog_rows
+
+
+# ============================================================
+# 4. 카탈로그 수집(제조사 -> 모델그룹 -> 세부모델)
+# - gubun별 제조사 목록 페이지를 받은 뒤, 모든 제조사 페이지를 한 풀에서 동시에 받는다.
+# - discover_catalog_all(("K", "I"))는 국산/수입을 동시에 수집한다.
+# ============================================================
+
+CATALOG_COLUMNS = [
+    "gubun", "maker_no", "maker_name", "group_no", "group_name",
+    "detail_no", "detail_name", "detail_count",
+]
+
+
+def discover_maker(gubun: str, maker_no: int, maker_name: str) -> list[dict]:
+    # 제조사 1곳의 모델그룹/세부모델 row 수집
+    html_m = fetch_html({"gubun": gubun, "maker_no": maker_no})
+    with METRICS.timer("parse_seconds", page="market_maker"):
+        return parse_maker_catalog(make_soup(html_m), gubun, maker_no, maker_name)
+
+
+def discover_catalog_all(gubuns: tuple[str, ...] = ("K", "I"), workers: int = CATALOG_WORKERS) -> pd.DataFrame:
     """
     return rows:
       { gubun, maker_no, maker_name, group_no, group_name, detail_no, detail_name, detail_count }
     """
-    html = fetch_html({"gubun": gubun})
-    soup = BeautifulSoup(html, "html.parser")
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # 1) gubun별 제조사 목록 추출(동시에)
+        maker_lists = list(pool.map(
+            lambda g: parse_makers(make_soup(fetch_html({"gubun": g})), g),
+            gubuns,
+        ))
 
-    # 1) 제조사 목록 추출
-    if gubun == "I":
-        makers = parse_import_makers_only_has_stock(soup)
-    else:
-        makers = []
-        for btn in soup.select("div.area-maker dl.group-list button[onclick*='car_depth_lite']"):
-            m = RE_MAKER.search(btn.get("onclick", ""))
-            if not m:
-                continue
-            maker_no = int(m.group(1))
-            maker_name = btn.select_one("span.t1").get_text(strip=True)
-            makers.append((maker_no, maker_name))
+        # 2) 제조사별 상세(모델그룹/세부모델) 수집(동시에)
+        futures = [
+            pool.submit(discover_maker, gubun, maker_no, maker_name)
+            for gubun, makers in zip(gubuns, maker_lists)
+            for maker_no, maker_name in makers
+        ]
+
+        # 3) 제출 순서대로 합쳐 실행마다 같은 순서 유지
+        catalog_rows = [row for fut in futures for row in fut.result()]
+
+    return pd.DataFrame(catalog_rows, columns=CATALOG_COLUMNS)
 
-    catalog_rows = []
 
-    # 2) 제조사별 상세(모델그룹/세부모델) 수집
-    for maker_no, maker_name in makers:
-        time.sleep(SLEEP_SEC)
-        html_m = fetch_html({"gubun": gubun, "maker_no": maker_no})
-        soup_m = BeautifulSoup(html_m, "html.parser")
-
-        # 모델그룹(group_no -> group_name) 맵 구성
-        models = {}
-        for btn in soup_m.select("div.area-model dl.group-list button[onclick*='modelSel']"):
-            m = RE_MODEL.search(btn.get("onclick", ""))
-            if not m:
-                continue
-            group_no = int(m.group(1))
-            group_name = btn.select_one("span.t1").get_text(strip=True)
-            models[group_no] = group_name
-
-        # 세부모델(detail) 추출: dd class에 group_no가 들어있어 모델그룹과 연결
-        for dd in soup_m.select("div.area-detail dl.group-list dd"):
-            cls = " ".join(dd.get("class", []))
-            cm = RE_DETAIL_CLASS.search(cls)
-            if not cm:
-                continue
-            group_no = int(cm.group(1))
-            group_name = models.get(group_no, "")
-
-            inp = dd.select_one("input[name='model_no[]']")
-            lab = dd.select_one("label")
-            cnt = dd.select_one("span.t2")
-
-            if not inp or not lab:
-                continue
-
-            detail_no = int(inp.get("value"))
-            detail_name = lab.get_text(" ", strip=True)
-            detail_count = to_int_num(cnt.get_text(strip=True)) if cnt else None
-
-            catalog_rows.append({
-                "gubun": gubun,
-                "maker_no": maker_no,
-                "maker_name": maker_name,
-                "group_no": group_no,
-                "group_name": group_name,
-                "detail_no": detail_no,
-                "detail_name": detail_name,
-                "detail_count": detail_count
-            })
-
-    return pd.DataFrame(catalog_rows)
\ No newline at end of file
+def discover_catalog(gubun: str, workers: int = CATALOG_WORKERS) -> pd.DataFrame:
+    # gubun(K/I) 하나만 수집
+    return discover_catalog_all((gubun,), workers=workers)
@@ -4,6 +4,18 @@
 from .paths import DATA_DIR
 from .csv_io import load_csv
 from .progress import progress_logger, register_progress_loggers_once
+from .metrics import Metrics, METRICS
+from .log import setup_logging, get_logger
+from .rate_limit import TokenBucket, AdaptiveRateLimiter
+from .archive import HtmlArchive
+from .http_cache import HttpCache
+from .http import get_session, http_get, connection_stats, set_archive, cache_stats, rate_stats, set_rate_share
+from .checkpoint import CheckpointJournal
+from .row_sink import CsvRowSink
+from .snapshot import load_snapshot, read_column, same_list_price
+from .ref_store import ReferenceStore
+from .seen_set import SeenUrlSet, listing_id
+from .shard import parse_shard, shard_of, shard_path, merge_shards
 
 # common 패키지에서 외부로 공개할 공통 인터페이스 정의
 __all__ = [
@@ -11,4 +23,31 @@ __all__ = [
     "load_csv",
     "progress_logger",
     "register_progress_loggers_once",
+    "Metrics",
+    "METRICS",
+    "setup_logging",
+    "get_logger",
+    "TokenBucket",
+    "AdaptiveRateLimiter",
+    "get_session",
+    "http_get",
+    "connection_stats",
+    "rate_stats",
+    "set_rate_share",
+    "set_archive",
+    "HtmlArchive",
+    "cache_stats",
+    "HttpCache",
+    "CheckpointJournal",
+    "CsvRowSink",
+    "load_snapshot",
+    "read_column",
+    "same_list_price",
+    "ReferenceStore",
+    "SeenUrlSet",
+    "listing_id",
+    "parse_shard",
+    "shard_of",
+    "shard_path",
+    "merge_shards",
 ]
@@ -0,0 +1,92 @@
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Iterator
+
+
+class HtmlArchive:
+    """
+    응답 원문(HTML)을 내용 주소(sha256) 기준으로 gzip 압축해 보관하는 저장소
+
+    - objects/<앞 2자리>/<sha256>.html.gz : 원문(같은 내용은 한 번만 저장)
+    - index.jsonl : {url, sha256, encoding, fetched_at} 요청 기록(append-only)
+    - DOM이 바뀌어 파서를 고쳐도 다시 크롤링하지 않고 보관본을 재파싱할 수 있다.
+    """
+
+    def __init__(self, root: str | Path, compresslevel: int = 6):
+        self.root = Path(root)
+        self.objects_dir = self.root / "objects"
+        self.index_path = self.root / "index.jsonl"
+        self.compresslevel = compresslevel
+
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self.stats = {"stored": 0, "deduped": 0, "bytes_raw": 0, "bytes_stored": 0}
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / f"{digest}.html.gz"
+
+    def put(self, url: str, content: bytes, encoding: str | None = None) -> str:
+        """
+        원문을 저장하고 sha256 digest를 반환한다.
+        같은 내용이 이미 있으면 원문은 다시 쓰지 않고 index에만 기록한다.
+        """
+        digest = hashlib.sha256(content).hexdigest()
+        path = self._object_path(digest)
+
+        if path.exists():
+            with self._lock:
+                self.stats["deduped"] += 1
+        else:
+            path.parent.mkdir(exist_ok=True)
+            data = gzip.compress(content, compresslevel=self.compresslevel)
+
+            # 임시 파일에 쓴 뒤 교체(동시에 같은 내용을 써도 깨진 파일이 남지 않음)
+            tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+
+            with self._lock:
+                self.stats["stored"] += 1
+                self.stats["bytes_raw"] += len(content)
+                self.stats["bytes_stored"] += len(data)
+
+        rec = {"url": url, "sha256": digest, "encoding": encoding, "fetched_at": time.time()}
+        with self._lock:
+            with open(self.index_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        return gzip.decompress(self._object_path(digest).read_bytes())
+
+    def get_text(self, entry: dict) -> str:
+        # index 항목의 encoding으로 디코딩(요청 당시 response.text와 같은 결과)
+        return self.get(entry["sha256"]).decode(entry.get("encoding") or "utf-8", errors="replace")
+
+    def iter_latest(self, url_contains: str | None = None) -> Iterator[dict]:
+        """
+        URL별 가장 최근 index 항목을 돌려준다.
+
+        :param url_contains: 지정하면 URL에 이 문자열이 포함된 항목만
+        """
+        if not self.index_path.exists():
+            return
+
+        latest: dict[str, dict] = {}
+        with open(self.index_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    rec = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if url_contains and url_contains not in rec["url"]:
+                    continue
+                latest[rec["url"]] = rec
+
+        yield from latest.values()
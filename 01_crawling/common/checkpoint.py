@@ -0,0 +1,82 @@
+import json
+import threading
+from pathlib import Path
+
+from .log import get_logger
+
+log = get_logger("checkpoint")
+
+DetailKey = tuple[str, int, int, int]
+
+
+class CheckpointJournal:
+    """
+    크롤링 진행 상황을 기록하는 append-only 체크포인트 저널(JSON Lines)
+
+    - 키: (gubun, maker_no, group_no, detail_no)
+    - {"kind": "url", ...}   : 해당 세부모델의 상세 URL 1건 수집 완료
+    - {"kind": "detail", ...}: 해당 세부모델 전체 수집 완료
+    - 재실행 시 저널을 다시 읽어 완료된 세부모델/URL은 건너뛴다.
+    - 마지막 줄이 쓰다 만 상태(크래시)여도 그 줄만 무시하고 이어서 진행한다.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._done_details: set[DetailKey] = set()
+        self._done_urls: dict[DetailKey, set[str]] = {}
+        self._lock = threading.Lock()
+
+        self._load()
+        self._fp = open(self.path, "a", encoding="utf-8")
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    rec = json.loads(line)
+                except json.JSONDecodeError:
+                    # 크래시로 잘린 줄은 무시(해당 URL은 다시 수집)
+                    continue
+
+                key = tuple(rec["key"])
+                if rec["kind"] == "detail":
+                    self._done_details.add(key)
+                elif rec["kind"] == "url":
+                    self._done_urls.setdefault(key, set()).add(rec["detail_url"])
+
+        log.info(
+            "journal loaded: %s (details=%d, urls=%d)",
+            self.path, len(self._done_details), sum(len(v) for v in self._done_urls.values()),
+        )
+
+    def _write(self, rec: dict) -> None:
+        with self._lock:
+            self._fp.write(json.dumps(rec, ensure_ascii=False) + "\n")
+            self._fp.flush()
+
+    def is_detail_done(self, key: DetailKey) -> bool:
+        return key in self._done_details
+
+    def done_urls(self, key: DetailKey) -> set[str]:
+        return self._done_urls.get(key, set())
+
+    def mark_url(self, key: DetailKey, detail_url: str) -> None:
+        self._done_urls.setdefault(key, set()).add(detail_url)
+        self._write({"kind": "url", "key": list(key), "detail_url": detail_url})
+
+    def mark_detail(self, key: DetailKey) -> None:
+        self._done_details.add(key)
+        # 세부모델이 끝나면 URL 목록은 더 이상 필요 없으므로 메모리에서 제거
+        self._done_urls.pop(key, None)
+        self._write({"kind": "detail", "key": list(key)})
+
+    def close(self) -> None:
+        self._fp.close()
+
+    def remove(self) -> None:
+        # 전체 실행이 정상 종료되면 저널을 지워 다음 실행은 처음부터 시작
+        self.close()
+        self.path.unlink(missing_ok=True)
@@ -2,8 +2,11 @@ from typing import Optional
 
 import pandas as pd
 
+from .log import get_logger
 from .paths import DATA_DIR
 
+log = get_logger("csv_io")
+
 
 def load_csv(filename: str, encoding: str = 'utf-8') -> Optional[pd.DataFrame]:
     """
@@ -21,7 +24,7 @@ def load_csv(filename: str, encoding: str = 'utf-8') -> Optional[pd.DataFrame]:
 
     # DATA_DIR경로에 filename의 파일이 없으면 None을 반환
     if not file_path.exists():
-        print(f'[WARN] CSV not found: {filename}')
+        log.warning('CSV not found: %s', filename)
         return None
 
     
@@ -31,16 +34,16 @@ def load_csv(filename: str, encoding: str = 'utf-8') -> Optional[pd.DataFrame]:
 
         # csv에 내용이 없으면 빈 df를 반환
         if df.empty:
-            print(f'[WARN] CSV is empty: {filename}')
+            log.warning('CSV is empty: %s', filename)
             return df
 
         # 내용이 있으면 csv을 읽는데 성공이라고 터미널에 출력 후 df반환
-        print(f'[INFO] CSV loaded: {filename}')
+        log.info('CSV loaded: %s', filename)
         return df
 
     except Exception as e:
         # 에러가 발생하면 ERROR라고 사용자에게 알려주고 에러코드 전달
-        print(f"[ERROR] Failed to load CSV: {file_path} | {e}")
+        log.error("Failed to load CSV: %s | %s", file_path, e)
 
         # 예외를 숨기지 않고 다시 발생시켜 상위 로직에서 처리 가능하게 함
         raise
@@ -0,0 +1,249 @@
+# ============================================================
+# 0. 목적/개요
+# - 크롤러 모듈(crawl_market_list / catalog_discover / BobeCar)이 함께 쓰는
+#   HTTP 전송 계층이다.
+# - 하나의 requests.Session을 공유해 keep-alive 연결을 재사용하고,
+#   429/5xx 응답은 지수 백오프로 재시도한다(_send).
+#   재시도도 매번 속도 제한기를 다시 통과하므로 사이트가 받는 요청 수에 포함된다.
+# - set_archive()로 원문 보관소를 지정하면 성공한 응답 원문을 모두 보관한다.
+# - cache=True 요청은 ETag/Last-Modified 디스크 캐시(common/http_cache.py)를 거친다.
+# - 실제로 네트워크에 나가는 요청은 모두 엔드포인트별 적응형 속도 제한기(LIMITER)를 통과한다.
+#   어느 모듈/스레드에서 요청하든 같은 엔드포인트는 하나의 속도를 공유하고,
+#   응답 지연시간/상태코드에 따라 속도가 자동으로 오르내린다(AIMD).
+# ============================================================
+
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config import (
+    HEADERS, HTTP_POOL_SIZE, HTTP_RETRIES, HTTP_BACKOFF_SEC, HTTP_TIMEOUT,
+    HTTP_CACHE_DIR, HTTP_CACHE_TTL_SEC, RATE_PER_SEC,
+    RATE_MIN_PER_SEC, RATE_MAX_PER_SEC, RATE_STEP, RATE_DECREASE, RATE_LATENCY_TARGET_SEC,
+)
+from .archive import HtmlArchive
+from .http_cache import HttpCache, cached_response
+from .metrics import METRICS
+from .rate_limit import AdaptiveRateLimiter
+
+
+# 재시도 대상 상태코드(요청 과다/서버 오류)
+RETRY_STATUS = (429, 500, 502, 503, 504)
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+_archive: HtmlArchive | None = None
+_cache: HttpCache | None = None
+
+# 프로세스 전체 공용 요청 속도 제한기(엔드포인트별 AIMD)
+LIMITER = AdaptiveRateLimiter(
+    RATE_PER_SEC,
+    min_rate=RATE_MIN_PER_SEC,
+    max_rate=RATE_MAX_PER_SEC,
+    step=RATE_STEP,
+    decrease=RATE_DECREASE,
+    latency_target=RATE_LATENCY_TARGET_SEC,
+)
+
+
+def build_session(pool_size: int = HTTP_POOL_SIZE) -> requests.Session:
+    """
+    연결 풀이 적용된 requests.Session을 만든다.
+    (재시도는 urllib3 Retry가 아니라 _send에서 처리 → 재시도 요청도 속도 제한기를 통과)
+
+    :param pool_size: 호스트당 유지할 keep-alive 연결 수(동시 요청 수 이상 권장)
+    """
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update(HEADERS)
+    session.headers.update({
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+    })
+    return session
+
+
+def get_session() -> requests.Session:
+    # 프로세스 전체에서 하나의 세션을 공유(최초 호출 시 생성)
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = build_session()
+    return _session
+
+
+def http_get(
+    url: str,
+    params: dict | None = None,
+    timeout: float = HTTP_TIMEOUT,
+    cache: bool = False,
+) -> requests.Response:
+    """
+    공유 세션으로 GET 요청을 보내고 응답을 반환한다.
+
+    - 4xx/5xx(재시도 이후에도 실패)는 requests.HTTPError로 올린다.
+    - cache=True면 디스크 캐시(ETag/Last-Modified + TTL)를 거친다.
+      자주 바뀌지 않는 카탈로그/제조사/모델 페이지에 사용한다.
+    """
+    if cache:
+        return _cached_get(url, params, timeout)
+
+    r = _send(url, params=params, timeout=timeout)
+    r.raise_for_status()
+
+    if _archive is not None:
+        _archive.put(r.url, r.content, r.encoding)
+    return r
+
+
+def _retry_wait(r: requests.Response | None, attempt: int, backoff_sec: float) -> float:
+    # Retry-After(초)가 있으면 그만큼, 없으면 지수 백오프(backoff_sec * 2^attempt)
+    if r is not None:
+        ra = r.headers.get("Retry-After", "")
+        if ra.strip().isdigit():
+            return float(ra)
+    return backoff_sec * (2 ** attempt)
+
+
+def _send(
+    url: str,
+    timeout: float,
+    retries: int = HTTP_RETRIES,
+    backoff_sec: float = HTTP_BACKOFF_SEC,
+    **kwargs,
+) -> requests.Response:
+    """
+    속도 제한기를 통과해 요청을 보내고, 결과(지연시간/상태코드/오류)를 제한기에 알려준다.
+
+    - 429/5xx/타임아웃/연결 오류는 retries번까지 재시도한다.
+      재시도도 매번 LIMITER.acquire를 거치고 결과를 record하므로,
+      사이트가 받는 요청 수는 엔드포인트별 속도 제한을 넘지 않고 429/503은 바로 느려지라는 신호가 된다.
+    - 재시도를 다 써도 마지막 응답을 돌려주고, 판단은 raise_for_status에 맡긴다.
+    """
+    endpoint = urlparse(url).path
+    for attempt in range(retries + 1):
+        LIMITER.acquire(url)
+        t0 = time.monotonic()
+        try:
+            r = get_session().get(url, timeout=timeout, allow_redirects=True, **kwargs)
+        except (requests.Timeout, requests.ConnectionError) as e:
+            latency = time.monotonic() - t0
+            LIMITER.record(url, latency, error=True)
+            METRICS.observe("http_request_seconds", latency, endpoint=endpoint)
+            METRICS.inc("http_errors_total", endpoint=endpoint, error=type(e).__name__)
+            if attempt == retries:
+                raise
+            METRICS.inc("http_retries_total", endpoint=endpoint)
+            time.sleep(_retry_wait(None, attempt, backoff_sec))
+            continue
+        latency = time.monotonic() - t0
+
+        LIMITER.record(url, latency, status=r.status_code)
+        METRICS.observe("http_request_seconds", latency, endpoint=endpoint)
+        METRICS.inc("http_requests_total", endpoint=endpoint, status=r.status_code)
+        METRICS.inc("http_response_bytes_total", len(r.content), endpoint=endpoint)
+
+        if r.status_code in RETRY_STATUS and attempt < retries:
+            METRICS.inc("http_retries_total", endpoint=endpoint)
+            time.sleep(_retry_wait(r, attempt, backoff_sec))
+            continue
+        return r
+
+
+def _cached_get(url: str, params: dict | None, timeout: float) -> requests.Response:
+    c = get_cache()
+    full_url = requests.Request("GET", url, params=params).prepare().url
+    key = c.key_for(full_url)
+
+    # 1) TTL 이내면 요청 없이 캐시 사용
+    entry = c.load(key)
+    headers = {}
+    if entry is not None:
+        meta, body = entry
+        if c.is_fresh(meta):
+            c.count("hits")
+            METRICS.inc("http_cache_total", result="hit")
+            return cached_response(meta, body)
+        headers = c.conditional_headers(meta)
+
+    # 2) 조건부 요청: 304면 캐시 재사용, 200이면 캐시 교체
+    r = _send(full_url, headers=headers, timeout=timeout)
+    if r.status_code == 304 and entry is not None:
+        c.touch(key, meta)
+        c.count("revalidated")
+        METRICS.inc("http_cache_total", result="revalidated")
+        return cached_response(meta, body)
+
+    r.raise_for_status()
+    c.store(key, r)
+    c.count("misses")
+    METRICS.inc("http_cache_total", result="miss")
+
+    if _archive is not None:
+        _archive.put(r.url, r.content, r.encoding)
+    return r
+
+
+def get_cache() -> HttpCache:
+    # 디스크 캐시(최초 호출 시 HTTP_CACHE_DIR에 생성)
+    global _cache
+    if _cache is None:
+        with _session_lock:
+            if _cache is None:
+                _cache = HttpCache(HTTP_CACHE_DIR, HTTP_CACHE_TTL_SEC)
+    return _cache
+
+
+def cache_stats() -> dict:
+    # 디스크 캐시 hit/revalidated/miss 집계
+    if _cache is None:
+        return {"hits": 0, "revalidated": 0, "misses": 0}
+    return dict(_cache.stats)
+
+
+def rate_stats() -> dict:
+    # 엔드포인트별 현재 요청 속도(초당)와 증가/감소 횟수
+    return LIMITER.stats()
+
+
+def set_rate_share(fraction: float) -> None:
+    # 이 프로세스가 쓸 요청 속도 비율(샤드 N개로 나눠 돌리면 1/N)
+    LIMITER.scale(fraction)
+
+
+def set_archive(archive: HtmlArchive | None) -> None:
+    # 응답 원문 보관소 지정(None이면 보관하지 않음)
+    global _archive
+    _archive = archive
+
+
+def connection_stats() -> dict:
+    """
+    공유 세션의 연결 재사용 통계를 반환한다.
+
+    - requests: 보낸 요청 수(재시도 포함)
+    - new_connections: 새로 맺은 TCP(+TLS) 연결 수
+    - reused_connections: keep-alive로 재사용한 요청 수
+    """
+    stats = {"requests": 0, "new_connections": 0, "reused_connections": 0}
+    if _session is None:
+        return stats
+
+    # http:// / https:// 에 같은 어댑터가 마운트되어 있으므로 한 번씩만 집계
+    adapters = {id(a): a for a in _session.adapters.values()}
+    for adapter in adapters.values():
+        pools = adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools[key]
+            stats["requests"] += pool.num_requests
+            stats["new_connections"] += pool.num_connections
+
+    stats["reused_connections"] = max(0, stats["requests"] - stats["new_connections"])
+    return stats
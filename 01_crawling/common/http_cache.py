@@ -0,0 +1,94 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+import requests
+
+
+class HttpCache:
+    """
+    ETag / Last-Modified 기반 조건부 요청(conditional GET)용 디스크 캐시
+
+    - <key>.json : {url, etag, last_modified, encoding, stored_at}
+    - <key>.body : 응답 원문(bytes)
+    - 저장 후 ttl_sec 이내면 네트워크 없이 캐시를 그대로 쓴다(hit).
+    - ttl이 지나면 If-None-Match / If-Modified-Since를 붙여 요청하고,
+      304면 캐시를 다시 쓰고(revalidated), 200이면 새 응답으로 교체한다(miss).
+    """
+
+    def __init__(self, root: str | Path, ttl_sec: float):
+        self.root = Path(root)
+        self.ttl_sec = ttl_sec
+        self.root.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "revalidated": 0, "misses": 0}
+
+    @staticmethod
+    def key_for(url: str) -> str:
+        return hashlib.sha1(url.encode("utf-8")).hexdigest()
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        return self.root / f"{key}.json", self.root / f"{key}.body"
+
+    def load(self, key: str) -> tuple[dict, bytes] | None:
+        meta_path, body_path = self._paths(key)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            body = body_path.read_bytes()
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        return meta, body
+
+    def is_fresh(self, meta: dict) -> bool:
+        return time.time() - meta["stored_at"] < self.ttl_sec
+
+    def store(self, key: str, r: requests.Response) -> None:
+        meta_path, body_path = self._paths(key)
+        meta = {
+            "url": r.url,
+            "etag": r.headers.get("ETag"),
+            "last_modified": r.headers.get("Last-Modified"),
+            "encoding": r.encoding,
+            "stored_at": time.time(),
+        }
+
+        # body를 먼저 쓰고 meta를 나중에 교체(meta가 있으면 body도 온전함)
+        tmp = body_path.with_suffix(f".{threading.get_ident()}.tmp")
+        tmp.write_bytes(r.content)
+        os.replace(tmp, body_path)
+
+        tmp = meta_path.with_suffix(f".{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, meta_path)
+
+    def touch(self, key: str, meta: dict) -> None:
+        # 304로 재검증된 항목의 저장 시각 갱신(TTL 다시 시작)
+        meta_path, _ = self._paths(key)
+        meta = {**meta, "stored_at": time.time()}
+        meta_path.write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+
+    def conditional_headers(self, meta: dict) -> dict:
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def count(self, kind: str) -> None:
+        with self._lock:
+            self.stats[kind] += 1
+
+
+def cached_response(meta: dict, body: bytes) -> requests.Response:
+    # 캐시 원문으로 requests.Response를 만들어 호출부가 평소처럼 .text/.url을 쓰게 함
+    r = requests.Response()
+    r.status_code = 200
+    r.url = meta["url"]
+    r.encoding = meta.get("encoding")
+    r._content = body
+    return r
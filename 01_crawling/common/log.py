@@ -0,0 +1,94 @@
+import atexit
+import json
+import logging
+import queue
+import sys
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
+
+from config import LOG_LEVEL, LOG_JSON
+
+
+# 로그 이름 공간(크롤러 모듈은 모두 "crawl.<모듈명>" 로거를 사용)
+ROOT_LOGGER = "crawl"
+
+TEXT_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+
+# LogRecord 기본 속성(이외의 속성은 extra로 넘긴 구조화 필드로 보고 JSON에 포함)
+_RECORD_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime", "taskName"}
+
+_listener: QueueListener | None = None
+_handler: logging.Handler | None = None
+_lock = threading.Lock()
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    로그 1건을 JSON 한 줄로 만든다.
+    - {ts, level, logger, msg} + extra={...}로 넘긴 필드(url, status, detail_no 등)
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        out = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for k, v in record.__dict__.items():
+            if k not in _RECORD_ATTRS and not k.startswith("_"):
+                out[k] = v
+        if record.exc_info:
+            out["exc"] = self.formatException(record.exc_info)
+        return json.dumps(out, ensure_ascii=False, default=str)
+
+
+def setup_logging(level: str | int = "INFO", json_format: bool = False, stream=None) -> None:
+    """
+    크롤러 로거("crawl")를 큐 기반 비동기 출력으로 설정한다.
+
+    - 호출 스레드는 레코드를 큐에 넣기만 하고, 실제 stdout/stderr 쓰기는 listener 스레드가 한다.
+      → 여러 worker가 동시에 로그를 남겨도 요청/파싱 스레드가 출력 I/O에 막히지 않는다.
+    - level보다 낮은 로그는 logger 단계에서 바로 버려져 메시지 포맷팅도 하지 않는다.
+      (hot path에서는 f-string 대신 log.debug("%s", x)처럼 인자를 넘긴다)
+    - 다시 호출하면 level/형식만 바꾼다.
+
+    :param level: "DEBUG" / "INFO" / "WARNING" / "ERROR"
+    :param json_format: True면 JSON 한 줄 형식(수집기/grep용)
+    :param stream: 출력 대상(기본 sys.stdout)
+    """
+    global _listener, _handler
+
+    with _lock:
+        logger = logging.getLogger(ROOT_LOGGER)
+        logger.setLevel(level.upper() if isinstance(level, str) else level)
+        logger.propagate = False
+
+        formatter = JsonFormatter() if json_format else logging.Formatter(TEXT_FORMAT)
+        formatter.converter = time.localtime
+
+        if _listener is not None:
+            _handler.setFormatter(formatter)
+            return
+
+        q: queue.SimpleQueue = queue.SimpleQueue()
+        _handler = logging.StreamHandler(stream or sys.stdout)
+        _handler.setFormatter(formatter)
+
+        _listener = QueueListener(q, _handler, respect_handler_level=False)
+        _listener.start()
+        logger.addHandler(QueueHandler(q))
+
+        # 종료 시 큐에 남은 로그를 모두 출력
+        atexit.register(_listener.stop)
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    모듈용 로거("crawl.<name>")를 반환한다.
+    setup_logging()이 아직 호출되지 않았으면 기본값(INFO, 텍스트)으로 설정한다.
+    """
+    if _listener is None:
+        setup_logging(LOG_LEVEL, LOG_JSON)
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
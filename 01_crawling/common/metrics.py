@@ -0,0 +1,159 @@
+import bisect
+import json
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+
+# 히스토그램 기본 구간(초) - 요청/파싱(ms 단위)부터 단계 전체(분 단위)까지
+DEFAULT_BUCKETS = (
+    0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1, 2.5, 5, 10, 30, 60, 300, 900, 1800,
+)
+
+
+def _label_key(labels: dict) -> tuple:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _escape(v: str) -> str:
+    return v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _prom_labels(key: tuple, extra: tuple = ()) -> str:
+    pairs = list(key) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(str(v))}"' for k, v in pairs) + "}"
+
+
+class Metrics:
+    """
+    크롤러 실행 지표 수집기(counter / gauge / histogram)
+
+    - inc(): 누적 값(요청 수, 바이트, 오류 수 등)
+    - set_gauge(): 마지막 값(처리 속도 등)
+    - observe() / timer(): 지연시간 분포(구간별 개수 + 합계/개수)
+    - 라벨(예: endpoint, status, stage)별로 따로 집계한다.
+    - write_json() / write_prometheus()로 실행 종료 시 파일로 내보낸다.
+    - 여러 스레드에서 동시에 호출해도 안전하다.
+    """
+
+    def __init__(self, prefix: str = "crawl", buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.prefix = prefix
+        self.buckets = tuple(sorted(buckets))
+        self.started_at = time.time()
+
+        self._counters: dict[str, dict[tuple, float]] = {}
+        self._gauges: dict[str, dict[tuple, float]] = {}
+        self._hists: dict[str, dict[tuple, dict]] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name: str, value: float = 1, **labels) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def set_gauge(self, name: str, value: float, **labels) -> None:
+        with self._lock:
+            self._gauges.setdefault(name, {})[_label_key(labels)] = value
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        key = _label_key(labels)
+        idx = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._hists.setdefault(name, {})
+            h = series.get(key)
+            if h is None:
+                h = {"counts": [0] * (len(self.buckets) + 1), "sum": 0.0, "count": 0}
+                series[key] = h
+            h["counts"][idx] += 1
+            h["sum"] += value
+            h["count"] += 1
+
+    @contextmanager
+    def timer(self, name: str, **labels):
+        # with METRICS.timer("parse_seconds", page="detail"): ...
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - t0, **labels)
+
+    def to_dict(self) -> dict:
+        """
+        JSON으로 내보낼 형태
+
+        - counters/gauges: {name: [{labels, value}, ...]}
+        - histograms: {name: [{labels, count, sum, mean, buckets: {le: 누적 개수}}, ...]}
+        """
+        with self._lock:
+            out = {
+                "started_at": self.started_at,
+                "elapsed_sec": time.time() - self.started_at,
+                "counters": {
+                    name: [{"labels": dict(k), "value": v} for k, v in series.items()]
+                    for name, series in self._counters.items()
+                },
+                "gauges": {
+                    name: [{"labels": dict(k), "value": v} for k, v in series.items()]
+                    for name, series in self._gauges.items()
+                },
+                "histograms": {},
+            }
+            for name, series in self._hists.items():
+                rows = []
+                for k, h in series.items():
+                    cum, buckets = 0, {}
+                    for le, c in zip([*self.buckets, "+Inf"], h["counts"]):
+                        cum += c
+                        buckets[str(le)] = cum
+                    rows.append({
+                        "labels": dict(k),
+                        "count": h["count"],
+                        "sum": h["sum"],
+                        "mean": h["sum"] / h["count"] if h["count"] else 0.0,
+                        "buckets": buckets,
+                    })
+                out["histograms"][name] = rows
+        return out
+
+    def write_json(self, path: str | Path) -> None:
+        Path(path).write_text(json.dumps(self.to_dict(), ensure_ascii=False, indent=2), encoding="utf-8")
+
+    def to_prometheus(self) -> str:
+        # Prometheus text exposition format(node_exporter textfile collector로 수집 가능)
+        data = self.to_dict()
+        lines = []
+
+        for kind, section in (("counter", "counters"), ("gauge", "gauges")):
+            for name, rows in data[section].items():
+                metric = f"{self.prefix}_{name}"
+                lines.append(f"# TYPE {metric} {kind}")
+                for r in rows:
+                    lines.append(f"{metric}{_prom_labels(_label_key(r['labels']))} {r['value']}")
+
+        for name, rows in data["histograms"].items():
+            metric = f"{self.prefix}_{name}"
+            lines.append(f"# TYPE {metric} histogram")
+            for r in rows:
+                key = _label_key(r["labels"])
+                for le, cum in r["buckets"].items():
+                    lines.append(f"{metric}_bucket{_prom_labels(key, (('le', le),))} {cum}")
+                lines.append(f"{metric}_sum{_prom_labels(key)} {r['sum']}")
+                lines.append(f"{metric}_count{_prom_labels(key)} {r['count']}")
+
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str | Path) -> None:
+        # 수집기가 쓰다 만 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+        path = Path(path)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_text(self.to_prometheus(), encoding="utf-8")
+        tmp.replace(path)
+
+
+# 프로세스 전체 공용 지표 수집기
+METRICS = Metrics()
@@ -1,8 +1,10 @@
+import os
 from pathlib import Path
 # common/paths.py 기준
 # __file__ = .../01/common/paths.py
 # PROJECT_ROOT = 상위 디렉터리 (data/와 01/이 위치한 루트)
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 
-DATA_DIR = PROJECT_ROOT / "06_data"
-DATA_DIR.mkdir(exist_ok=True)
\ No newline at end of file
+# 환경변수 CRAWL_DATA_DIR로 저장 위치를 바꿀 수 있다(부하 테스트가 06_data를 덮어쓰지 않도록)
+DATA_DIR = Path(os.environ.get("CRAWL_DATA_DIR") or PROJECT_ROOT / "06_data")
+DATA_DIR.mkdir(parents=True, exist_ok=True)
@@ -1,6 +1,11 @@
 import functools
 import time
 
+from .log import get_logger
+from .metrics import METRICS
+
+log = get_logger("progress")
+
 
 def progress_logger(label: str):
     """
@@ -16,7 +21,7 @@ def progress_logger(label: str):
         def wrapper(*args, **kwargs):
 
             # 함수 실행 시작 로그
-            print(f"[START] {label}")
+            log.debug("START %s", label)
 
             # 실행 시간 측정을 위한 시작 시각 기록
             start = time.time()
@@ -25,13 +30,16 @@ def progress_logger(label: str):
                 # 원본 함수 실행 후 실행 시간 계산 후 원본 함수 반환
                 result = func(*args, **kwargs)
                 elapsed = time.time() - start
-                print(f"[END] {label} ({elapsed:.2f}s)")
+                log.info("END %s (%.2fs)", label, elapsed, extra={"stage": label, "elapsed": elapsed})
+                METRICS.observe("stage_seconds", elapsed, stage=label)
                 return result
 
             except Exception as e:
                 # 예외 발생 시에도 경과 시간 계산
                 elapsed = time.time() - start
-                print(f"[ERROR] {label} failed ({elapsed:.2f}s): {e}")
+                log.error("%s failed (%.2fs): %s", label, elapsed, e, extra={"stage": label, "elapsed": elapsed})
+                METRICS.observe("stage_seconds", elapsed, stage=label)
+                METRICS.inc("stage_errors_total", stage=label)
 
                 # 예외를 숨기지 않고 다시 발생시켜 상위 로직에서 처리 가능하게 함
                 raise
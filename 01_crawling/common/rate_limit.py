@@ -0,0 +1,174 @@
+import threading
+import time
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """
+    초당 요청 수(rate)를 제한하는 토큰 버킷
+
+    - 토큰은 rate개/초 속도로 채워지고, 최대 capacity개까지 쌓인다.
+    - acquire()는 토큰이 생길 때까지 대기한 뒤 1개를 소비한다.
+    - 여러 스레드에서 동시에 호출해도 안전하다.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        if rate <= 0:
+            raise ValueError(f"rate는 0보다 커야 합니다: {rate}")
+
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+
+                # 마지막 갱신 이후 흐른 시간만큼 토큰 보충
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                # 토큰 1개가 찰 때까지 남은 시간
+                wait = (1 - self._tokens) / self.rate
+
+            # 락을 잡은 채로 자면 다른 스레드가 모두 멈추므로 락 밖에서 대기
+            time.sleep(wait)
+
+    def set_rate(self, rate: float) -> None:
+        # 속도 변경(지금까지 쌓인 토큰은 이전 속도로 계산한 뒤 새 속도 적용)
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self.rate = float(rate)
+
+
+class AdaptiveRateLimiter:
+    """
+    엔드포인트(호스트 + 경로)별로 요청 속도를 스스로 조절하는 AIMD 속도 제한기
+
+    - MARKET_URL / LIST_URL / 상세(mycar_view) 페이지처럼 경로가 다르면 상태를 따로 둔다.
+    - 정상 응답(2xx/3xx, 지연시간 latency_target 이하):
+      요청마다 rate += step / rate → 초당 약 step씩 증가(Additive Increase)
+    - 429/503, 타임아웃/연결 오류, 지연시간 초과:
+      rate *= decrease (Multiplicative Decrease)
+      (동시에 진행 중이던 요청들의 실패로 여러 번 깎이지 않도록 cooldown_sec에 한 번만)
+    - rate는 항상 [min_rate, max_rate] 범위를 유지한다.
+    """
+
+    # 서버가 "느리게 보내라"는 뜻으로 보는 상태코드
+    THROTTLE_STATUS = (429, 503)
+
+    def __init__(
+        self,
+        rate: float,
+        min_rate: float,
+        max_rate: float,
+        step: float = 0.5,
+        decrease: float = 0.5,
+        latency_target: float = 2.0,
+        cooldown_sec: float = 1.0,
+        capacity: float = 1.0,
+    ):
+        if not 0 < min_rate <= rate <= max_rate:
+            raise ValueError(f"0 < min_rate <= rate <= max_rate 이어야 합니다: {min_rate}, {rate}, {max_rate}")
+
+        self.initial_rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.step = step
+        self.decrease = decrease
+        self.latency_target = latency_target
+        self.cooldown_sec = cooldown_sec
+        self.capacity = capacity
+
+        self._endpoints: dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def endpoint_of(url: str) -> str:
+        u = urlparse(url)
+        return f"{u.netloc}{u.path}"
+
+    def _state(self, url: str) -> dict:
+        key = self.endpoint_of(url)
+        with self._lock:
+            st = self._endpoints.get(key)
+            if st is None:
+                st = {
+                    "bucket": TokenBucket(self.initial_rate, self.capacity),
+                    "rate": self.initial_rate,
+                    "last_decrease": 0.0,
+                    "ok": 0,
+                    "throttled": 0,
+                    "increases": 0,
+                    "decreases": 0,
+                }
+                self._endpoints[key] = st
+            return st
+
+    def acquire(self, url: str) -> None:
+        self._state(url)["bucket"].acquire()
+
+    def record(self, url: str, latency: float, status: int | None = None, error: bool = False) -> None:
+        """
+        응답 결과를 반영해 해당 엔드포인트의 속도를 조절한다.
+
+        :param latency: 요청 시작부터 응답까지 걸린 시간(초)
+        :param status: 응답 상태코드(응답이 없으면 None)
+        :param error: 타임아웃/연결 오류 여부
+        """
+        st = self._state(url)
+        congested = error or status in self.THROTTLE_STATUS or latency > self.latency_target
+
+        with self._lock:
+            now = time.monotonic()
+            if congested:
+                st["throttled"] += 1
+                if now - st["last_decrease"] < self.cooldown_sec:
+                    return
+                st["last_decrease"] = now
+                st["decreases"] += 1
+                new_rate = max(self.min_rate, st["rate"] * self.decrease)
+            else:
+                st["ok"] += 1
+                if st["rate"] >= self.max_rate:
+                    return
+                st["increases"] += 1
+                new_rate = min(self.max_rate, st["rate"] + self.step / st["rate"])
+
+            st["rate"] = new_rate
+
+        st["bucket"].set_rate(new_rate)
+
+    def scale(self, factor: float) -> None:
+        """
+        속도 범위(시작/최소/최대)와 현재 속도를 factor배로 바꾼다.
+        여러 프로세스가 같은 사이트를 나눠 수집할 때 각자 전체 예산의 일부만 쓰게 한다.
+        """
+        with self._lock:
+            self.initial_rate *= factor
+            self.min_rate *= factor
+            self.max_rate *= factor
+            self.step *= factor
+            states = list(self._endpoints.values())
+            for st in states:
+                st["rate"] *= factor
+
+        for st in states:
+            st["bucket"].set_rate(st["rate"])
+
+    def stats(self) -> dict:
+        # 엔드포인트별 현재 속도와 증가/감소 횟수
+        with self._lock:
+            return {
+                key: {k: (round(v, 2) if k == "rate" else v) for k, v in st.items() if k not in ("bucket", "last_decrease")}
+                for key, st in self._endpoints.items()
+            }
@@ -0,0 +1,133 @@
+import csv
+import math
+import threading
+from pathlib import Path
+
+import pandas as pd
+
+from .metrics import METRICS
+
+
+def _norm_key_value(v) -> str:
+    """
+    중복 제거 키 비교용 값 정규화
+
+    - None / NaN / 빈 문자열 -> ""
+    - 정수로 떨어지는 숫자("123", "123.0", 123, 123.0) -> "123"
+    - 그 외는 문자열 그대로
+    """
+    if v is None:
+        return ""
+    if isinstance(v, float) and math.isnan(v):
+        return ""
+    if v is pd.NA:
+        return ""
+
+    t = str(v).strip()
+    try:
+        f = float(t)
+    except ValueError:
+        return t
+    if math.isnan(f):
+        return ""
+    return str(int(f)) if f.is_integer() else t
+
+
+def _cell(v):
+    # CSV에 쓸 값(결측은 빈 칸)
+    if v is None or v is pd.NA:
+        return ""
+    if isinstance(v, float) and math.isnan(v):
+        return ""
+    return v
+
+
+class ReferenceStore:
+    """
+    기준정보 CSV(makers/models/generations/terms)용 append 저장소
+
+    - 처음 한 번만 기존 CSV를 읽어 dedup_keys 인덱스(set)를 만든다.
+    - upsert()는 인덱스에 없는 row만 CSV 끝에 덧붙인다. → O(batch)
+      (기존 데이터가 우선: 예전 read-merge-drop_duplicates(keep="first")와 같은 결과)
+    - CSV 자체가 항상 최신 상태이므로, DataFrame이 필요할 때만 to_dataframe()으로 읽는다.
+    - 여러 스레드에서 동시에 upsert해도 안전하다.
+    """
+
+    def __init__(self, path: str | Path, dedup_keys: list[str], encoding: str = "utf-8"):
+        self.path = Path(path)
+        self.dedup_keys = dedup_keys
+        self.encoding = encoding
+
+        self.columns: list[str] | None = None
+        self._index: set[tuple] = set()
+        self._lock = threading.Lock()
+
+        self._load_index()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def _key(self, row: dict) -> tuple:
+        return tuple(_norm_key_value(row.get(k)) for k in self.dedup_keys)
+
+    def _load_index(self) -> None:
+        if not self.path.exists() or self.path.stat().st_size == 0:
+            return
+
+        with open(self.path, newline="", encoding=self.encoding) as f:
+            reader = csv.DictReader(f)
+            self.columns = list(reader.fieldnames or [])
+            for row in reader:
+                self._index.add(self._key(row))
+
+    def _rewrite_with_columns(self, columns: list[str]) -> None:
+        # 새 컬럼이 생긴 경우에만 전체를 한 번 다시 씀(드문 경우)
+        old_df = pd.read_csv(self.path, encoding=self.encoding, dtype=str, keep_default_na=False)
+        old_df.reindex(columns=columns).to_csv(self.path, index=False, encoding=self.encoding)
+        self.columns = columns
+
+    def upsert(self, df: pd.DataFrame) -> int:
+        """
+        df에서 인덱스에 없는 row만 CSV에 덧붙이고, 추가된 row 수를 반환한다.
+        """
+        missing = [k for k in self.dedup_keys if k not in df.columns]
+        if missing:
+            raise ValueError(f"dedup_keys에 없는 컬럼이 포함됨: {missing}")
+
+        with self._lock:
+            if self.columns is not None:
+                extra = [c for c in df.columns if c not in self.columns]
+                if extra:
+                    self._rewrite_with_columns(self.columns + extra)
+
+            # 같은 batch 안의 중복도 첫 번째만 남김
+            new_rows = []
+            for row in df.to_dict("records"):
+                key = self._key(row)
+                if key in self._index:
+                    continue
+                self._index.add(key)
+                new_rows.append(row)
+
+            if not new_rows:
+                return 0
+
+            is_new = self.columns is None
+            if is_new:
+                self.columns = list(df.columns)
+
+            with METRICS.timer("csv_write_seconds", file=self.path.name):
+                with open(self.path, "a", newline="", encoding=self.encoding) as f:
+                    writer = csv.DictWriter(f, fieldnames=self.columns, extrasaction="ignore")
+                    if is_new:
+                        writer.writeheader()
+                    writer.writerows({k: _cell(v) for k, v in row.items()} for row in new_rows)
+            METRICS.inc("rows_written_total", len(new_rows), file=self.path.name)
+
+            return len(new_rows)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        # 필요할 때만 CSV 전체를 DataFrame으로 읽음
+        if not self.path.exists():
+            return pd.DataFrame(columns=self.columns or [])
+        return pd.read_csv(self.path, encoding=self.encoding)
@@ -0,0 +1,67 @@
+import csv
+import os
+from pathlib import Path
+from typing import Callable
+
+from .metrics import METRICS
+
+
+class CsvRowSink:
+    """
+    row(dict)를 batch_size개씩 모아 CSV 끝에 덧붙이는 스트리밍 저장기
+
+    - 헤더는 columns 순서로 고정하고, 파일이 새로 만들어질 때만 쓴다.
+    - columns에 없는 키는 버리고, 없는 컬럼은 빈 값으로 쓴다.
+    - 메모리에는 아직 쓰지 않은 batch만 유지하므로 수집 규모와 무관하게 일정하다.
+    - on_flush: batch가 디스크에 기록된 직후 그 row 목록으로 호출된다(체크포인트 기록용).
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        columns: list[str],
+        batch_size: int = 200,
+        encoding: str = "utf-8-sig",
+        on_flush: Callable[[list[dict]], None] | None = None,
+    ):
+        self.path = Path(path)
+        self.columns = columns
+        self.batch_size = batch_size
+        self.on_flush = on_flush
+        self.rows_written = 0
+        self._buf: list[dict] = []
+
+        is_new = not self.path.exists() or os.path.getsize(self.path) == 0
+        self._fp = open(self.path, "a", newline="", encoding=encoding)
+        self._writer = csv.DictWriter(self._fp, fieldnames=columns, extrasaction="ignore")
+        if is_new:
+            self._writer.writeheader()
+
+    def write(self, row: dict) -> None:
+        self._buf.append(row)
+        if len(self._buf) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._buf:
+            return
+
+        batch, self._buf = self._buf, []
+        with METRICS.timer("csv_write_seconds", file=self.path.name):
+            self._writer.writerows(batch)
+            self._fp.flush()
+        self.rows_written += len(batch)
+        METRICS.inc("rows_written_total", len(batch), file=self.path.name)
+
+        if self.on_flush is not None:
+            self.on_flush(batch)
+
+    def close(self) -> None:
+        self.flush()
+        self._fp.close()
+
+    def __enter__(self) -> "CsvRowSink":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
@@ -0,0 +1,74 @@
+import hashlib
+import threading
+from array import array
+from pathlib import Path
+from urllib.parse import urlparse, parse_qs
+
+
+def listing_id(url: str) -> int:
+    """
+    매물 URL을 64bit 정수 키로 바꾼다.
+
+    - mycar_view.php?no=123 → 123 (같은 매물이면 쿼리 순서/부가 파라미터와 무관하게 같은 키)
+    - no= 가 없으면 URL의 blake2b 8바이트 해시(최상위 비트를 켜서 숫자 id와 겹치지 않게 함)
+    """
+    no = parse_qs(urlparse(url).query).get("no")
+    if no and no[0].isdigit():
+        return int(no[0])
+    digest = hashlib.blake2b(url.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little") | (1 << 63)
+
+
+class SeenUrlSet:
+    """
+    실행 전체에서 공유하는 "이미 상세를 요청한 매물" 집합
+
+    - 같은 매물이 여러 카탈로그 row(세부모델) 아래에 나와도 상세 페이지는 한 번만 요청한다.
+    - claim(url): 처음 보는 매물이면 True(이 호출자가 수집), 이미 있으면 False(건너뜀)
+    - commit(urls): 결과 row가 파일에 기록된 매물만 디스크에 남긴다(uint64 배열, append-only).
+      → 중간에 죽고 재시작해도 기록된 매물은 다시 요청하지 않고,
+        claim만 하고 기록 못 한 매물은 재시작 후 다시 수집한다.
+    - 여러 스레드에서 동시에 호출해도 안전하다.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._ids: set[int] = set()
+        self._lock = threading.Lock()
+        self.stats = {"loaded": 0, "claimed": 0, "duplicates": 0}
+
+        if self.path.exists():
+            ids = array("Q")
+            data = self.path.read_bytes()
+            # 쓰다가 잘린 마지막 항목은 무시
+            ids.frombytes(data[: len(data) - len(data) % ids.itemsize])
+            self._ids.update(ids)
+            self.stats["loaded"] = len(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, url: str) -> bool:
+        return listing_id(url) in self._ids
+
+    def claim(self, url: str) -> bool:
+        key = listing_id(url)
+        with self._lock:
+            if key in self._ids:
+                self.stats["duplicates"] += 1
+                return False
+            self._ids.add(key)
+            self.stats["claimed"] += 1
+            return True
+
+    def commit(self, urls) -> None:
+        ids = array("Q", (listing_id(u) for u in urls))
+        if not ids:
+            return
+        with self._lock:
+            with open(self.path, "ab") as f:
+                ids.tofile(f)
+
+    def remove(self) -> None:
+        # 정상 종료 후 정리(다음 실행은 빈 집합으로 시작)
+        self.path.unlink(missing_ok=True)
@@ -0,0 +1,89 @@
+import csv
+import os
+import zlib
+from pathlib import Path
+
+from .row_sink import CsvRowSink
+
+
+def parse_shard(spec: str) -> tuple[int, int]:
+    """
+    "i/N" 형식의 샤드 지정을 (i, N)으로 바꾼다. (0 <= i < N)
+    """
+    try:
+        i, n = (int(x) for x in spec.split("/"))
+    except ValueError:
+        raise ValueError(f"샤드는 'i/N' 형식이어야 합니다: {spec}") from None
+    if not 0 <= i < n:
+        raise ValueError(f"샤드 번호는 0 <= i < N 이어야 합니다: {spec}")
+    return i, n
+
+
+def shard_of(gubun: str, maker_no: int, n: int) -> int:
+    # (gubun, maker_no) 기준 샤드 번호(crc32 → 프로세스/머신이 달라도 항상 같은 값)
+    return zlib.crc32(f"{gubun}:{int(maker_no)}".encode("utf-8")) % n
+
+
+def shard_path(path: str, shard: tuple[int, int] | None) -> str:
+    """
+    샤드별 파일명: "bobaedream_all.csv" → "bobaedream_all.shard0of4.csv"
+    (shard가 None이면 원래 이름)
+    """
+    if shard is None:
+        return path
+    i, n = shard
+    p = Path(path)
+    return str(p.with_name(f"{p.stem}.shard{i}of{n}{p.suffix}"))
+
+
+def merge_shards(
+    paths: list[str],
+    out_path: str,
+    key: str = "detail_url",
+    encoding: str = "utf-8-sig",
+) -> dict:
+    """
+    샤드별 결과 CSV를 하나로 합치고 key(detail_url) 기준으로 중복을 제거한다.
+
+    - 샤드 순서 → 파일 안의 row 순서대로 첫 번째 row를 남긴다.
+    - 다른 샤드에 살아 있는 매물이면 delisted row는 버린다(살아 있는 row 우선).
+    - 메모리에는 key 집합만 두고 row는 스트리밍으로 옮긴다.
+    - 임시 파일에 쓴 뒤 out_path로 교체한다.
+
+    :return: {"shards", "rows_in", "rows_out", "duplicates"}
+    """
+    existing = [p for p in paths if os.path.exists(p)]
+    missing = [p for p in paths if p not in existing]
+    if missing:
+        raise FileNotFoundError(f"샤드 결과 파일이 없습니다: {missing}")
+
+    with open(existing[0], newline="", encoding=encoding) as f:
+        columns = next(csv.reader(f))
+
+    def _rows():
+        for p in existing:
+            with open(p, newline="", encoding=encoding) as f:
+                yield from csv.DictReader(f)
+
+    tmp = f"{out_path}.merge"
+    if os.path.exists(tmp):
+        os.remove(tmp)
+
+    seen: set[str] = set()
+    stats = {"shards": len(existing), "rows_in": 0, "rows_out": 0, "duplicates": 0}
+    with CsvRowSink(tmp, columns, batch_size=1000, encoding=encoding) as sink:
+        # 1) 살아 있는 매물 먼저, 2) 어느 샤드에도 없는 delisted 매물
+        for want_delisted in (False, True):
+            for row in _rows():
+                if (row.get("listing_status") == "delisted") != want_delisted:
+                    continue
+                stats["rows_in"] += 1
+                if row[key] in seen:
+                    stats["duplicates"] += 1
+                    continue
+                seen.add(row[key])
+                sink.write(row)
+    stats["rows_out"] = sink.rows_written
+
+    os.replace(tmp, out_path)
+    return stats
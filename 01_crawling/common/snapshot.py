@@ -0,0 +1,49 @@
+import csv
+from pathlib import Path
+
+
+def load_snapshot(path: str | Path, encoding: str = "utf-8-sig") -> dict[str, dict]:
+    """
+    이전 실행 결과 CSV(OUT_CSV)를 detail_url -> row(dict) 형태로 읽는다.
+
+    - 증분 수집(incremental)에서 "어제와 같은 매물인지" 비교하는 기준으로 쓴다.
+    - 값은 CSV 원문 문자열 그대로 유지한다(다시 저장할 때 타입이 바뀌지 않도록).
+    - 파일이 없으면 빈 dict를 반환한다.
+    - 이미 delisted로 기록된 row는 기준에서 제외한다.
+    """
+    path = Path(path)
+    if not path.exists():
+        return {}
+
+    snapshot = {}
+    with open(path, newline="", encoding=encoding) as f:
+        for row in csv.DictReader(f):
+            if row.get("listing_status") == "delisted":
+                continue
+            snapshot[row["detail_url"]] = row
+    return snapshot
+
+
+def read_column(path: str | Path, column: str, encoding: str = "utf-8-sig") -> set[str]:
+    # CSV에서 한 컬럼 값만 집합으로 읽는다(나머지 컬럼은 메모리에 올리지 않음).
+    path = Path(path)
+    if not path.exists():
+        return set()
+
+    with open(path, newline="", encoding=encoding) as f:
+        return {row[column] for row in csv.DictReader(f)}
+
+
+def _price_key(v) -> int | None:
+    # "1,234" / "1234.0" / 1234 / "" / None 을 같은 기준으로 맞춘다.
+    if v is None:
+        return None
+    t = str(v).replace(",", "").strip()
+    if not t or t.lower() == "nan":
+        return None
+    return int(float(t))
+
+
+def same_list_price(prev, curr) -> bool:
+    # 목록 가격(list_price_wan)이 이전 스냅샷과 같은지 비교
+    return _price_key(prev) == _price_key(curr)
@@ -4,16 +4,48 @@
 # - 파일명(CATALOG_CSV/OUT_CSV)은 고정값으로 관리한다.
 # ============================================================
 
-BASE = "https://bobaedream.co.kr"
+import os
+
+# 베이스 URL
+# - 환경변수 BOBAEDREAM_BASE를 지정하면 그 주소로 요청한다(로컬 mock 서버 부하 테스트용, bench/mock_server.py)
+# - REF_LIST_URL: 기준정보(BobeCar)가 쓰는 목록 페이지(www 호스트)
+BASE = os.environ.get("BOBAEDREAM_BASE", "https://bobaedream.co.kr").rstrip("/")
 MARKET_URL = f"{BASE}/dealguide/market_price_new.php"
 LIST_URL = f"{BASE}/mycar/mycar_list.php"
+REF_LIST_URL = os.environ.get("BOBAEDREAM_BASE", "https://www.bobaedream.co.kr").rstrip("/") + "/mycar/mycar_list.php"
 
 # 카탈로그/결과 CSV 파일명
 CATALOG_CSV = "catalog_all.csv"
 OUT_CSV = "bobaedream_all.csv"
 
+# 체크포인트(재시작용) 파일명
+# - JOURNAL_FILE: 완료된 세부모델/상세 URL 기록(append-only)
+# - PART_CSV: 수집된 row를 바로바로 덧붙이는 중간 결과
+# - SEEN_FILE: 이번 실행에서 이미 기록한 매물 id(no=) 집합(세부모델 간 중복 상세 요청 방지)
+JOURNAL_FILE = "crawl_journal.jsonl"
+PART_CSV = "bobaedream_all.part.csv"
+SEEN_FILE = "crawl_seen.bin"
+
+# 실행 지표(요청 수/바이트/지연시간/파싱 시간/CSV 기록 시간) 내보내기 파일
+# - METRICS_PROM은 Prometheus text format(node_exporter textfile collector용)
+METRICS_JSON = "crawl_metrics.json"
+METRICS_PROM = "crawl_metrics.prom"
+
+# 응답 원문 보관소(run_all --archive) / 재파싱 결과 파일명
+ARCHIVE_DIR = "html_archive"
+REPLAY_CSV = "replay_detail.csv"
+
 # 목록 페이지 조회 옵션
+# - VIEW_SIZE: 기본 페이지 크기(협상 전/협상 실패 시 사용)
+# - VIEW_SIZE_CANDIDATES: 크게 받을 수 있는지 시험해볼 페이지 크기(큰 값부터)
+# - VIEW_SIZE_CACHE: 협상으로 찾은 최대 페이지 크기 저장 파일(VIEW_SIZE_CACHE_TTL_SEC 동안 재사용)
 VIEW_SIZE = 20
+VIEW_SIZE_CANDIDATES = (100, 70, 50, 40, 30)
+VIEW_SIZE_CACHE = "view_size.json"
+VIEW_SIZE_CACHE_TTL_SEC = 7 * 24 * 60 * 60
+
+# HTML 파서 백엔드(lxml이 없으면 html.parser로 대체)
+HTML_PARSER = "lxml"
 
 # 요청 헤더
 HEADERS = {
@@ -23,4 +55,55 @@ HEADERS = {
 }
 
 # 요청 간격(서버 부하/차단 방지용)
-SLEEP_SEC = 0.25
\ No newline at end of file
+SLEEP_SEC = 0.25
+
+# 상세 페이지 동시 요청 수(동시에 진행 중인 요청 개수)
+DETAIL_WORKERS = 8
+
+# 카탈로그(제조사별 페이지) 동시 요청 수
+CATALOG_WORKERS = 4
+
+# 기준정보 등급/트림(BobeCar.get_generation_terms_bulk) 동시 요청 수
+TERM_WORKERS = 8
+
+# 기준정보 파이프라인(reference_pipeline.py) 제조사/모델/세대 단계별 worker 수
+# (등급/트림 단계는 TERM_WORKERS 사용)
+REF_WORKERS = 4
+
+# 엔드포인트당 초당 요청 수 시작값(SLEEP_SEC 간격과 같은 요청 속도, 이후 적응형으로 조절)
+RATE_PER_SEC = 1 / SLEEP_SEC
+
+# 적응형 요청 속도(AIMD, common/rate_limit.py AdaptiveRateLimiter)
+# - RATE_PER_SEC에서 시작해 정상 응답이면 초당 약 RATE_STEP씩 올리고,
+#   429/503/타임아웃/지연 초과(RATE_LATENCY_TARGET_SEC)면 RATE_DECREASE배로 낮춘다.
+# - 엔드포인트(MARKET_URL / LIST_URL / 상세 페이지)별로 따로 조절하며
+#   [RATE_MIN_PER_SEC, RATE_MAX_PER_SEC] 범위를 벗어나지 않는다.
+# - 제한은 엔드포인트(호스트 + 경로)별이다. 사이트가 받는 전체 요청 수는 엔드포인트 수만큼 합산된다.
+#   run_all(MARKET_URL / LIST_URL / 상세 페이지 3개): 프로세스 하나 기준 최대 3 × RATE_MAX_PER_SEC(= 48회/초),
+#   시작값은 3 × RATE_PER_SEC. 기준정보 수집(REF_LIST_URL 1개)은 최대 RATE_MAX_PER_SEC.
+#   (run_all --processes N은 set_rate_share로 프로세스마다 1/N씩 나눠 같은 상한 유지)
+# - 429/5xx 재시도(HTTP_RETRIES)도 매번 이 제한을 통과하므로 상한에 포함된다.
+RATE_MIN_PER_SEC = 0.5
+RATE_MAX_PER_SEC = 16.0
+RATE_STEP = 0.5
+RATE_DECREASE = 0.5
+RATE_LATENCY_TARGET_SEC = 3.0
+
+# 공유 HTTP 세션 설정(common/http.py)
+# - HTTP_POOL_SIZE: 호스트당 keep-alive 연결 수(동시 요청 수보다 작으면 연결을 새로 맺음)
+# - HTTP_RETRIES / HTTP_BACKOFF_SEC: 429/5xx 재시도 횟수와 지수 백오프 기본 간격
+HTTP_POOL_SIZE = DETAIL_WORKERS * 2
+HTTP_RETRIES = 3
+HTTP_BACKOFF_SEC = 0.5
+HTTP_TIMEOUT = 30
+
+# 카탈로그/제조사/모델 페이지용 HTTP 캐시(ETag/Last-Modified + TTL)
+# - TTL 이내면 요청 없이 캐시 사용, 지나면 조건부 요청으로 재검증
+HTTP_CACHE_DIR = "http_cache"
+HTTP_CACHE_TTL_SEC = 6 * 60 * 60
+
+# 로그 설정(common/log.py)
+# - LOG_LEVEL: DEBUG면 요청 1건마다 로그, INFO면 진행 상황만(환경변수 CRAWL_LOG_LEVEL로 변경)
+# - LOG_JSON: True면 JSON 한 줄 형식(환경변수 CRAWL_LOG_JSON=1)
+LOG_LEVEL = os.environ.get("CRAWL_LOG_LEVEL", "INFO")
+LOG_JSON = os.environ.get("CRAWL_LOG_JSON", "0") == "1"
@@ -5,12 +5,27 @@
 # - crawl_one_detail()은 "세부모델(detail_no)" 단위로 페이지를 순회한다.
 # ============================================================
 
+import json
+import math
 import re
 import time
-import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
-from config import BASE, MARKET_URL, LIST_URL, HEADERS, VIEW_SIZE, SLEEP_SEC
+from collections import deque
+from typing import Iterator
+from bs4 import BeautifulSoup, SoupStrainer
+from concurrent.futures import Future, ThreadPoolExecutor
+from urllib.parse import urljoin, urlparse
+from config import (
+    BASE, MARKET_URL, LIST_URL, DETAIL_WORKERS,
+    VIEW_SIZE, VIEW_SIZE_CANDIDATES, VIEW_SIZE_CACHE, VIEW_SIZE_CACHE_TTL_SEC,
+)
+from common.http import http_get
+from common.log import get_logger
+from common.metrics import METRICS
+from common.seen_set import SeenUrlSet
+from common.snapshot import same_list_price
+from parsers.html import make_soup, DETAIL_STRAINER
+
+log = get_logger("crawl_market_list")
 
 
 # ============================================================
@@ -30,15 +45,19 @@ def to_int_num(s: str) -> int | None:
 
 # ============================================================
 # 2. 네트워크 요청(fetch)
-# - requests.get으로 페이지를 받아 soup로 반환한다.
+# - 공유 세션(common.http)으로 페이지를 받아 soup로 반환한다.
 # - 상태코드/최종 URL을 출력하고, 오류는 예외로 올린다.
+# - 요청 속도는 공유 세션의 호스트별 토큰 버킷(common.http.LIMITER)이 제한한다.
+#   여러 스레드가 동시에 호출해도 사이트가 보는 요청 속도는 같다.
+# - parse_only를 주면 해당 태그 하위 트리만 파싱한다(parsers.html 참고).
 # ============================================================
 
-def fetch(url: str, params: dict | None = None) -> BeautifulSoup:
-    r = requests.get(url, params=params, headers=HEADERS, timeout=30, allow_redirects=True)
-    print("[HTTP]", r.status_code, r.url)
-    r.raise_for_status()
-    return BeautifulSoup(r.text, "html.parser")
+def fetch(url: str, params: dict | None = None, parse_only: SoupStrainer | None = None) -> BeautifulSoup:
+    r = http_get(url, params=params)
+    # 요청 1건마다 남는 로그이므로 DEBUG(기본 INFO에서는 포맷팅 없이 버려짐)
+    log.debug("HTTP %s %s", r.status_code, r.url, extra={"status": r.status_code, "url": r.url})
+    with METRICS.timer("soup_seconds", endpoint=urlparse(url).path):
+        return make_soup(r.text, parse_only=parse_only)
 
 
 # ============================================================
@@ -50,7 +69,14 @@ def fetch(url: str, params: dict | None = None) -> BeautifulSoup:
 #   3) 페이징 영역에서 마지막 페이지 추정
 # ============================================================
 
-def build_list_params(gubun: str, maker_no: int, group_no: int, detail_no: int, page: int) -> dict:
+def build_list_params(
+    gubun: str,
+    maker_no: int,
+    group_no: int,
+    detail_no: int,
+    page: int,
+    view_size: int | None = None,
+) -> dict:
     return {
         "gubun": gubun,
         "maker_no": maker_no,
@@ -58,19 +84,22 @@ def build_list_params(gubun: str, maker_no: int, group_no: int, detail_no: int,
         "model_no[]": detail_no,
         "page": page,
         "order": "S11",
-        "view_size": VIEW_SIZE,
+        "view_size": view_size or _view_size,
     }
 
 
 def parse_list_page(soup: BeautifulSoup) -> tuple[list[dict], int]:
     items = []
 
-    # 목록 DOM은 케이스가 달라질 수 있어 선택자를 넓게 잡되,
-    # 실제로는 mycar_view 링크가 있는 li만 수집한다.
-    for li in soup.select("ul.list-car > li, div.list-body ul > li, li"):
-        a = li.select_one("div.mode-cell.title a[href^='/mycar/mycar_view']")
-        if not a:
+    # 목록 DOM은 케이스가 달라질 수 있어 li 구조에 기대지 않고,
+    # mycar_view 링크(제목 셀)를 먼저 찾은 뒤 그 링크를 감싼 li만 본다.
+    # (페이지의 모든 li를 돌며 하위 검색을 반복하지 않음)
+    seen_li = set()
+    for a in soup.select("div.mode-cell.title a[href^='/mycar/mycar_view']"):
+        li = a.find_parent("li")
+        if li is None or id(li) in seen_li:
             continue
+        seen_li.add(id(li))
 
         detail_link = a.get("href")
         title = a.get_text(strip=True)
@@ -125,6 +154,80 @@ def parse_list_page(soup: BeautifulSoup) -> tuple[list[dict], int]:
     return items, last_page
 
 
+# ============================================================
+# 3-1. 목록 페이지 크기(view_size) 협상
+# - 한 페이지에 많이 받을수록 목록 요청 수와 페이지당 오버헤드가 줄어든다.
+# - 매물이 충분히 많은 세부모델 1개로 큰 view_size부터 1페이지를 요청해 보고,
+#   parse_list_page 결과가 정확히 view_size개면 서버가 그 크기를 지원하는 것으로 본다.
+#   (서버가 무시하거나 상한으로 잘라내면 개수가 모자람)
+# - 찾은 값은 VIEW_SIZE_CACHE에 저장해 TTL 동안 재사용한다.
+# - 협상 전/실패 시에는 VIEW_SIZE를 쓴다.
+# ============================================================
+
+_view_size = VIEW_SIZE
+
+
+def current_view_size() -> int:
+    return _view_size
+
+
+def set_view_size(n: int) -> None:
+    global _view_size
+    _view_size = n
+
+
+def _load_cached_view_size(path: str) -> int | None:
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    if time.time() - data.get("probed_at", 0) > VIEW_SIZE_CACHE_TTL_SEC:
+        return None
+    return data.get("view_size")
+
+
+def negotiate_view_size(
+    gubun: str,
+    maker_no: int,
+    group_no: int,
+    detail_no: int,
+    detail_count: int | None,
+    candidates: tuple[int, ...] = VIEW_SIZE_CANDIDATES,
+    cache_path: str = VIEW_SIZE_CACHE,
+) -> int:
+    """
+    지원되는 가장 큰 view_size를 찾아 적용하고 반환한다.
+
+    :param gubun, maker_no, group_no, detail_no: 시험에 쓸 세부모델(매물이 많은 것)
+    :param detail_count: 시험 세부모델의 매물 수(이보다 큰 후보는 검증할 수 없어 제외)
+    """
+    cached = _load_cached_view_size(cache_path)
+    if cached:
+        set_view_size(cached)
+        log.info("view_size cached: %d", cached)
+        return cached
+
+    best = VIEW_SIZE
+    for n in sorted(candidates, reverse=True):
+        if n <= VIEW_SIZE or (detail_count is not None and detail_count < n):
+            continue
+
+        params = build_list_params(gubun, maker_no, group_no, detail_no, page=1, view_size=n)
+        items, _ = parse_list_page(fetch(LIST_URL, params=params))
+        log.info("view_size probe %d: items=%d", n, len(items))
+        if len(items) == n:
+            best = n
+            break
+
+    set_view_size(best)
+    if best > VIEW_SIZE:
+        with open(cache_path, "w", encoding="utf-8") as f:
+            json.dump({"view_size": best, "probed_at": time.time()}, f)
+    log.info("view_size using: %d", best)
+    return best
+
+
 # ============================================================
 # 4. 상세 페이지 파싱 보조(리스/렌트 개월수)
 # - "36 / 48개월" 형태에서 (remain, total)을 최대한 견고하게 추출한다.
@@ -151,11 +254,17 @@ def parse_remain_total_months(text: str) -> tuple[int | None, int | None]:
 # - 가격 박스(info-price)에서 일반 매물 가격 또는 렌트/리스 항목을 파싱한다.
 # - 스펙 테이블(table)에서 연식/주행거리/연료/변속기/색상/배기량을 파싱한다.
 # - 최초등록일(dd.txt-bar.cg)도 있으면 추출한다.
+# - parse_detail_soup은 네트워크 없이 soup만 파싱한다(벤치마크/재파싱용).
 # ============================================================
 
 def parse_detail_page(detail_url: str) -> dict:
-    soup = fetch(detail_url)
+    # 가격 박스/스펙 테이블/최초등록일 하위 트리만 파싱
+    soup = fetch(detail_url, parse_only=DETAIL_STRAINER)
+    with METRICS.timer("parse_seconds", page="detail"):
+        return parse_detail_soup(soup)
+
 
+def parse_detail_soup(soup: BeautifulSoup) -> dict:
     title = None
     price_wan = None
 
@@ -269,52 +378,191 @@ def parse_detail_page(detail_url: str) -> dict:
 
 
 # ============================================================
-# 6. detail_no 단위 수집(crawl_one_detail)
-# - 1) 1페이지를 요청해 last_page를 추정
-# - 2) 2..last_page까지 목록을 순회하며 detail_url 목록을 누적
-# - 3) 각 detail_url을 상세 파싱해 row를 만들고, 카탈로그 계층 ID를 붙여 반환
+# 6. 목록 페이지 계획(plan_list_pages / fetch_list_items)
+# - 카탈로그의 detail_count(매물 수)와 view_size로 필요한 페이지 수를 미리 계산한다.
+#   → 1페이지를 받아 last_page를 알아낼 때까지 기다리지 않고 모든 목록 페이지를 동시에 요청
+# - detail_count가 0이면 목록 요청 자체를 하지 않는다.
+# - detail_count를 모르거나(None) 받은 페이지의 페이징이 계획보다 길면(카탈로그 이후 매물 증가)
+#   페이징 링크로 남은 페이지를 찾아 이어서 요청한다(fallback).
 # ============================================================
 
-def crawl_one_detail(
+def plan_list_pages(detail_count: int | None, view_size: int | None = None) -> int | None:
+    # 예상 목록 페이지 수(모르면 None)
+    if detail_count is None:
+        return None
+    return math.ceil(max(0, detail_count) / (view_size or _view_size))
+
+
+def fetch_list_items(
     gubun: str,
     maker_no: int,
     group_no: int,
     detail_no: int,
-    max_pages: int | None = None
+    pool: ThreadPoolExecutor,
+    detail_count: int | None = None,
+    max_pages: int | None = None,
 ) -> list[dict]:
-    params = build_list_params(gubun, maker_no, group_no, detail_no, page=1)
-    soup = fetch(LIST_URL, params=params)
-    items, last_page = parse_list_page(soup)
+    """
+    세부모델의 목록 페이지를 모두 받아 매물 목록(페이지 순서)을 반환한다.
 
-    if max_pages is not None:
-        last_page = min(last_page, max_pages)
+    :param pool: 목록 페이지 요청에 쓸 스레드 풀(상세 요청과 같은 풀을 공유)
+    :param detail_count: 카탈로그 매물 수(None이면 페이징 탐색)
+    :param max_pages: 최대 페이지 수 제한(테스트용)
+    """
+    planned = plan_list_pages(detail_count)
+    if planned == 0:
+        return []
 
-    for p in range(2, last_page + 1):
-        time.sleep(SLEEP_SEC)
+    def _page(p: int) -> tuple[list[dict], int]:
         params = build_list_params(gubun, maker_no, group_no, detail_no, page=p)
-        soup_p = fetch(LIST_URL, params=params)
-        page_items, _ = parse_list_page(soup_p)
-        items.extend(page_items)
+        soup = fetch(LIST_URL, params=params)
+        with METRICS.timer("parse_seconds", page="list"):
+            return parse_list_page(soup)
+
+    def _cap(n: int) -> int:
+        return n if max_pages is None else min(n, max_pages)
+
+    # 1) 계획한 페이지(모르면 1페이지만)를 동시에 요청
+    fetched = _cap(planned or 1)
+    pages = list(pool.map(_page, range(1, fetched + 1)))
+
+    # 2) 페이징이 계획보다 길면 남은 페이지를 이어서 요청(페이징 링크가 일부만 보일 수 있어 반복)
+    while True:
+        last_page = _cap(max(lp for _, lp in pages))
+        if last_page <= fetched:
+            break
+        pages.extend(pool.map(_page, range(fetched + 1, last_page + 1)))
+        fetched = last_page
+
+    items = [it for page_items, _ in pages for it in page_items]
+
+    if planned is not None and (fetched != planned or len(items) != detail_count):
+        log.info(
+            "detail %s: detail_count=%s → planned %d pages, fetched %d (items=%d)",
+            detail_no, detail_count, planned, fetched, len(items),
+            extra={"detail_no": detail_no, "planned_pages": planned, "fetched_pages": fetched},
+        )
+    return items
+
+
+# ============================================================
+# 7. detail_no 단위 수집(crawl_one_detail)
+# - 1) 목록 페이지를 계획(detail_count 기준)대로 동시에 요청해 detail_url 목록을 모음
+# - 2) 각 detail_url을 workers개 스레드로 동시에 상세 파싱해 row를 만들고,
+#      카탈로그 계층 ID를 붙여 목록 순서대로 yield
+#      (요청은 동시에 진행, yield만 목록 순서 → 실행마다 CSV row 순서가 같음)
+#      (요청 속도는 common.http.LIMITER가 제한)
+# - skip_urls: 이미 수집한 detail_url(체크포인트 재시작 시 건너뜀)
+# - seen: 실행 전체 공유 매물 집합(SeenUrlSet). 같은 매물(no=)이 다른 세부모델에서
+#   이미 수집됐으면 상세 요청 없이 건너뛴다.
+# - snapshot: 이전 실행 결과(detail_url -> row). 주어지면 증분 수집으로 동작한다.
+#   목록 가격이 그대로인 매물은 상세 요청 없이 이전 row를 재사용(unchanged)하고,
+#   새 매물(new)과 가격이 바뀐 매물(changed)만 상세 페이지를 요청한다.
+# ============================================================
+
+# crawl_one_detail이 만드는 row의 컬럼 순서(목록 → 상세 → 카탈로그 ID)
+LIST_COLUMNS = ["model_name_list", "detail_link", "detail_url", "rent_yn", "list_price_wan"]
+DETAIL_COLUMNS = [
+    "model_name", "price_wan",
+    "rent_yn_detail", "support_money_wan", "acquisition_cost_wan", "monthly_rent_wan",
+    "remain_months", "total_months", "remain_months_text",
+    "year_month", "mileage_km", "fuel_type", "transmission", "color", "displacement_cc", "reg_date",
+]
+ROW_COLUMNS = LIST_COLUMNS + DETAIL_COLUMNS + [
+    "gubun", "maker_no", "group_no", "detail_no",
+    "listing_status",
+]
 
-    rows = []
-    for i, it in enumerate(items, 1):
-        time.sleep(SLEEP_SEC)
-        detail = parse_detail_page(it["detail_url"])
 
-        row = {**it, **detail}
+def build_row(it: dict, detail: dict, gubun: str, maker_no: int, group_no: int, detail_no: int) -> dict:
+    row = {**it, **detail}
 
-        # 카탈로그 계층 ID 저장(후속 DB 적재/조인용)
-        row["gubun"] = gubun
-        row["maker_no"] = maker_no
-        row["group_no"] = group_no
-        row["detail_no"] = detail_no
+    # 카탈로그 계층 ID 저장(후속 DB 적재/조인용)
+    row["gubun"] = gubun
+    row["maker_no"] = maker_no
+    row["group_no"] = group_no
+    row["detail_no"] = detail_no
 
-        # 목록 기반 rent_yn 대신 상세 기반 rent_yn_detail을 우선
-        row["rent_yn"] = bool(row.get("rent_yn_detail"))
+    # 목록 기반 rent_yn 대신 상세 기반 rent_yn_detail을 우선
+    row["rent_yn"] = bool(row.get("rent_yn_detail"))
 
-        rows.append(row)
+    return row
 
-        if i % 20 == 0:
-            print(f"[DETAIL {detail_no}] {i}/{len(items)} 상세 수집중...")
 
-    return rows
\ No newline at end of file
+def crawl_one_detail(
+    gubun: str,
+    maker_no: int,
+    group_no: int,
+    detail_no: int,
+    max_pages: int | None = None,
+    workers: int = DETAIL_WORKERS,
+    skip_urls: set[str] | None = None,
+    snapshot: dict[str, dict] | None = None,
+    detail_count: int | None = None,
+    seen: SeenUrlSet | None = None,
+) -> Iterator[dict]:
+    # 카탈로그상 매물이 없으면 요청하지 않음
+    if detail_count == 0:
+        return
+
+    pool = ThreadPoolExecutor(max_workers=workers)
+    try:
+        yield from _crawl_items(
+            fetch_list_items(gubun, maker_no, group_no, detail_no, pool, detail_count, max_pages),
+            gubun, maker_no, group_no, detail_no, pool, skip_urls, snapshot, seen,
+        )
+    finally:
+        # 예외/중단으로 빠져나오면 아직 시작 안 한 요청은 취소
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _crawl_items(
+    items: list[dict],
+    gubun: str,
+    maker_no: int,
+    group_no: int,
+    detail_no: int,
+    pool: ThreadPoolExecutor,
+    skip_urls: set[str] | None,
+    snapshot: dict[str, dict] | None,
+    seen: SeenUrlSet | None,
+) -> Iterator[dict]:
+    if skip_urls:
+        items = [it for it in items if it["detail_url"] not in skip_urls]
+
+    # 다른 세부모델에서 이미 가져간 매물은 건너뜀(먼저 claim한 쪽만 수집)
+    if seen is not None:
+        items = [it for it in items if seen.claim(it["detail_url"])]
+
+    # 목록 순서대로 (매물, 상세 요청 future 또는 재사용 row)를 만들고 요청은 모두 먼저 제출
+    # 증분 수집: 목록 가격이 그대로인 매물은 상세 요청 없이 이전 row를 그대로 넘김
+    entries: deque[tuple[dict, Future | None, dict | None]] = deque()
+    for it in items:
+        prev = snapshot.get(it["detail_url"]) if snapshot is not None else None
+        if prev is not None and same_list_price(prev.get("list_price_wan"), it["list_price_wan"]):
+            entries.append((it, None, {
+                **prev,
+                "model_name_list": it["model_name_list"],
+                "detail_link": it["detail_link"],
+                "gubun": gubun,
+                "maker_no": maker_no,
+                "group_no": group_no,
+                "detail_no": detail_no,
+                "listing_status": "unchanged",
+            }))
+        else:
+            entries.append((it, pool.submit(parse_detail_page, it["detail_url"]), None))
+
+    n_fetch = sum(1 for _, fut, _ in entries if fut is not None)
+    done = 0
+    while entries:
+        # 넘긴 항목은 바로 놓아 메모리에 쌓이지 않게 함
+        it, fut, row = entries.popleft()
+        if fut is not None:
+            row = build_row(it, fut.result(), gubun, maker_no, group_no, detail_no)
+            if snapshot is not None:
+                row["listing_status"] = "changed" if it["detail_url"] in snapshot else "new"
+            done += 1
+            if done % 20 == 0:
+                log.info("detail %s: %d/%d 상세 수집중...", detail_no, done, n_fetch)
+        yield row
@@ -0,0 +1,53 @@
+from bs4 import BeautifulSoup, SoupStrainer
+
+from config import HTML_PARSER
+
+# ------------------------------
+# HTML 파서 백엔드 선택
+# - HTML_PARSER(기본 lxml)가 설치되어 있으면 사용하고,
+#   없으면 표준 라이브러리 html.parser로 대체한다.
+# ------------------------------
+
+
+def _pick_parser(preferred: str) -> str:
+    if preferred == "lxml":
+        try:
+            import lxml  # noqa: F401
+        except ImportError:
+            return "html.parser"
+    return preferred
+
+
+PARSER: str = _pick_parser(HTML_PARSER)
+
+
+def make_soup(html: str | bytes, parse_only: SoupStrainer | None = None) -> BeautifulSoup:
+    """
+    선택된 파서 백엔드로 BeautifulSoup 객체를 만든다.
+
+    :param html: HTML 원문
+    :param parse_only: 지정하면 조건에 맞는 태그(와 그 하위 트리)만 트리로 만든다.
+    """
+    return BeautifulSoup(html, PARSER, parse_only=parse_only)
+
+
+# ------------------------------
+# 부분 파싱(SoupStrainer)
+# - 상세 페이지(mycar_view.php)는 가격 박스/스펙 테이블/최초등록일만 쓰므로
+#   그 하위 트리만 만든다(나머지 DOM은 트리 생성 자체를 건너뜀).
+# ------------------------------
+
+
+def _is_detail_target(name: str, attrs: dict | None = None) -> bool:
+    # attrs의 class는 파싱 단계에서 아직 문자열("info-price box")이다.
+    cls = str((attrs or {}).get("class", ""))
+    if name == "table":
+        return True
+    if name == "div":
+        return attrs is None or ("info-price" in cls and "box" in cls)
+    if name == "dd":
+        return attrs is None or ("txt-bar" in cls and "cg" in cls)
+    return False
+
+
+DETAIL_STRAINER = SoupStrainer(_is_detail_target)
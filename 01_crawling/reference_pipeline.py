@@ -0,0 +1,206 @@
+# ============================================================
+# 0. 목적/개요
+# - 기준정보(제조사 → 모델 → 세대 → 등급/트림)를 한 번의 실행으로 수집한다.
+# - 단계마다 입력 큐와 worker 스레드를 두고, 앞 단계가 찾은 코드를 바로 다음 단계 큐에 넣는다.
+#   → 모델을 아직 찾는 중에도 세대/등급 요청이 시작되므로,
+#     전체 소요 시간이 "단계별 시간의 합"이 아니라 "트리 깊이"에 가까워진다.
+# - 요청 속도는 공유 HTTP 세션의 토큰 버킷(common.http.LIMITER)이 제한한다.
+# - makers/models/generations.csv는 BobeCar 메서드가 단계별로 바로 append하고,
+#   terms.csv는 모든 트림 수집이 끝난 뒤 한 번만 저장한다(row 순서 고정).
+#
+# 실행(01_crawling 에서):
+#   python reference_pipeline.py            # 국산 + 수입
+#   python reference_pipeline.py --origin K
+# ============================================================
+
+import argparse
+import queue
+import threading
+import time
+
+import pandas as pd
+
+from bobe_car import BobeCar, TERM_COLUMNS, TERM_DEDUP_KEYS
+from config import REF_WORKERS, TERM_WORKERS
+from common.log import get_logger
+
+log = get_logger("reference_pipeline")
+
+
+# ============================================================
+# 1. 파이프라인 단계
+# - 입력 큐에서 항목을 꺼내 fn(item)을 실행하고, 돌려받은 항목을 다음 단계 큐에 넣는다.
+# - 항목 하나가 실패해도 해당 하위 트리만 빠지고 나머지는 계속 진행한다.
+# ============================================================
+
+_STOP = object()
+
+
+class Stage:
+    def __init__(self, name: str, fn, workers: int, next_stage: "Stage | None" = None):
+        self.name = name
+        self.fn = fn
+        self.workers = workers
+        self.next_stage = next_stage
+
+        self.q: queue.Queue = queue.Queue()
+        self._threads: list[threading.Thread] = []
+        self._lock = threading.Lock()
+        self.stats = {"done": 0, "failed": 0}
+
+    def start(self) -> None:
+        for i in range(self.workers):
+            t = threading.Thread(target=self._run, name=f"{self.name}-{i}", daemon=True)
+            t.start()
+            self._threads.append(t)
+
+    def put(self, item) -> None:
+        self.q.put(item)
+
+    def _run(self) -> None:
+        while True:
+            item = self.q.get()
+            if item is _STOP:
+                return
+
+            try:
+                children = self.fn(item) or []
+            except Exception as e:
+                log.error("%s failed: %s | %s", self.name, item, e)
+                with self._lock:
+                    self.stats["failed"] += 1
+                continue
+
+            with self._lock:
+                self.stats["done"] += 1
+            if self.next_stage is not None:
+                for child in children:
+                    self.next_stage.put(child)
+
+    def close(self) -> None:
+        """
+        더 넣을 항목이 없음을 알리고 worker가 끝날 때까지 기다린다.
+        이 단계가 끝나야 다음 단계에도 더 들어올 항목이 없으므로, 이어서 다음 단계를 닫는다.
+        """
+        for _ in self._threads:
+            self.q.put(_STOP)
+        for t in self._threads:
+            t.join()
+
+        if self.next_stage is not None:
+            self.next_stage.close()
+
+
+# ============================================================
+# 2. 기준정보 파이프라인
+# - makers(origin) → models(origin, maker) → generations(origin, maker, model)
+#   → grades(origin, maker, model, generation) → terms(target, grades_url, grade)
+# ============================================================
+
+def crawl_reference(
+        car: BobeCar,
+        origins: tuple[str, ...] = ("K", "I"),
+        workers: int = REF_WORKERS,
+        term_workers: int = TERM_WORKERS,
+) -> dict:
+    """
+    기준정보 전체를 파이프라인으로 수집한다.
+
+    :param car: BobeCar 인스턴스(단계별 CSV 저장소를 공유)
+    :param origins: 수집할 차량 구분 코드 ('K' = 국산차, 'I' = 수입차)
+    :param workers: 제조사/모델/세대 단계별 worker 수
+    :param term_workers: 등급/트림 단계별 worker 수
+    :return: {"ok", "csv_path"(terms), "count"(terms rows), "stages"(단계별 처리/실패 수), "elapsed"}
+    """
+
+    # (target, 등급 순번) -> terms.csv rows
+    term_rows: dict[tuple, list[dict]] = {}
+    rows_lock = threading.Lock()
+
+    def _makers(origin):
+        df = car.get_maker_category(origin)["df"]
+        return [(origin, int(code)) for code in df["maker_code"]]
+
+    def _models(item):
+        origin, maker_code = item
+        df = car.get_maker_models(origin, maker_code)["df"]
+        return [(origin, maker_code, int(code)) for code in df["model_code"]]
+
+    def _generations(item):
+        origin, maker_code, model_code = item
+        df = car.get_model_generation(origin, maker_code, model_code)["df"]
+        return [(origin, maker_code, model_code, int(code)) for code in df["generation_code"]]
+
+    def _grades(target):
+        grades_url, grades = car.get_generation_grades(*target)
+
+        children = []
+        for idx, grade in enumerate(grades):
+            # ✅ volume == 0 → 트림 확장 호출 안 함(등급만 저장)
+            if grade["grade_volume"] == 0:
+                with rows_lock:
+                    term_rows[(target, idx)] = BobeCar.term_rows(target, grade, [])
+            else:
+                children.append((target, idx, grades_url, grade))
+        return children
+
+    def _terms(item):
+        target, idx, grades_url, grade = item
+        term_list = car.get_term_by_grade(grades_url, grade["grade_code"])
+        with rows_lock:
+            term_rows[(target, idx)] = BobeCar.term_rows(target, grade, term_list)
+        return []
+
+    terms = Stage("terms", _terms, term_workers)
+    grades = Stage("grades", _grades, term_workers, terms)
+    generations = Stage("generations", _generations, workers, grades)
+    models = Stage("models", _models, workers, generations)
+    makers = Stage("makers", _makers, min(workers, len(origins)) or 1, models)
+    stages = [makers, models, generations, grades, terms]
+
+    t0 = time.time()
+    for stage in stages:
+        stage.start()
+    for origin in origins:
+        makers.put(origin)
+
+    # makers부터 차례로 닫음(각 단계는 앞 단계가 끝난 뒤에만 종료)
+    makers.close()
+
+    # 제출 순서와 무관하게 target → 등급 순서로 row 조립
+    rows = [r for key in sorted(term_rows) for r in term_rows[key]]
+    df = pd.DataFrame(rows, columns=TERM_COLUMNS)
+
+    csv_path = car.save_df_to_csv(
+        df=df,
+        filename="terms",
+        dedup_keys=TERM_DEDUP_KEYS,
+    )
+
+    stage_stats = {s.name: dict(s.stats) for s in stages}
+    return {
+        "ok": all(s["failed"] == 0 for s in stage_stats.values()),
+        "csv_path": csv_path,
+        "count": len(df),
+        "stages": stage_stats,
+        "elapsed": time.time() - t0,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="보배드림 기준정보(제조사/모델/세대/트림) 파이프라인 수집")
+    parser.add_argument("--origin", action="append", choices=["K", "I"], help="차량 구분(여러 번 지정 가능, 기본 K+I)")
+    parser.add_argument("--workers", type=int, default=REF_WORKERS, help="제조사/모델/세대 단계별 worker 수")
+    parser.add_argument("--term-workers", type=int, default=TERM_WORKERS, help="등급/트림 단계별 worker 수")
+    args = parser.parse_args()
+
+    result = crawl_reference(
+        BobeCar(),
+        origins=tuple(args.origin or ("K", "I")),
+        workers=args.workers,
+        term_workers=args.term_workers,
+    )
+
+    for name, s in result["stages"].items():
+        log.info("%s: done=%d failed=%d", name, s["done"], s["failed"])
+    log.info("terms rows=%d (%.1fs)", result["count"], result["elapsed"])
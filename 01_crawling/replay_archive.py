@@ -0,0 +1,82 @@
+# ============================================================
+# 0. 목적/개요
+# - run_all --archive로 보관한 상세 페이지(mycar_view.php) 원문을
+#   네트워크 요청 없이 parse_detail_soup으로 다시 파싱해 CSV로 저장한다.
+# - 사이트 DOM 변경으로 파서를 고친 뒤, 다시 크롤링하지 않고 결과를 재생성할 때 쓴다.
+# - 파싱은 CPU 작업이라 프로세스 풀로 나눠 처리한다.
+# ============================================================
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from config import ARCHIVE_DIR, REPLAY_CSV
+from crawl_market_list import parse_detail_soup, DETAIL_COLUMNS
+from common.archive import HtmlArchive
+from common.log import get_logger
+from common.row_sink import CsvRowSink
+from parsers.html import make_soup, DETAIL_STRAINER
+
+log = get_logger("replay_archive")
+
+DETAIL_PATH = "/mycar/mycar_view"
+REPLAY_COLUMNS = ["detail_url", "fetched_at"] + DETAIL_COLUMNS
+
+
+# ============================================================
+# 1. 재파싱(워커 프로세스)
+# - 워커마다 보관소를 한 번만 열고, index 항목(entry)을 받아 row를 만든다.
+# ============================================================
+
+_archive: HtmlArchive | None = None
+
+
+def _init_worker(archive_dir: str) -> None:
+    global _archive
+    _archive = HtmlArchive(archive_dir)
+
+
+def replay_one(entry: dict) -> dict:
+    soup = make_soup(_archive.get_text(entry), parse_only=DETAIL_STRAINER)
+    return {
+        "detail_url": entry["url"],
+        "fetched_at": entry["fetched_at"],
+        **parse_detail_soup(soup),
+    }
+
+
+# ============================================================
+# 2. 실행 흐름(main)
+# - 보관소 index에서 URL별 최신 상세 페이지 목록을 만들고,
+#   프로세스 풀로 재파싱한 결과를 REPLAY_CSV에 batch 단위로 저장한다.
+# ============================================================
+
+def main(archive_dir: str = ARCHIVE_DIR, out_csv: str = REPLAY_CSV, workers: int | None = None):
+    archive = HtmlArchive(archive_dir)
+    entries = list(archive.iter_latest(DETAIL_PATH))
+    log.info("archived detail pages: %d", len(entries))
+
+    if os.path.exists(out_csv):
+        os.remove(out_csv)
+
+    with CsvRowSink(out_csv, REPLAY_COLUMNS, batch_size=1000) as sink:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(archive_dir,),
+        ) as pool:
+            for i, row in enumerate(pool.map(replay_one, entries, chunksize=64), 1):
+                sink.write(row)
+                if i % 5000 == 0:
+                    log.info("%d/%d 재파싱중...", i, len(entries))
+
+    log.info("saved: %s rows: %d", out_csv, sink.rows_written)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="보관된 상세 페이지 원문 재파싱")
+    parser.add_argument("--archive-dir", default=ARCHIVE_DIR)
+    parser.add_argument("--out", default=REPLAY_CSV)
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수(기본: CPU 수)")
+    args = parser.parse_args()
+    main(archive_dir=args.archive_dir, out_csv=args.out, workers=args.workers)
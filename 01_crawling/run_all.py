@@ -3,63 +3,290 @@
 # - 카탈로그(제조사/모델/세부모델 목록)를 준비한 뒤,
 #   각 세부모델에 대해 매물 리스트/상세를 수집하여 CSV로 저장한다.
 # - catalog_all.csv가 없으면 market_price_new.php에서 카탈로그를 생성한다.
+# - 수집한 row는 PART_CSV에 바로 덧붙이고, 진행 상황은 JOURNAL_FILE에 기록한다.
+#   중간에 죽어도 재실행하면 완료된 세부모델/상세 URL은 건너뛰고 이어서 수집한다.
+# - 같은 매물(no=)이 여러 세부모델에 나오면 상세는 한 번만 요청한다(SEEN_FILE).
+# - --incremental: 이전 OUT_CSV와 목록 결과를 비교해 새 매물/가격 변경 매물만
+#   상세 페이지를 요청하고, 사라진 매물은 listing_status=delisted로 남긴다.
+# - --archive: 응답 원문을 ARCHIVE_DIR에 보관(replay_archive.py로 재파싱)
+# - 샤딩(여러 프로세스/머신으로 나눠 수집):
+#   카탈로그 행을 (gubun, maker_no) crc32 해시로 N개 샤드에 나누고,
+#   샤드마다 요청 속도 1/N, 결과/체크포인트/지표 파일을 따로 쓴다.
+#     python run_all.py --shard 0/4        # 머신/프로세스별로 0..3 실행
+#     python run_all.py --merge 4          # 샤드 결과를 OUT_CSV로 합침(detail_url 중복 제거)
+#     python run_all.py --processes 4      # 한 머신에서 4개 프로세스 실행 후 자동 merge
 # ============================================================
 
+import argparse
+import os
+import subprocess
+import sys
+import time
+from collections import Counter
 import pandas as pd
-from config import CATALOG_CSV, OUT_CSV
-from catalog_discover import discover_catalog
-from crawl_market_list import crawl_one_detail
+from config import (
+    CATALOG_CSV, OUT_CSV, JOURNAL_FILE, PART_CSV, SEEN_FILE, ARCHIVE_DIR, METRICS_JSON, METRICS_PROM,
+    LOG_LEVEL, LOG_JSON,
+)
+from catalog_discover import discover_catalog_all
+from crawl_market_list import crawl_one_detail, negotiate_view_size, ROW_COLUMNS
+from common.checkpoint import CheckpointJournal
+from common.archive import HtmlArchive
+from common.http import connection_stats, set_archive, cache_stats, rate_stats, set_rate_share
+from common.metrics import METRICS
+from common.log import get_logger, setup_logging
+from common.row_sink import CsvRowSink
+from common.seen_set import SeenUrlSet
+from common.shard import parse_shard, shard_of, shard_path, merge_shards
+from common.snapshot import load_snapshot, read_column
+
+
+# 카탈로그에서 row에 붙일 이름 컬럼
+NAME_COLUMNS = ["maker_name", "group_name", "detail_name"]
+OUT_COLUMNS = ROW_COLUMNS + NAME_COLUMNS
 
 
 # ============================================================
 # 1. 실행 흐름(main)
 # - 1) 카탈로그 로드(없으면 생성 후 저장)
-# - 2) 카탈로그 각 행(세부모델)에 대해 크롤링 수행
-# - 3) 수집 결과에 이름 컬럼(제조사/모델/세부모델) 병합
-# - 4) OUT_CSV로 저장
+# - 2) 카탈로그 각 행(세부모델)에 대해 크롤링 수행(저널 기준 이어하기)
+#      row가 나오는 즉시 이름 컬럼(제조사/모델/세부모델)을 dict 조회로 붙여
+#      PART_CSV에 batch 단위로 덧붙인다.
+# - 3) (증분 모드) 이번 결과에 없는 이전 매물을 delisted로 기록
+# - 4) 전체 완료 시 PART_CSV를 OUT_CSV로 교체하고 체크포인트 파일 정리
 # ============================================================
 
-def main():
-    # 1) 카탈로그 로드(없으면 생성)
+log = get_logger("run_all")
+
+
+def build_name_lookup(catalog_df: pd.DataFrame) -> dict[tuple, dict]:
+    # (gubun, maker_no, group_no, detail_no) -> {maker_name, group_name, detail_name}
+    lookup = {}
+    for r in catalog_df.itertuples(index=False):
+        key = (r.gubun, int(r.maker_no), int(r.group_no), int(r.detail_no))
+        lookup[key] = {c: getattr(r, c) for c in NAME_COLUMNS}
+    return lookup
+
+
+def load_catalog() -> pd.DataFrame:
+    # 카탈로그 로드(없으면 생성 후 저장)
     try:
         catalog_df = pd.read_csv(CATALOG_CSV, encoding="utf-8-sig")
-        print("[RUN] loaded catalog:", CATALOG_CSV, "rows:", len(catalog_df))
+        log.info("loaded catalog: %s rows: %d", CATALOG_CSV, len(catalog_df))
     except FileNotFoundError:
-        cat_k = discover_catalog("K")
-        cat_i = discover_catalog("I")
-        catalog_df = pd.concat([cat_k, cat_i], ignore_index=True)
+        # 국산(K)/수입(I) 동시 수집(결과 순서는 K → I로 고정)
+        catalog_df = discover_catalog_all(("K", "I"))
 
-        catalog_df.to_csv(CATALOG_CSV, index=False, encoding="utf-8-sig")
-        print("[RUN] saved catalog:", CATALOG_CSV, "rows:", len(catalog_df))
+        # 여러 샤드가 동시에 읽어도 반쯤 쓴 파일을 보지 않도록 임시 파일에 쓴 뒤 교체
+        tmp = f"{CATALOG_CSV}.{os.getpid()}.tmp"
+        catalog_df.to_csv(tmp, index=False, encoding="utf-8-sig")
+        os.replace(tmp, CATALOG_CSV)
+        log.info("saved catalog: %s rows: %d", CATALOG_CSV, len(catalog_df))
+    return catalog_df
 
-    # 2) 카탈로그 기준으로 상세 수집
-    all_rows = []
-    for idx, r in catalog_df.iterrows():
-        gubun = r["gubun"]
-        maker_no = int(r["maker_no"])
-        group_no = int(r["group_no"])
-        detail_no = int(r["detail_no"])
-
-        print(
-            f"[RUN] ({idx+1}/{len(catalog_df)}) "
-            f"gubun={gubun} maker={maker_no} group={group_no} detail={detail_no}"
+
+def ensure_view_size(catalog_df: pd.DataFrame) -> None:
+    # 목록 페이지 크기 협상(매물이 가장 많은 세부모델로 시험, 결과는 캐시)
+    if catalog_df["detail_count"].notna().any():
+        probe = catalog_df.loc[catalog_df["detail_count"].idxmax()]
+        negotiate_view_size(
+            probe["gubun"], int(probe["maker_no"]), int(probe["group_no"]), int(probe["detail_no"]),
+            int(probe["detail_count"]),
         )
-        rows = crawl_one_detail(gubun, maker_no, group_no, detail_no)
-        all_rows.extend(rows)
 
-    df = pd.DataFrame(all_rows)
 
-    # 3) 이름 컬럼 붙이기(제조사/모델/세부모델)
-    df = df.merge(
-        catalog_df[["gubun", "maker_no", "maker_name", "group_no", "group_name", "detail_no", "detail_name"]],
-        on=["gubun", "maker_no", "group_no", "detail_no"],
-        how="left"
-    )
+def main(incremental: bool = False, archive: bool = False, shard: tuple[int, int] | None = None):
+    html_archive = HtmlArchive(ARCHIVE_DIR) if archive else None
+    set_archive(html_archive)
+
+    # 샤드 실행이면 파일명을 샤드별로 나누고 요청 속도 예산도 1/N만 사용
+    out_csv, part_csv = shard_path(OUT_CSV, shard), shard_path(PART_CSV, shard)
+    journal_file, seen_file = shard_path(JOURNAL_FILE, shard), shard_path(SEEN_FILE, shard)
+    if shard is not None:
+        set_rate_share(1 / shard[1])
+
+    # 1) 카탈로그 로드(없으면 생성)
+    catalog_df = load_catalog()
+    ensure_view_size(catalog_df)
+
+    if shard is not None:
+        i, n = shard
+        mask = [shard_of(g, m, n) == i for g, m in zip(catalog_df["gubun"], catalog_df["maker_no"])]
+        catalog_df = catalog_df[mask]
+        log.info("shard %d/%d: %d catalog rows", i, n, len(catalog_df))
+
+    names = build_name_lookup(catalog_df)
+
+    # 증분 모드: 이전 실행 결과(합쳐진 OUT_CSV)를 비교 기준으로 로드
+    # (샤드 실행이면 이 샤드에 속한 매물만)
+    snapshot = None
+    if incremental:
+        snapshot = load_snapshot(OUT_CSV)
+        if shard is not None:
+            snapshot = {
+                url: row for url, row in snapshot.items()
+                if shard_of(row["gubun"], int(float(row["maker_no"])), shard[1]) == shard[0]
+            }
+        log.info("incremental snapshot: %s rows: %d", OUT_CSV, len(snapshot))
+    status_counts = Counter()
+
+    # 2) 카탈로그 기준으로 상세 수집
+    journal = CheckpointJournal(journal_file)
+
+    # 세부모델 사이 중복 매물 집합(재시작해도 이어서 사용)
+    seen = SeenUrlSet(seen_file)
+    if seen.stats["loaded"]:
+        log.info("resumed seen listings: %d", seen.stats["loaded"])
+
+    # row가 파일에 기록된 뒤에만 저널/중복 집합에 완료 기록(크래시 시 최대 1 batch만 재수집)
+    def on_flush(batch: list[dict]) -> None:
+        for row in batch:
+            key = (row["gubun"], row["maker_no"], row["group_no"], row["detail_no"])
+            journal.mark_url(key, row["detail_url"])
+        seen.commit(row["detail_url"] for row in batch)
+
+    with CsvRowSink(part_csv, OUT_COLUMNS, on_flush=on_flush) as sink:
+        for idx, r in enumerate(catalog_df.itertuples(index=False)):
+            gubun = r.gubun
+            maker_no = int(r.maker_no)
+            group_no = int(r.group_no)
+            detail_no = int(r.detail_no)
+            detail_count = None if pd.isna(r.detail_count) else int(r.detail_count)
+            key = (gubun, maker_no, group_no, detail_no)
+
+            if journal.is_detail_done(key):
+                continue
 
-    # 4) 저장
-    df.to_csv(OUT_CSV, index=False, encoding="utf-8-sig")
-    print("[OK] saved:", OUT_CSV, "rows:", len(df))
+            log.info(
+                "(%d/%d) gubun=%s maker=%s group=%s detail=%s",
+                idx + 1, len(catalog_df), gubun, maker_no, group_no, detail_no,
+                extra={"gubun": gubun, "maker_no": maker_no, "group_no": group_no, "detail_no": detail_no},
+            )
+
+            t0 = time.perf_counter()
+            for row in crawl_one_detail(
+                gubun, maker_no, group_no, detail_no,
+                skip_urls=journal.done_urls(key),
+                snapshot=snapshot,
+                detail_count=detail_count,
+                seen=seen,
+            ):
+                row.update(names[key])
+                sink.write(row)
+                status_counts[row.get("listing_status")] += 1
+
+            # 세부모델 완료 기록 전에 남은 row를 먼저 파일로 내보냄
+            sink.flush()
+            journal.mark_detail(key)
+            METRICS.observe("detail_seconds", time.perf_counter() - t0, gubun=gubun)
+
+        # 3) 이번 결과에 없는 이전 매물은 delisted로 기록
+        #    (재시작한 경우도 있으므로 PART_CSV에 실제로 기록된 URL 기준으로 판단)
+        if snapshot is not None:
+            written = read_column(part_csv, "detail_url")
+            for url, prev in snapshot.items():
+                if url not in written:
+                    sink.write({**prev, "listing_status": "delisted"})
+                    status_counts["delisted"] += 1
+
+    if snapshot is not None:
+        log.info("incremental: %s", dict(status_counts))
+
+    # 4) 저장: 완성된 PART_CSV를 OUT_CSV로 교체
+    os.replace(part_csv, out_csv)
+    log.info("saved: %s rows: %d", out_csv, sink.rows_written)
+
+    # 정상 종료: 다음 실행은 처음부터 시작하도록 체크포인트 정리
+    journal.remove()
+    seen.remove()
+    log.info("duplicate listings skipped: %d unique: %d", seen.stats["duplicates"], seen.stats["claimed"] + seen.stats["loaded"])
+    log.info("http connections: %s", connection_stats())
+    log.info("http cache: %s", cache_stats())
+    log.info("http rate: %s", rate_stats())
+    if html_archive is not None:
+        log.info("archive %s: %s", ARCHIVE_DIR, html_archive.stats)
+
+    # 5) 실행 지표 내보내기(네트워크/파싱/CSV 기록 중 어디서 시간이 드는지 확인용)
+    elapsed = time.time() - METRICS.started_at
+    METRICS.set_gauge("rows_per_sec", sink.rows_written / elapsed if elapsed else 0.0)
+    METRICS.set_gauge("duplicate_listings_skipped", seen.stats["duplicates"])
+    for endpoint, st in rate_stats().items():
+        METRICS.set_gauge("rate_per_sec", st["rate"], endpoint=endpoint)
+    for status, n in status_counts.items():
+        METRICS.set_gauge("listings", n, status=status)
+    metrics_json, metrics_prom = shard_path(METRICS_JSON, shard), shard_path(METRICS_PROM, shard)
+    METRICS.write_json(metrics_json)
+    METRICS.write_prometheus(metrics_prom)
+    log.info("metrics saved: %s %s", metrics_json, metrics_prom)
+
+
+# ============================================================
+# 2. 샤드 결과 합치기 / 한 머신에서 여러 프로세스로 실행
+# ============================================================
+
+def merge(n: int) -> None:
+    # 샤드 0..n-1 결과를 OUT_CSV로 합침(detail_url 기준 중복 제거)
+    paths = [shard_path(OUT_CSV, (i, n)) for i in range(n)]
+    stats = merge_shards(paths, OUT_CSV)
+    log.info("merged %d shards → %s %s", n, OUT_CSV, stats)
+
+
+def run_processes(n: int, argv: list[str]) -> int:
+    """
+    샤드 n개를 하위 프로세스로 동시에 실행하고, 모두 성공하면 결과를 합친다.
+
+    :param argv: 하위 프로세스에 그대로 넘길 옵션(--incremental 등)
+    :return: 종료 코드(하나라도 실패하면 1, 합치기는 하지 않음)
+    """
+    # 카탈로그/view_size는 먼저 한 번 준비해 샤드들이 파일/캐시를 공유
+    ensure_view_size(load_catalog())
+
+    procs = [
+        subprocess.Popen([sys.executable, os.path.abspath(__file__), "--shard", f"{i}/{n}", *argv])
+        for i in range(n)
+    ]
+    codes = [p.wait() for p in procs]
+
+    failed = [i for i, rc in enumerate(codes) if rc != 0]
+    if failed:
+        log.error("shards failed: %s (rerun them with --shard i/%d, then --merge %d)", failed, n, n)
+        return 1
+
+    merge(n)
+    return 0
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="보배드림 매물 목록/상세 수집")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="이전 OUT_CSV 대비 새 매물/가격 변경 매물만 상세 수집",
+    )
+    parser.add_argument(
+        "--archive",
+        action="store_true",
+        help=f"응답 원문을 {ARCHIVE_DIR}/에 압축 보관",
+    )
+    parser.add_argument("--log-level", default=None, help="로그 레벨(DEBUG/INFO/WARNING/ERROR, 기본 config.LOG_LEVEL)")
+    parser.add_argument("--log-json", action="store_true", help="JSON 한 줄 형식으로 로그 출력")
+
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--shard", type=parse_shard, default=None, help="이 프로세스가 맡을 샤드(i/N)")
+    mode.add_argument("--merge", type=int, metavar="N", default=None, help="샤드 N개 결과를 OUT_CSV로 합침")
+    mode.add_argument("--processes", type=int, metavar="N", default=None, help="샤드 N개를 하위 프로세스로 실행 후 합침")
+    args = parser.parse_args()
+    setup_logging(args.log_level or LOG_LEVEL, json_format=args.log_json or LOG_JSON)
+
+    if args.merge:
+        merge(args.merge)
+    elif args.processes:
+        child_argv = [
+            *(["--incremental"] if args.incremental else []),
+            *(["--archive"] if args.archive else []),
+            *(["--log-level", args.log_level] if args.log_level else []),
+            *(["--log-json"] if args.log_json else []),
+        ]
+        sys.exit(run_processes(args.processes, child_argv))
+    else:
+        main(incremental=args.incremental, archive=args.archive, shard=args.shard)
@@ -0,0 +1,72 @@
+-- =========================================================
+-- 1) select database car_used_db
+-- =========================================================
+USE used_car_db;
+
+-- =========================================================
+-- 2) used_cars 수집 상태 컬럼
+-- =========================================================
+-- 정기 갱신(data_pipeline/refresh.py)에서 관리
+-- last_seen_at: 마지막으로 수집 결과에 포함된 시각
+-- delisted_at : 수집 결과에서 사라진 시각 (NULL = 판매 중, 서비스 조회는 NULL만 사용)
+ALTER TABLE used_cars
+    ADD COLUMN last_seen_at DATETIME NULL COMMENT '마지막 수집 시각',
+    ADD COLUMN delisted_at  DATETIME NULL COMMENT '판매 종료 시각(NULL=판매 중)';
+
+CREATE INDEX idx_used_cars_delisted_at
+    ON used_cars(delisted_at);
+
+-- =========================================================
+-- 3) staging table
+-- =========================================================
+-- 크롤링 결과 1회분을 그대로 적재하는 작업 테이블
+-- → 여기서 car_specs / used_cars / leases로 테이블당 한 번의 set-based 문장으로 반영
+-- (제약조건/FK 없음, 반영이 끝나면 비움)
+CREATE TABLE IF NOT EXISTS stg_listings
+( /* 매물 적재용 staging */
+    listing_url           VARCHAR(255)    NOT NULL PRIMARY KEY COMMENT '중고차 매매 사이트 링크',
+    listing_status        VARCHAR(20)     NULL COMMENT 'new/changed/unchanged/delisted (증분 수집 결과)',
+    maker_id              BIGINT UNSIGNED NOT NULL,
+    model_name            VARCHAR(50)     NOT NULL,
+    body_type             VARCHAR(20)     NULL COMMENT '없으면 car_specs 신규 생성 안 함',
+    generation_name       VARCHAR(100)    NOT NULL,
+    model_year            VARCHAR(100)    NOT NULL,
+    trim_name             VARCHAR(50)     NOT NULL DEFAULT '',
+    drivetrain_type       VARCHAR(20)     NOT NULL,
+    fuel_type             VARCHAR(100)    NOT NULL,
+    fuel_efficiency       FLOAT           NULL COMMENT '없으면 car_specs 신규 생성 안 함',
+    displacement_cc       INT             NOT NULL,
+    transmission          TINYINT         NOT NULL DEFAULT 1,
+    price                 INT             NOT NULL,
+    is_lease              TINYINT         NOT NULL DEFAULT 0,
+    mileage_km            INT             NOT NULL,
+    color_name            VARCHAR(100)    NOT NULL,
+    car_age_months        INT             NOT NULL,
+    support_amount        INT             NOT NULL DEFAULT 0,
+    remaining_months      INT             NOT NULL DEFAULT 0,
+    total_contract_months INT             NOT NULL DEFAULT 0,
+    monthly_rent_fee      INT             NOT NULL DEFAULT 0,
+    handling_fee          INT             NOT NULL DEFAULT 0
+) ENGINE = InnoDB;
+
+-- 이번 수집 결과에 나온 매물 URL 전체(판매 중인 것만)
+-- stg_listings는 NOT NULL 값이 빠진 row를 제외하므로, delisted 판정은 이 테이블 기준
+-- (값이 빠져 적재를 건너뛴 매물도 판매 중이면 delisted 처리하지 않음)
+CREATE TABLE IF NOT EXISTS stg_seen_urls
+( /* 수집 결과 매물 URL */
+    listing_url VARCHAR(255) NOT NULL PRIMARY KEY COMMENT '중고차 매매 사이트 링크'
+) ENGINE = InnoDB;
+
+-- =========================================================
+-- 4) grants
+-- =========================================================
+-- ingest_user: staging 테이블 비우기(DELETE)만 추가 허용
+GRANT DELETE
+    ON used_car_db.stg_listings
+    TO 'ingest_user'@'%';
+
+GRANT DELETE
+    ON used_car_db.stg_seen_urls
+    TO 'ingest_user'@'%';
+
+FLUSH PRIVILEGES;
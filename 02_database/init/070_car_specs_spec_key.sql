@@ -0,0 +1,35 @@
+-- =========================================================
+-- 1) select database car_used_db
+-- =========================================================
+USE used_car_db;
+
+-- =========================================================
+-- 2) car_specs 해시 키(spec_key)
+-- =========================================================
+-- 제원 9개 컬럼을 MD5 한 값으로 묶은 STORED generated column
+-- → 매물 ↔ 제원 매칭이 9개 컬럼 비교 대신 CHAR(32) 한 컬럼 인덱스 조회로 끝남
+-- 파이썬 쪽 계산(data_pipeline/specs.py spec_hash)과 식이 반드시 같아야 함
+ALTER TABLE car_specs
+    ADD COLUMN spec_key CHAR(32) AS (MD5(CONCAT_WS('|',
+        maker_id, TRIM(model_name), TRIM(generation_name), TRIM(model_year),
+        TRIM(trim_name), TRIM(drivetrain_type), TRIM(fuel_type), displacement_cc, transmission
+    ))) STORED COMMENT '제원 9개 컬럼 해시(매칭 키)';
+
+CREATE INDEX idx_car_specs_spec_key
+    ON car_specs(spec_key);
+
+-- 053/054 적재(9개 컬럼 비교)가 끝났으므로 넓은 복합 인덱스는 제거
+-- (이후 매칭은 spec_key 사용, INSERT 때 유지할 인덱스도 줄어듦)
+DROP INDEX idx_car_specs_lookup ON car_specs;
+
+-- =========================================================
+-- 3) staging table도 같은 키
+-- =========================================================
+ALTER TABLE stg_listings
+    ADD COLUMN spec_key CHAR(32) AS (MD5(CONCAT_WS('|',
+        maker_id, TRIM(model_name), TRIM(generation_name), TRIM(model_year),
+        TRIM(trim_name), TRIM(drivetrain_type), TRIM(fuel_type), displacement_cc, transmission
+    ))) STORED COMMENT '제원 9개 컬럼 해시(car_specs.spec_key와 같은 식)';
+
+CREATE INDEX idx_stg_listings_spec_key
+    ON stg_listings(spec_key);
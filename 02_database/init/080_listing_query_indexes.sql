@@ -0,0 +1,13 @@
+-- =========================================================
+-- 1) select database car_used_db
+-- =========================================================
+USE used_car_db;
+
+-- =========================================================
+-- 2) 서비스 조회용 인덱스
+-- =========================================================
+-- data_pipeline.db.query_listings 필터(가격 상한 / 주행거리 상한 / 연식 범위 / 리스 제외)
+-- 연식은 car_age_months 범위 조건으로 비교하므로 컬럼 그대로 인덱스에 포함
+-- 가격 분위수(슬라이더 범위, ORDER BY price LIMIT 1 OFFSET n)도 이 인덱스 순서로 읽음
+CREATE INDEX idx_used_cars_price_mileage_age_lease
+    ON used_cars(price, mileage_km, car_age_months, is_lease);
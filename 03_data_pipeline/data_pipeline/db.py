@@ -4,6 +4,7 @@ data_pipeline.db
 
 - DB 연결 엔진 생성
 - 서비스용 데이터 로딩 + 최소 전처리(타입/결측/가격단위 자동보정/키 생성)
+- 조건별 조회(ListingQuery → query_listings): 필터를 SQL로 내려 필요한 row만 전송
 
 주의:
 - secrets.toml(Streamlit) 또는 환경변수로 DB 정보를 주입하세요.
@@ -13,12 +14,15 @@ data_pipeline.db
 from __future__ import annotations
 
 import os
-from typing import Optional, Dict, Any
+import math
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, List, Tuple
 
 import numpy as np
 import pandas as pd
-from sqlalchemy import create_engine, text
-from sqlalchemy.engine import Engine
+from sqlalchemy import bindparam, create_engine, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.sql.elements import TextClause
 
 
 def _get_config_from_env_or_streamlit() -> Dict[str, str]:
@@ -64,33 +68,230 @@ def get_engine() -> Engine:
     with engine.connect() as conn:
         conn.execute(text("SET NAMES utf8mb4"))
 
-    return
+    return engine
 
 
-def load_db(engine: Engine, used_car_table: str = "used_cars") -> pd.DataFrame:
-    """
-    서비스에 필요한 컬럼 형태로 조인해서 로딩.
 
-    used_car_table: used_cars / used_cars_price0_backup 등 테이블명 교체 가능
-    """
-    query = f"""
-    SELECT
+
+# =========================================================
+# 서비스 조회(query builder)
+# =========================================================
+# 필터를 SQL WHERE로 내려서 조건에 맞는 row만 가져온다(전체 테이블을 pandas로 읽지 않음).
+# - 기본 조건: 판매 중(delisted_at IS NULL, used_cars만), price>0, mileage_km>=0, 연식 1990~2035, 리스 제외
+# - 연식 조건은 car_age_months 범위로 바꿔 비교(컬럼에 함수를 씌우지 않음 → 인덱스 사용 가능)
+#   year_int >= Y  ⇔  car_age_months <= (올해 - Y) * 12 + 11
+#   year_int <= Y  ⇔  car_age_months >= (올해 - Y) * 12
+# - 지원 인덱스: 02_database/init/080_listing_query_indexes.sql
+
+YEAR_MIN, YEAR_MAX = 1990, 2035
+PRICE_UNIT_WON = 10000.0  # 가격이 원 단위로 적재된 경우 만원 환산 배율
+
+# delisted_at 컬럼이 있는 테이블(060_staging_refresh.sql). 백업 테이블 등에는 없음
+_DELISTED_TABLES = {"used_cars"}
+
+_YEAR_EXPR = "(YEAR(CURDATE()) - FLOOR(uc.car_age_months/12))"
+
+_SELECT_COLUMNS = f"""
       m.maker_name  AS brand,
       cs.model_name AS model_name_raw,
       cs.body_type  AS body_type,
-      (YEAR(CURDATE()) - FLOOR(uc.car_age_months/12)) AS year_int,
+      {_YEAR_EXPR} AS year_int,
       uc.mileage_km AS mileage_km,
       uc.price      AS price_raw,
       cs.fuel_type  AS fuel_type,
       uc.is_lease   AS is_lease,
       uc.listing_url AS listing_url
+"""
+
+# 목록 필터 → 비교 컬럼(양쪽 공백 제거 후 비교, 결과 DataFrame 값과 같은 기준)
+_IN_FILTERS = {
+    "brands": "TRIM(m.maker_name)",
+    "model_families": "TRIM(cs.model_name)",
+    "fuels": "TRIM(cs.fuel_type)",
+    "body_types": "TRIM(cs.body_type)",
+}
+
+
+@dataclass
+class ListingQuery:
+    """
+    서비스 조회 조건(비어 있는 항목은 조건 없음)
+
+    used_car_table: used_cars / used_cars_price0_backup 등 테이블명 교체 가능
+                    (delisted_at 조건은 정기 갱신 컬럼이 있는 used_cars에만 적용)
+    """
+    brands: List[str] = field(default_factory=list)
+    model_families: List[str] = field(default_factory=list)
+    fuels: List[str] = field(default_factory=list)
+    body_types: List[str] = field(default_factory=list)
+    max_price_manwon: Optional[float] = None
+    min_year: Optional[int] = None
+    max_year: Optional[int] = None
+    max_mileage_km: Optional[int] = None
+    include_lease: bool = False
+    used_car_table: str = "used_cars"
+
+
+def _from_clause(used_car_table: str) -> str:
+    return f"""
     FROM {used_car_table} uc
     JOIN car_specs cs ON cs.car_spec_id = uc.car_spec_id
     JOIN makers m     ON m.maker_id     = cs.maker_id
     """
 
-    df = pd.read_sql(text(query), engine)
 
+def _text(sql: str, expanding: List[str]) -> TextClause:
+    # IN 목록 파라미터는 expanding bindparam(:brands → (%s, %s, ...))
+    stmt = text(sql)
+    if expanding:
+        stmt = stmt.bindparams(*(bindparam(name, expanding=True) for name in expanding))
+    return stmt
+
+
+def _where_clause(q: ListingQuery, price_scale: float = 1.0) -> Tuple[str, Dict[str, Any], List[str]]:
+    """
+    WHERE 절 + bind 파라미터 + expanding(IN 목록) 파라미터 이름
+    """
+    conds = ["uc.price > 0", "uc.mileage_km >= 0"]
+    if q.used_car_table in _DELISTED_TABLES:
+        conds.insert(0, "uc.delisted_at IS NULL")
+    params: Dict[str, Any] = {
+        "min_year": max(YEAR_MIN, int(q.min_year)) if q.min_year is not None else YEAR_MIN,
+        "max_year": min(YEAR_MAX, int(q.max_year)) if q.max_year is not None else YEAR_MAX,
+    }
+    conds.append("uc.car_age_months <= (YEAR(CURDATE()) - :min_year) * 12 + 11")
+    conds.append("uc.car_age_months >= (YEAR(CURDATE()) - :max_year) * 12")
+
+    if not q.include_lease:
+        conds.append("uc.is_lease <> 1")
+    if q.max_price_manwon is not None:
+        # price(정수) <= floor(만원 상한 * 배율)  ⇔  price_manwon <= 상한
+        conds.append("uc.price <= :max_price")
+        params["max_price"] = int(math.floor(float(q.max_price_manwon) * price_scale))
+    if q.max_mileage_km is not None:
+        conds.append("uc.mileage_km <= :max_mileage")
+        params["max_mileage"] = int(q.max_mileage_km)
+
+    expanding: List[str] = []
+    for name, column in _IN_FILTERS.items():
+        values = [str(v).strip() for v in getattr(q, name)]
+        if values:
+            conds.append(f"{column} IN :{name}")
+            params[name] = values
+            expanding.append(name)
+
+    return "WHERE " + "\n      AND ".join(conds), params, expanding
+
+
+def build_listing_query(q: ListingQuery, price_scale: float = 1.0) -> Tuple[TextClause, Dict[str, Any]]:
+    """
+    조회 조건 → (SQL, bind 파라미터)
+
+    price_scale: DB price → 만원 환산 배율(1=만원, 10000=원). 가격 상한을 DB 단위로 바꿀 때 사용.
+    """
+    where, params, expanding = _where_clause(q, price_scale)
+    stmt = _text(f"SELECT {_SELECT_COLUMNS} {_from_clause(q.used_car_table)} {where}", expanding)
+    return stmt, params
+
+
+def _nth_value(conn: Connection, expr: str, q: ListingQuery, n: int) -> Optional[float]:
+    # 기본 조건 집합에서 expr 오름차순 n번째 값(0부터)
+    where, params, expanding = _where_clause(q)
+    stmt = _text(f"SELECT {expr} {_from_clause(q.used_car_table)} {where} ORDER BY {expr} LIMIT 1 OFFSET {int(n)}", expanding)
+    v = conn.execute(stmt, params).scalar()
+    return float(v) if v is not None else None
+
+
+def _count(conn: Connection, q: ListingQuery) -> int:
+    where, params, expanding = _where_clause(q)
+    stmt = _text(f"SELECT COUNT(*) {_from_clause(q.used_car_table)} {where}", expanding)
+    return int(conn.execute(stmt, params).scalar() or 0)
+
+
+def detect_price_scale(engine: Engine, used_car_table: str = "used_cars") -> float:
+    """
+    가격 단위 자동 판별(원/만원 혼재 대응): 기본 조건 매물의 가격 중앙값 > 100000 이면 원으로 추정
+
+    :return: 만원 환산 배율(원이면 10000, 만원이면 1)
+    """
+    q = ListingQuery(used_car_table=used_car_table)
+    with engine.connect() as conn:
+        n = _count(conn, q)
+        med = _nth_value(conn, "uc.price", q, (n - 1) // 2) if n else None
+    return PRICE_UNIT_WON if med is not None and med > 100000 else 1.0
+
+
+def load_filter_options(engine: Engine, used_car_table: str = "used_cars") -> Dict[str, Any]:
+    """
+    화면 필터 구성용 요약(매물 row는 가져오지 않음)
+
+    - brands / fuels / body_types: 선택 목록
+    - price_scale: detect_price_scale 결과
+    - price_p95(만원), year_p05 / year_p50 / year_max, mileage_p95: 슬라이더 범위(근사 분위수)
+    """
+    q = ListingQuery(used_car_table=used_car_table)
+    where, params, _ = _where_clause(q)
+    from_ = _from_clause(used_car_table)
+
+    def _distinct(conn: Connection, column: str) -> List[str]:
+        rows = conn.execute(text(f"SELECT DISTINCT {column} {from_} {where} AND {column} <> ''"), params)
+        return sorted(str(r[0]) for r in rows if r[0] is not None)
+
+    def _pct(conn: Connection, expr: str, n: int, p: float) -> Optional[float]:
+        return _nth_value(conn, expr, q, int(p * (n - 1))) if n else None
+
+    with engine.connect() as conn:
+        n = _count(conn, q)
+        opts: Dict[str, Any] = {
+            "count": n,
+            "brands": _distinct(conn, _IN_FILTERS["brands"]),
+            "fuels": _distinct(conn, _IN_FILTERS["fuels"]),
+            "body_types": _distinct(conn, _IN_FILTERS["body_types"]),
+            "price_p50": _pct(conn, "uc.price", n, 0.5),
+            "price_p95": _pct(conn, "uc.price", n, 0.95),
+            "year_p05": _pct(conn, _YEAR_EXPR, n, 0.05),
+            "year_p50": _pct(conn, _YEAR_EXPR, n, 0.5),
+            "year_max": _pct(conn, _YEAR_EXPR, n, 1.0),
+            "mileage_p95": _pct(conn, "uc.mileage_km", n, 0.95),
+        }
+
+    scale = PRICE_UNIT_WON if opts["price_p50"] is not None and opts["price_p50"] > 100000 else 1.0
+    opts["price_scale"] = scale
+    for k in ["price_p50", "price_p95"]:
+        if opts[k] is not None:
+            opts[k] = opts[k] / scale
+    return opts
+
+
+def load_models(engine: Engine, brand: str, used_car_table: str = "used_cars") -> List[str]:
+    """
+    브랜드의 모델(대분류 = car_specs.model_name) 목록(판매 중 매물이 있는 것만)
+    """
+    q = ListingQuery(brands=[brand], used_car_table=used_car_table)
+    where, params, expanding = _where_clause(q)
+    column = _IN_FILTERS["model_families"]
+    stmt = _text(f"SELECT DISTINCT {column} {_from_clause(used_car_table)} {where}", expanding)
+    with engine.connect() as conn:
+        return sorted(str(r[0]) for r in conn.execute(stmt, params) if r[0])
+
+
+def query_listings(engine: Engine, q: ListingQuery, price_scale: Optional[float] = None) -> pd.DataFrame:
+    """
+    조건에 맞는 매물만 SQL로 조회해서 서비스 컬럼 형태로 반환.
+
+    price_scale: None이면 detect_price_scale로 판별(여러 번 조회할 때는 한 번 구해서 넘기기)
+    """
+    if price_scale is None:
+        price_scale = detect_price_scale(engine, q.used_car_table)
+
+    stmt, params = build_listing_query(q, price_scale)
+    with engine.connect() as conn:
+        df = pd.read_sql(stmt, conn, params=params)
+
+    return _prepare_service_frame(df, price_scale)
+
+
+def _prepare_service_frame(df: pd.DataFrame, price_scale: float) -> pd.DataFrame:
     # ---- types/cleanup
     for c in ["brand", "model_name_raw", "fuel_type", "body_type", "listing_url"]:
         if c in df.columns:
@@ -100,21 +301,14 @@ def load_db(engine: Engine, used_car_table: str = "used_cars") -> pd.DataFrame:
         if c in df.columns:
             df[c] = pd.to_numeric(df[c], errors="coerce")
 
-    # ---- basic filters
     required = ["brand", "model_name_raw", "year_int", "mileage_km", "price_raw"]
     df = df.dropna(subset=[c for c in required if c in df.columns]).copy()
 
-    df = df[(df["price_raw"] > 0) & (df["mileage_km"] >= 0)].copy()
-    df = df[(df["year_int"] >= 1990) & (df["year_int"] <= 2035)].copy()
-    if "is_lease" in df.columns:
-        df = df[df["is_lease"].fillna(0) != 1].copy()
-
-    # ---- price unit auto-detect (원/만원 혼재 대응)
-    med = float(df["price_raw"].median())
-    if med > 100000:  # 원으로 추정
-        df["price_manwon"] = df["price_raw"] / 10000.0
+    # ---- price unit (원/만원 혼재 대응, detect_price_scale)
+    if price_scale != 1.0:
+        df["price_manwon"] = df["price_raw"] / price_scale
         df.attrs["price_unit"] = "원(→만원 변환)"
-    else:  # 만원으로 추정
+    else:
         df["price_manwon"] = df["price_raw"].astype(float)
         df.attrs["price_unit"] = "만원(그대로 사용)"
 
@@ -138,3 +332,14 @@ def load_db(engine: Engine, used_car_table: str = "used_cars") -> pd.DataFrame:
     df = df[keep].copy()
 
     return df
+
+
+def load_db(engine: Engine, used_car_table: str = "used_cars") -> pd.DataFrame:
+    """
+    서비스에 필요한 컬럼 형태로 조인해서 로딩(기본 조건만 적용한 전체 매물).
+    (used_cars는 판매 종료된 매물(delisted_at 기록, data_pipeline.refresh)을 제외)
+
+    used_car_table: used_cars / used_cars_price0_backup 등 테이블명 교체 가능
+    조건별 조회는 query_listings(ListingQuery) 사용
+    """
+    return query_listings(engine, ListingQuery(used_car_table=used_car_table))
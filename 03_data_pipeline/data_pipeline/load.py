@@ -0,0 +1,303 @@
+# -*- coding: utf-8 -*-
+"""
+data_pipeline.load
+
+- 크롤링 결과(매물 row)를 used_cars / leases 테이블에 한 번에 적재
+- 02_database/init/053_insert_uesd_cars.sql, 054_insert_leases.sql(행마다 INSERT … SELECT … LIMIT 1)을 대체
+
+동작:
+1) car_specs의 spec_key → car_spec_id 맵을 한 번만 읽는다(data_pipeline.specs.SpecResolver).
+   → 매물마다 car_specs를 조회하지 않고 dict 조회로 car_spec_id를 붙인다.
+2) used_cars를 여러 row짜리 INSERT … ON DUPLICATE KEY UPDATE로 batch 적재
+   (ux_used_cars_listing_url 기준: 같은 매물이면 가격/주행거리 등만 갱신,
+    last_seen_at = 적재 시각, delisted_at 해제 → 다시 올라온 매물도 서비스 조회에 보임)
+3) 이번에 적재한 listing_url만 used_car_id를 조회해 leases도 같은 방식으로 적재
+4) 전체를 한 트랜잭션으로 처리하고 마지막에 commit (my.cnf autocommit=0)
+
+입력 컬럼(DB 컬럼명 기준):
+- 제원 키: maker_id, model_name, generation_name, model_year, trim_name,
+          drivetrain_type, fuel_type, displacement_cc, transmission(0=수동, 1=자동)
+- used_cars: price(만원), listing_url, is_lease, mileage_km, color_name, car_age_months
+- leases(is_lease=1만): support_amount, remaining_months, total_contract_months, monthly_rent_fee, handling_fee
+
+크롤링 CSV(01_crawling/run_all.py 결과)와의 관계:
+- 매물 컬럼은 prepare_listings가 변환한다(CRAWL_RENAME, reg_date → car_age_months,
+  리스/렌트 매물 price 계산, transmission "오토"/"수동" → 1/0).
+- 제원 키 중 maker_id, generation_name, model_year, trim_name, drivetrain_type은 크롤링 결과에 없다.
+  → 매물을 car_specs 제원(06_data/reference 기준)에 맞추는 앞 단계에서 붙여야 한다
+    (model_name / fuel_type / displacement_cc도 car_specs 값으로 맞춰서).
+  → 이 컬럼이 없으면 prepare_listings가 ValueError.
+
+실행(03_data_pipeline 에서):
+    python -m data_pipeline.load listings.csv
+    python -m data_pipeline.load listings.csv --batch-size 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from datetime import date, datetime
+from typing import Dict, List, Optional
+
+import pandas as pd
+from sqlalchemy.engine import Connection, Engine
+
+from .db import get_engine
+from .specs import SPEC_KEY_COLUMNS, SpecResolver
+
+USED_CAR_COLUMNS = ["car_spec_id", "price", "listing_url", "is_lease", "mileage_km", "color_name", "car_age_months"]
+LEASE_COLUMNS = [
+    "used_car_id",
+    "support_amount",
+    "remaining_months",
+    "total_contract_months",
+    "monthly_rent_fee",
+    "handling_fee",
+]
+
+# 크롤링 CSV(bobaedream_all.csv) 매물 컬럼 → DB 컬럼 (제원 키 컬럼은 앞 단계에서 붙임)
+CRAWL_RENAME = {
+    "detail_url": "listing_url",
+    "price_wan": "price",
+    "rent_yn": "is_lease",
+    "color": "color_name",
+    "support_money_wan": "support_amount",
+    "monthly_rent_wan": "monthly_rent_fee",
+    "remain_months": "remaining_months",
+    "total_months": "total_contract_months",
+}
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+# =========================================================
+# 1) 입력 정리
+# =========================================================
+
+def _months_since(reg_date: str, today: date) -> Optional[int]:
+    # "yy/mm/dd"(최초등록) → 서비스 기준월까지 개월 수
+    # 두 자리 연도: 올해 끝 두 자리보다 크면 1900년대(예: 98 → 1998)
+    try:
+        yy, mm, _ = (int(x) for x in str(reg_date).split("/"))
+    except ValueError:
+        return None
+    year = (1900 if yy > today.year % 100 else 2000) + yy
+    return (today.year - year) * 12 + (today.month - mm)
+
+
+def _transmission_code(v) -> Optional[int]:
+    # 크롤링 변속기 텍스트("오토"/"수동" 등) → car_specs.transmission(0=수동, 1=자동)
+    if v is None or (isinstance(v, float) and pd.isna(v)):
+        return None
+    s = str(v).strip()
+    if s in ("0", "1", "0.0", "1.0"):
+        return int(float(s))
+    if "수동" in s:
+        return 0
+    if any(k in s for k in ("오토", "자동", "CVT", "DCT")):
+        return 1
+    return None
+
+
+def _lease_price(df: pd.DataFrame) -> pd.Series:
+    # 리스/렌트 실질가격(만원) = 인수비용 + 월 리스료 × 남은 개월 − 승계지원금 (020_create_tables.sql used_cars.price)
+    parts = {
+        c: pd.to_numeric(df[c], errors="coerce") if c in df.columns else pd.Series(float("nan"), index=df.index)
+        for c in ["acquisition_cost_wan", "monthly_rent_fee", "remaining_months", "support_amount"]
+    }
+    price = (
+        parts["acquisition_cost_wan"].fillna(0)
+        + parts["monthly_rent_fee"].fillna(0) * parts["remaining_months"].fillna(0)
+        - parts["support_amount"].fillna(0)
+    )
+    # 구성 값이 하나도 없으면 계산하지 않음
+    has_any = pd.concat(parts.values(), axis=1).notna().any(axis=1)
+    return price.where(has_any)
+
+
+def prepare_listings(df: pd.DataFrame, today: Optional[date] = None) -> pd.DataFrame:
+    """
+    적재용 DataFrame으로 정리한다.
+
+    - 크롤링 CSV 컬럼명은 DB 컬럼명으로 변환(이미 DB 컬럼명이면 그대로)
+    - car_age_months가 없으면 최초등록일(reg_date)로 계산
+    - price가 비어 있는 리스/렌트 매물은 인수비용/월 리스료/남은 개월/승계지원금으로 계산
+    - transmission 텍스트("오토"/"수동")는 1/0으로 변환
+    - 제원 키 컬럼이 없으면 ValueError (제원 매칭은 앞 단계에서 붙여야 함, 모듈 설명 참고)
+    """
+    out = df.rename(columns={k: v for k, v in CRAWL_RENAME.items() if v not in df.columns})
+
+    if "car_age_months" not in out.columns and "reg_date" in out.columns:
+        today = today or date.today()
+        out["car_age_months"] = out["reg_date"].map(lambda v: _months_since(v, today))
+
+    missing = [c for c in SPEC_KEY_COLUMNS + USED_CAR_COLUMNS[1:] if c not in out.columns]
+    if missing:
+        raise ValueError(
+            f"적재에 필요한 컬럼 누락: {', '.join(missing)} "
+            "(크롤링 CSV에는 제원 키가 없으므로 car_specs 매칭 단계에서 붙여야 함)"
+        )
+
+    out = out.copy()
+    out["price"] = pd.to_numeric(out["price"], errors="coerce").fillna(_lease_price(out)).round()
+    out["transmission"] = out["transmission"].map(_transmission_code)
+    out["is_lease"] = out["is_lease"].map(lambda v: 1 if str(v).strip().lower() in ("1", "1.0", "true") else 0)
+    out["trim_name"] = out["trim_name"].fillna("")
+    for c in ["support_amount", "remaining_months", "total_contract_months", "monthly_rent_fee", "handling_fee"]:
+        out[c] = pd.to_numeric(out[c], errors="coerce").fillna(0).astype(int) if c in out.columns else 0
+    return out
+
+
+# =========================================================
+# 2) listing_url → used_car_id 맵(적재한 URL만 조회)
+# =========================================================
+
+def load_used_car_map(
+    conn: Connection,
+    urls: List[str],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Dict[str, int]:
+    # listing_url → used_car_id (WHERE listing_url IN (...)을 batch_size개씩, 테이블 전체를 읽지 않음)
+    out: Dict[str, int] = {}
+    for i in range(0, len(urls), batch_size):
+        batch = urls[i:i + batch_size]
+        sql = (
+            "SELECT listing_url, used_car_id FROM used_cars WHERE listing_url IN ("
+            + ", ".join(["%s"] * len(batch))
+            + ")"
+        )
+        out.update({r[0]: int(r[1]) for r in conn.exec_driver_sql(sql, tuple(batch))})
+    return out
+
+
+# =========================================================
+# 3) batch upsert
+# =========================================================
+
+def upsert_rows(
+    conn: Connection,
+    table: str,
+    columns: List[str],
+    rows: List[tuple],
+    update_columns: List[str],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """
+    INSERT INTO table (...) VALUES (...), (...), ... AS new
+    ON DUPLICATE KEY UPDATE col = new.col
+    를 batch_size row씩 실행한다(row마다 왕복하지 않음).
+
+    :return: 처리한 row 수
+    """
+    if not rows:
+        return 0
+
+    placeholders = "(" + ", ".join(["%s"] * len(columns)) + ")"
+    updates = ", ".join(f"{c} = new.{c}" for c in update_columns)
+
+    for i in range(0, len(rows), batch_size):
+        batch = rows[i:i + batch_size]
+        sql = (
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES "
+            + ", ".join([placeholders] * len(batch))
+            + f" AS new ON DUPLICATE KEY UPDATE {updates}"
+        )
+        conn.exec_driver_sql(sql, tuple(v for row in batch for v in row))
+    return len(rows)
+
+
+def db_value(v):
+    # NaN → NULL, numpy 값 → 파이썬 기본형(pymysql 변환용)
+    if hasattr(v, "item"):
+        v = v.item()
+    return None if isinstance(v, float) and pd.isna(v) else v
+
+
+def load_listings(
+    engine: Engine,
+    df: pd.DataFrame,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    resolver: Optional[SpecResolver] = None,
+) -> Dict[str, float]:
+    """
+    매물 DataFrame(prepare_listings 결과)을 used_cars / leases에 적재한다.
+
+    - 제원 매칭 실패 row는 건너뛴다(기존 SQL 스크립트의 SAFE INSERT와 같은 동작).
+    - 가격/주행거리/연식이 비어 있는 row도 건너뛴다(NOT NULL 컬럼).
+    - resolver: 여러 번 적재할 때 제원 캐시를 재사용하려면 넘긴다(없으면 새로 preload).
+
+    :return: {"rows", "skipped_spec", "skipped_invalid", "used_cars", "leases", "elapsed"}
+    """
+    t0 = time.time()
+    now = datetime.now().replace(microsecond=0)
+    df = df.drop_duplicates(subset=["listing_url"], keep="first")
+
+    with engine.begin() as conn:
+        if resolver is None:
+            resolver = SpecResolver()
+            resolver.preload(conn)
+
+        used_rows: List[tuple] = []
+        lease_src: List[tuple] = []
+        skipped_spec = skipped_invalid = 0
+
+        for r in df.itertuples(index=False):
+            rec = r._asdict()
+            try:
+                spec_id = resolver.resolve(conn, [rec[c] for c in SPEC_KEY_COLUMNS])
+            except (TypeError, ValueError):
+                spec_id = None
+            if spec_id is None:
+                skipped_spec += 1
+                continue
+
+            values = [spec_id] + [db_value(rec[c]) for c in USED_CAR_COLUMNS[1:]]
+            if any(v is None for v in values):
+                skipped_invalid += 1
+                continue
+            used_rows.append((*values, now, None))
+
+            if rec["is_lease"] == 1:
+                lease_src.append((rec["listing_url"], *(int(rec[c]) for c in LEASE_COLUMNS[1:])))
+
+        # 수집 상태 컬럼(060_staging_refresh.sql): 이번에 본 매물은 판매 중으로 갱신
+        used_columns = USED_CAR_COLUMNS + ["last_seen_at", "delisted_at"]
+        n_used = upsert_rows(
+            conn, "used_cars", used_columns, used_rows,
+            update_columns=[c for c in used_columns if c != "listing_url"],
+            batch_size=batch_size,
+        )
+
+        # used_car_id는 적재 후 리스 매물 URL만 batch로 읽어 붙임
+        used_map = load_used_car_map(conn, [url for url, *_ in lease_src], batch_size) if lease_src else {}
+        lease_rows = [(used_map[url], *rest) for url, *rest in lease_src if url in used_map]
+        n_lease = upsert_rows(
+            conn, "leases", LEASE_COLUMNS, lease_rows,
+            update_columns=LEASE_COLUMNS[1:],
+            batch_size=batch_size,
+        )
+
+    return {
+        "rows": len(df),
+        "skipped_spec": skipped_spec,
+        "skipped_invalid": skipped_invalid,
+        "used_cars": n_used,
+        "leases": n_lease,
+        "elapsed": time.time() - t0,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="매물 CSV를 used_cars/leases에 batch 적재")
+    parser.add_argument("csv_path", help="적재할 매물 CSV(제원 키 컬럼 포함)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="INSERT 1회당 row 수")
+    args = parser.parse_args()
+
+    listings = prepare_listings(pd.read_csv(args.csv_path, encoding="utf-8-sig"))
+    stats = load_listings(get_engine(), listings, batch_size=args.batch_size)
+    print(
+        f"loaded used_cars={stats['used_cars']} leases={stats['leases']} "
+        f"(rows={stats['rows']}, no spec={stats['skipped_spec']}, invalid={stats['skipped_invalid']}) "
+        f"in {stats['elapsed']:.2f}s"
+    )
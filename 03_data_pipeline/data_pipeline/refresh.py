@@ -0,0 +1,256 @@
+# -*- coding: utf-8 -*-
+"""
+data_pipeline.refresh
+
+- 정기(일 단위) 수집 결과를 서비스 중단 없이 DB에 반영
+- init 스크립트(020_create_tables.sql은 DROP TABLE 후 재생성)를 다시 돌리지 않는다.
+
+동작:
+1) stage_listings: 크롤링 결과 1회분을 stg_listings에 batch 적재 (02_database/init/060_staging_refresh.sql)
+   - 판매 중인 매물 URL은 값 누락 여부와 상관없이 전부 stg_seen_urls에 적재(delisted 판정용)
+2) apply_staging: 한 트랜잭션 안에서 테이블당 set-based 문장 하나씩 실행
+   - car_specs : 없는 제원만 INSERT … SELECT (spec_key 인덱스로 존재 확인, data_pipeline.specs)
+                 → body_type / fuel_efficiency가 있는 row만 신규 제원으로 만든다(임의 기본값으로 만들지 않음)
+                 → 제원이 없고 만들 수도 없는 매물은 반영하지 않고 skipped_invalid에 합산
+   - used_cars : INSERT … SELECT … ON DUPLICATE KEY UPDATE (ux_used_cars_listing_url 기준)
+                 → last_seen_at 갱신, 다시 보인 매물은 delisted_at 해제
+   - used_cars : 이번 결과(stg_seen_urls)에 없는 매물은 delisted_at 기록 (mark_delisted=True일 때)
+   - leases    : INSERT … SELECT … ON DUPLICATE KEY UPDATE (uq_leases_used_car 기준)
+   - stg_listings / stg_seen_urls 비움
+   → commit 한 번으로 전부 반영(InnoDB MVCC라 조회 쪽은 반영 전/후 중 하나만 봄)
+
+실행(03_data_pipeline 에서):
+    python -m data_pipeline.refresh bobaedream_all.csv
+    python -m data_pipeline.refresh bobaedream_shard0.csv --no-delisted   # 일부만 수집한 경우
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from datetime import datetime
+from typing import Dict, List
+
+import pandas as pd
+from sqlalchemy.engine import Engine
+
+from .db import get_engine
+from .load import (
+    DEFAULT_BATCH_SIZE,
+    LEASE_COLUMNS,
+    SPEC_KEY_COLUMNS,
+    USED_CAR_COLUMNS,
+    db_value,
+    prepare_listings,
+    upsert_rows,
+)
+
+STAGING_COLUMNS = (
+    ["listing_url", "listing_status"]
+    + SPEC_KEY_COLUMNS
+    + ["body_type", "fuel_efficiency"]
+    + [c for c in USED_CAR_COLUMNS if c not in ("car_spec_id", "listing_url")]
+    + LEASE_COLUMNS[1:]
+)
+
+# 제원 일치 조건(car_specs cs ↔ stg_listings s): 두 테이블 모두 같은 식의 spec_key generated column
+_SPEC_MATCH = "cs.spec_key = s.spec_key"
+_SPEC_COLS = ", ".join(SPEC_KEY_COLUMNS)
+_LIVE = "COALESCE(s.listing_status, '') <> 'delisted'"
+
+
+# =========================================================
+# 1) set-based 반영 문장
+# =========================================================
+
+INSERT_SPECS = f"""
+INSERT INTO car_specs ({_SPEC_COLS}, body_type, fuel_efficiency)
+SELECT {", ".join(f"ANY_VALUE(s.{c})" for c in SPEC_KEY_COLUMNS)}, MAX(s.body_type), MAX(s.fuel_efficiency)
+FROM stg_listings s
+WHERE {_LIVE}
+  AND s.body_type IS NOT NULL
+  AND s.fuel_efficiency IS NOT NULL
+  AND NOT EXISTS (SELECT 1 FROM car_specs cs WHERE {_SPEC_MATCH})
+GROUP BY s.spec_key
+"""
+
+# INSERT_SPECS 후에도 제원이 없는 매물(body_type / fuel_efficiency 누락) 수 → used_cars에 반영 안 됨
+COUNT_NO_SPEC = f"""
+SELECT COUNT(*)
+FROM stg_listings s
+WHERE {_LIVE}
+  AND NOT EXISTS (SELECT 1 FROM car_specs cs WHERE {_SPEC_MATCH})
+"""
+
+UPSERT_USED_CARS = f"""
+INSERT INTO used_cars ({", ".join(USED_CAR_COLUMNS)}, last_seen_at, delisted_at)
+SELECT * FROM (
+    SELECT (SELECT MIN(cs.car_spec_id) FROM car_specs cs WHERE {_SPEC_MATCH}) AS car_spec_id,
+           s.price, s.listing_url, s.is_lease, s.mileage_km, s.color_name, s.car_age_months,
+           %(now)s AS last_seen_at, NULL AS delisted_at
+    FROM stg_listings s
+    WHERE {_LIVE}
+) AS dt
+WHERE dt.car_spec_id IS NOT NULL
+ON DUPLICATE KEY UPDATE
+    car_spec_id    = dt.car_spec_id,
+    price          = dt.price,
+    is_lease       = dt.is_lease,
+    mileage_km     = dt.mileage_km,
+    color_name     = dt.color_name,
+    car_age_months = dt.car_age_months,
+    last_seen_at   = dt.last_seen_at,
+    delisted_at    = NULL
+"""
+
+# stg_listings가 아니라 stg_seen_urls 기준(값이 빠져 staging에서 제외된 매물도 판매 중으로 봄)
+MARK_DELISTED = """
+UPDATE used_cars uc
+LEFT JOIN stg_seen_urls v
+       ON v.listing_url = uc.listing_url
+SET uc.delisted_at = %(now)s
+WHERE v.listing_url IS NULL
+  AND uc.delisted_at IS NULL
+"""
+
+UPSERT_LEASES = f"""
+INSERT INTO leases ({", ".join(LEASE_COLUMNS)})
+SELECT * FROM (
+    SELECT uc.used_car_id, {", ".join(f"s.{c}" for c in LEASE_COLUMNS[1:])}
+    FROM stg_listings s
+    JOIN used_cars uc ON uc.listing_url = s.listing_url
+    WHERE s.is_lease = 1 AND {_LIVE}
+) AS dt
+ON DUPLICATE KEY UPDATE
+    {", ".join(f"{c} = dt.{c}" for c in LEASE_COLUMNS[1:])}
+"""
+
+CLEAR_STAGING = "DELETE FROM stg_listings"
+CLEAR_SEEN = "DELETE FROM stg_seen_urls"
+
+
+# =========================================================
+# 2) staging 적재 / 반영
+# =========================================================
+
+# 비어 있어도 staging에 넣는 컬럼(body_type / fuel_efficiency는 신규 제원 생성에만 필요)
+_NULLABLE_COLUMNS = {"listing_status", "body_type", "fuel_efficiency"}
+
+
+def _staging_rows(df: pd.DataFrame) -> tuple[List[tuple], int]:
+    # NOT NULL 컬럼이 비어 있는 row는 제외(제외 건수 함께 반환)
+    df = df.copy()
+    for c in _NULLABLE_COLUMNS:
+        if c not in df.columns:
+            df[c] = None
+
+    rows, skipped = [], 0
+    for values in df[STAGING_COLUMNS].itertuples(index=False, name=None):
+        row = []
+        for c, v in zip(STAGING_COLUMNS, values):
+            v = db_value(v)
+            if isinstance(v, str):
+                v = v.strip()
+                if c == "body_type" and not v:
+                    v = None
+            row.append(v)
+        if any(v is None for c, v in zip(STAGING_COLUMNS, row) if c not in _NULLABLE_COLUMNS):
+            skipped += 1
+            continue
+        rows.append(tuple(row))
+    return rows, skipped
+
+
+def _seen_rows(df: pd.DataFrame) -> List[tuple]:
+    # 판매 중(listing_status != delisted)인 매물 URL 전체
+    status = df["listing_status"] if "listing_status" in df.columns else pd.Series(None, index=df.index)
+    live = df[status.fillna("").astype(str) != "delisted"]
+    return [(url.strip(),) for url in live["listing_url"].dropna().astype(str) if url.strip()]
+
+
+def stage_listings(engine: Engine, df: pd.DataFrame, batch_size: int = DEFAULT_BATCH_SIZE) -> Dict[str, int]:
+    """
+    prepare_listings 결과를 stg_listings / stg_seen_urls에 적재한다(이전 staging 내용은 비움).
+
+    - stg_listings: NOT NULL 값이 모두 있는 row만
+    - stg_seen_urls: 판매 중인 매물 URL 전부(제외된 row 포함, delisted 판정용)
+
+    :return: {"seen", "staged", "skipped_invalid"}
+    """
+    df = df.drop_duplicates(subset=["listing_url"], keep="first")
+    rows, skipped = _staging_rows(df)
+    seen = _seen_rows(df)
+    with engine.begin() as conn:
+        conn.exec_driver_sql(CLEAR_STAGING)
+        conn.exec_driver_sql(CLEAR_SEEN)
+        n_seen = upsert_rows(
+            conn, "stg_seen_urls", ["listing_url"], seen,
+            update_columns=["listing_url"],
+            batch_size=batch_size,
+        )
+        staged = upsert_rows(
+            conn, "stg_listings", STAGING_COLUMNS, rows,
+            update_columns=STAGING_COLUMNS[1:],
+            batch_size=batch_size,
+        )
+    return {"seen": n_seen, "staged": staged, "skipped_invalid": skipped}
+
+
+def apply_staging(engine: Engine, mark_delisted: bool = True) -> Dict[str, int]:
+    """
+    stg_listings를 car_specs / used_cars / leases에 한 트랜잭션으로 반영한다.
+
+    :param mark_delisted: True면 staging에 없는 used_cars를 delisted 처리
+                          (전체 수집 결과일 때만 True, 일부 샤드만 반영할 때는 False)
+    :return: 문장별 영향 row 수(used_cars_delisted = delisted 처리한 매물 수)
+             + skipped_invalid(제원이 없고 body_type / fuel_efficiency 누락으로 만들지도 못한 매물 수)
+    """
+    params = {"now": datetime.now().replace(microsecond=0)}
+    counts: Dict[str, int] = {}
+
+    with engine.begin() as conn:
+        counts["car_specs_inserted"] = conn.exec_driver_sql(INSERT_SPECS).rowcount
+        counts["skipped_invalid"] = int(conn.exec_driver_sql(COUNT_NO_SPEC).scalar() or 0)
+        counts["used_cars_upserted"] = conn.exec_driver_sql(UPSERT_USED_CARS, params).rowcount
+        if mark_delisted:
+            counts["used_cars_delisted"] = conn.exec_driver_sql(MARK_DELISTED, params).rowcount
+        counts["leases_upserted"] = conn.exec_driver_sql(UPSERT_LEASES).rowcount
+        conn.exec_driver_sql(CLEAR_STAGING)
+        conn.exec_driver_sql(CLEAR_SEEN)
+
+    return counts
+
+
+def refresh(
+    engine: Engine,
+    df: pd.DataFrame,
+    mark_delisted: bool = True,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Dict[str, float]:
+    """
+    수집 결과 1회분을 staging 적재 → set-based 반영까지 수행한다.
+
+    :return: seen(판매 중 URL) / staged
+             / skipped_invalid(값 누락 또는 제원 생성 불가로 반영 제외, delisted 처리는 안 함)
+             + apply_staging 결과(used_cars_delisted 등) + elapsed
+    """
+    t0 = time.time()
+    stats: Dict[str, float] = dict(stage_listings(engine, df, batch_size=batch_size))
+    applied = apply_staging(engine, mark_delisted=mark_delisted)
+    # staging 단계(NOT NULL 누락) + 반영 단계(제원 생성 불가) 제외 건수 합산
+    stats["skipped_invalid"] += applied.pop("skipped_invalid")
+    stats.update(applied)
+    stats["elapsed"] = time.time() - t0
+    return stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="수집 결과를 staging 테이블 경유로 used_cars/leases에 반영")
+    parser.add_argument("csv_path", help="반영할 매물 CSV(제원 키 컬럼 포함)")
+    parser.add_argument("--no-delisted", action="store_true", help="CSV에 없는 매물을 delisted 처리하지 않음")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="staging INSERT 1회당 row 수")
+    args = parser.parse_args()
+
+    listings = prepare_listings(pd.read_csv(args.csv_path, encoding="utf-8-sig"))
+    stats = refresh(get_engine(), listings, mark_delisted=not args.no_delisted, batch_size=args.batch_size)
+    print(" ".join(f"{k}={v:.2f}" if isinstance(v, float) else f"{k}={v}" for k, v in stats.items()))
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+data_pipeline.specs
+
+- 매물 → car_specs(car_spec_id) 매칭
+- 제원 9개 컬럼을 하나의 해시 키(spec_key = MD5)로 만들어 비교한다.
+  → DB는 car_specs.spec_key(STORED generated column, idx_car_specs_spec_key) 한 컬럼 인덱스 조회,
+    파이썬은 dict 조회 한 번 (02_database/init/070_car_specs_spec_key.sql)
+
+spec_key 규칙(MySQL 식과 반드시 같아야 함):
+    MD5(CONCAT_WS('|', maker_id, TRIM(model_name), TRIM(generation_name), TRIM(model_year),
+                  TRIM(trim_name), TRIM(drivetrain_type), TRIM(fuel_type), displacement_cc, transmission))
+- 문자열은 앞뒤 공백만 제거하고 대소문자는 그대로 비교한다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Dict, Iterable, Optional
+
+import pandas as pd
+from sqlalchemy.engine import Connection
+
+SPEC_KEY_COLUMNS = [
+    "maker_id",
+    "model_name",
+    "generation_name",
+    "model_year",
+    "trim_name",
+    "drivetrain_type",
+    "fuel_type",
+    "displacement_cc",
+    "transmission",
+]
+
+_INT_COLUMNS = {"maker_id", "displacement_cc", "transmission"}
+
+
+def spec_hash(values: Iterable) -> str:
+    """
+    제원 9개 값(SPEC_KEY_COLUMNS 순서) → spec_key(32자리 hex)
+
+    - 숫자 컬럼 값이 비어 있으면 ValueError/TypeError
+    """
+    parts = []
+    for c, v in zip(SPEC_KEY_COLUMNS, values):
+        if c in _INT_COLUMNS:
+            parts.append(str(int(float(v))))
+        elif v is None or (isinstance(v, float) and pd.isna(v)):
+            parts.append("")
+        else:
+            # MySQL TRIM()과 같이 공백(' ')만 제거
+            parts.append(str(v).strip(" "))
+    return hashlib.md5("|".join(parts).encode("utf-8")).hexdigest()
+
+
+class SpecResolver:
+    """
+    spec_key → car_spec_id 캐시
+
+    - preload(): car_specs 전체 spec_key를 한 번에 읽는다(이후 못 찾으면 DB에도 없는 것으로 봄).
+    - preload 없이 resolve()하면 처음 보는 키만 DB에서 한 번 조회하고 결과를 캐시한다.
+    - 같은 spec_key가 여러 개면 가장 작은 car_spec_id를 쓴다.
+    """
+
+    def __init__(self) -> None:
+        self._ids: Dict[str, Optional[int]] = {}
+        self._complete = False
+        self.stats = {"hits": 0, "misses": 0, "queries": 0}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def preload(self, conn: Connection) -> int:
+        rows = conn.exec_driver_sql(
+            "SELECT spec_key, MIN(car_spec_id) FROM car_specs GROUP BY spec_key"
+        )
+        self._ids = {r[0]: int(r[1]) for r in rows}
+        self._complete = True
+        return len(self._ids)
+
+    def resolve(self, conn: Optional[Connection], values: Iterable) -> Optional[int]:
+        """
+        제원 9개 값 → car_spec_id (없으면 None)
+        """
+        key = spec_hash(values)
+        if key in self._ids:
+            self.stats["hits"] += 1
+            return self._ids[key]
+
+        self.stats["misses"] += 1
+        if self._complete or conn is None:
+            return None
+
+        self.stats["queries"] += 1
+        row = conn.exec_driver_sql(
+            "SELECT MIN(car_spec_id) FROM car_specs WHERE spec_key = %s", (key,)
+        ).first()
+        spec_id = int(row[0]) if row and row[0] is not None else None
+        self._ids[key] = spec_id
+        return spec_id
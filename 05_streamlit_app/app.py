@@ -27,7 +27,7 @@ ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT / "03_data_pipeline"))
 sys.path.insert(0, str(ROOT / "04_algorithm"))
 
-from data_pipeline.db import get_engine, load_db  # noqa: E402
+from data_pipeline.db import ListingQuery, get_engine, load_filter_options, load_models, query_listings  # noqa: E402
 from algorithm.price_fit import analyze_price_fit  # noqa: E402
 from algorithm.recommend import RecommendParams, recommend  # noqa: E402
 
@@ -127,19 +127,52 @@ def card(k: str, v: str, s: str = ""):
     )
 
 
+@st.cache_resource
+def db_engine():
+    return get_engine()
+
+
+@st.cache_data(ttl=900)
+def load_options(used_car_table: str = "used_cars") -> dict:
+    # 필터 목록/슬라이더 범위만 조회(매물 row는 화면별 조건으로 따로 조회)
+    return load_filter_options(db_engine(), used_car_table=used_car_table)
+
+
 @st.cache_data(ttl=900)
-def load_all(used_car_table: str = "used_cars") -> pd.DataFrame:
-    engine = get_engine()
-    return load_db(engine, used_car_table=used_car_table)
+def load_brand_models(brand: str) -> list:
+    return load_models(db_engine(), brand)
+
+
+@st.cache_data(ttl=900)
+def fetch_listings(
+    brands: tuple = (),
+    model_families: tuple = (),
+    fuels: tuple = (),
+    body_types: tuple = (),
+    max_price_manwon: float | None = None,
+    min_year: int | None = None,
+    max_mileage_km: int | None = None,
+) -> pd.DataFrame:
+    # 조건을 SQL로 내려 필요한 매물만 조회(조건 조합별 캐시)
+    q = ListingQuery(
+        brands=list(brands),
+        model_families=list(model_families),
+        fuels=list(fuels),
+        body_types=list(body_types),
+        max_price_manwon=max_price_manwon,
+        min_year=min_year,
+        max_mileage_km=max_mileage_km,
+    )
+    return query_listings(db_engine(), q, price_scale=load_options()["price_scale"])
 
 
 try:
-    df_all = load_all()
+    opts = load_options()
 except Exception as e:
     st.error(str(e))
     st.stop()
 
-if df_all.empty:
+if not opts["count"]:
     st.warning("DB에서 유효한 매물이 로드되지 않았습니다. (price>0, is_lease!=1 조건 등 확인)")
     st.stop()
 
@@ -224,11 +257,9 @@ def render_price_fit():
         if st.button("⬅ 메인으로", key="back_to_main_from_price"):
             go(STEP_MAIN)
 
-        brands = sorted(df_all["brand"].dropna().unique())
-        brand = st.selectbox("브랜드", brands, key="pf_brand")
+        brand = st.selectbox("브랜드", opts["brands"], key="pf_brand")
 
-        sub = df_all[df_all["brand"] == brand]
-        models = sorted(sub["model_family"].dropna().unique())
+        models = load_brand_models(brand)
         model = st.selectbox("모델(대분류)", models, key="pf_model")
 
         st.divider()
@@ -252,7 +283,8 @@ def render_price_fit():
         return
 
     try:
-        res = analyze_price_fit(df_all=df_all, brand=brand, model_family=model, year_int=year, mileage_km=mileage, price_manwon=price)
+        df_model = fetch_listings(brands=(brand,), model_families=(model,))
+        res = analyze_price_fit(df_all=df_model, brand=brand, model_family=model, year_int=year, mileage_km=mileage, price_manwon=price)
     except Exception as e:
         st.warning(str(e))
         return
@@ -303,23 +335,20 @@ def render_recommend():
         if st.button("⬅ 메인으로", key="back_to_main_from_reco"):
             go(STEP_MAIN)
 
-        brands = sorted(df_all["brand"].dropna().unique())
-        sel_brands = st.multiselect("브랜드(복수 선택)", brands, default=[], key="reco_brands")
+        sel_brands = st.multiselect("브랜드(복수 선택)", opts["brands"], default=[], key="reco_brands")
 
-        max_price = st.slider("최대 가격(만원)", 100, int(df_all["price_manwon"].quantile(0.95)), 2000, step=50, key="reco_price")
-        min_year = st.slider("최소 연식", int(df_all["year_int"].quantile(0.05)), int(df_all["year_int"].max()), int(df_all["year_int"].quantile(0.5)), step=1, key="reco_year")
-        max_mileage = st.slider("최대 주행거리(km)", 0, int(df_all["mileage_km"].quantile(0.95)), 80000, step=5000, key="reco_mileage")
+        max_price = st.slider("최대 가격(만원)", 100, int(opts["price_p95"]), 2000, step=50, key="reco_price")
+        min_year = st.slider("최소 연식", int(opts["year_p05"]), int(opts["year_max"]), int(opts["year_p50"]), step=1, key="reco_year")
+        max_mileage = st.slider("최대 주행거리(km)", 0, int(opts["mileage_p95"]), 80000, step=5000, key="reco_mileage")
 
         st.markdown("#### 가성비 가중치")
         w_price = st.slider("가격 비중(%)", 0, 100, 50, step=5, key="reco_w_price") / 100.0
         w_cond = 1.0 - w_price
         st.caption(f"현재 설정: 가격 {int(w_price*100)}% / 상태 {int(w_cond*100)}%")
 
-        fuels = sorted(df_all.get("fuel_type", pd.Series(dtype=str)).dropna().unique())
-        sel_fuels = st.multiselect("연료(선택)", fuels, default=[], key="reco_fuels")
+        sel_fuels = st.multiselect("연료(선택)", opts["fuels"], default=[], key="reco_fuels")
 
-        body_types = sorted(df_all.get("body_type", pd.Series(dtype=str)).dropna().unique())
-        sel_bodies = st.multiselect("차종(선택)", body_types, default=[], key="reco_body")
+        sel_bodies = st.multiselect("차종(선택)", opts["body_types"], default=[], key="reco_body")
 
         top_n = st.select_slider("추천 개수", options=[10, 20, 30, 50], value=10, key="reco_topn")
         run = st.button("추천 보기", type="primary", key="reco_run")
@@ -339,7 +368,15 @@ def render_recommend():
             w_price=float(w_price),
             top_n=int(top_n),
         )
-        rr = recommend(df_all, params)
+        df_cand = fetch_listings(
+            brands=tuple(params.brands),
+            fuels=tuple(params.fuels),
+            body_types=tuple(params.body_types),
+            max_price_manwon=params.max_price_manwon,
+            min_year=params.min_year,
+            max_mileage_km=params.max_mileage_km,
+        )
+        rr = recommend(df_cand, params)
     except Exception as e:
         st.warning(str(e))
         return